@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Сквозной бенчмарк конвейера «Гелиос» на синтетических каталогах
+
+Для каждого размера каталога (synth.py) фазы запускаются отдельными
+процессами, чтобы пиковая память (ru_maxrss) относилась к одной фазе:
+
+- synth — генерация seed-файлов
+- seed — полная сборка init_db.py (с замыканиями и валидацией)
+- seed_incremental — init_db.py --incremental без изменений
+- validate — полная валидация validate.py
+- export — export_json.py во временный каталог
+
+Для каждой фазы пишется время, пиковая RSS и пропускная способность
+(строк seed-файлов в секунду). С --baseline результаты сравниваются
+с прошлым прогоном: рост времени или памяти больше --tolerance — регрессия
+(код выхода 1).
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import duckdb
+
+DB_DIR = Path(__file__).parent
+PHASES = ("synth", "seed", "seed_incremental", "validate", "export")
+
+
+def phase_commands(work: Path, units: int, args) -> dict[str, list[str]]:
+    """Команды фаз для каталога размера units в рабочем каталоге work"""
+    seed_dir, db, out = work / "seed", work / "helios.duckdb", work / "out"
+    python = sys.executable
+    return {
+        "synth": [python, str(DB_DIR / "synth.py"), str(seed_dir), "--units", str(units),
+                  "--depth", str(args.depth), "--fanout", str(args.fanout),
+                  "--seed", str(args.seed), "--format", args.format],
+        "seed": [python, str(DB_DIR / "init_db.py"), "--db", str(db), "--seed-dir", str(seed_dir)],
+        "seed_incremental": [python, str(DB_DIR / "init_db.py"), "--db", str(db),
+                             "--seed-dir", str(seed_dir), "--incremental"],
+        "validate": [python, str(DB_DIR / "validate.py"), "--db", str(db)],
+        "export": [python, str(DB_DIR / "export_json.py"), "--db", str(db), "--out", str(out)],
+    }
+
+
+def run_phase(command) -> dict:
+    """Запуск фазы: время, пиковая RSS процесса (os.wait4), код выхода и хвост вывода"""
+    with tempfile.TemporaryFile() as log:
+        started = time.perf_counter()
+        process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(process.pid, 0)
+        wall_s = time.perf_counter() - started
+        process.returncode = os.waitstatus_to_exitcode(status)
+        log.seek(0)
+        tail = log.read().decode(errors="replace").splitlines()[-10:]
+
+    # ru_maxrss: Linux — КБ, macOS — байты
+    rss_kb = usage.ru_maxrss / 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return {
+        "wall_s": round(wall_s, 3),
+        "peak_rss_mb": round(rss_kb / 1024, 1),
+        "exit_code": process.returncode,
+        "tail": tail,
+    }
+
+
+def bench(sizes, args) -> list[dict]:
+    """Прогон всех фаз для каждого размера"""
+    results = []
+    for units in sizes:
+        work = Path(tempfile.mkdtemp(prefix=f"helios-bench-{units}-", dir=args.work_dir))
+        try:
+            commands = phase_commands(work, units, args)
+            rows = None
+            for phase in args.phases:
+                result = run_phase(commands[phase])
+                if phase == "synth" and result["exit_code"] == 0:
+                    rows = sum(json.loads((work / "seed" / "synth.json").read_text())["rows"].values())
+                result.update(units=units, phase=phase, rows=rows)
+                result["rows_per_s"] = round(rows / result["wall_s"]) if rows and result["wall_s"] else None
+                results.append(result)
+                print(f"  {units:>10,} {phase:<18} {result['wall_s']:>9.2f} с "
+                      f"{result['peak_rss_mb']:>9.1f} МБ "
+                      f"{result['rows_per_s'] or 0:>12,} строк/с"
+                      f"{'' if result['exit_code'] == 0 else '  ❌ код ' + str(result['exit_code'])}")
+                if result["exit_code"] != 0:
+                    for line in result["tail"]:
+                        print(f"      {line}")
+                    break
+        finally:
+            if args.keep:
+                print(f"  Рабочий каталог: {work}")
+            else:
+                shutil.rmtree(work, ignore_errors=True)
+    return results
+
+
+def regressions(results, baseline, tolerance) -> list[str]:
+    """Сравнение с прошлым прогоном: время и память выросли больше чем на tolerance"""
+    previous = {(r["units"], r["phase"]): r for r in baseline["results"]}
+    found = []
+    for result in results:
+        old = previous.get((result["units"], result["phase"]))
+        if not old or old["exit_code"] != 0:
+            continue
+        for metric in ("wall_s", "peak_rss_mb"):
+            if old[metric] and result[metric] > old[metric] * (1 + tolerance):
+                found.append(f"  {result['units']:,} {result['phase']}: {metric} "
+                             f"{old[metric]} → {result[metric]} "
+                             f"(+{100 * (result[metric] / old[metric] - 1):.0f}%)")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк init_db / validate / export на синтетических каталогах")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="размеры каталогов, единиц (по умолчанию 10³ 10⁴ 10⁵)")
+    parser.add_argument("--phases", nargs="+", choices=PHASES, default=list(PHASES))
+    parser.add_argument("--depth", type=int, default=6, help="глубина DAG сборок")
+    parser.add_argument("--fanout", type=int, default=4, help="среднее число компонентов сборки")
+    parser.add_argument("--seed", type=int, default=0, help="зерно генератора")
+    parser.add_argument("--format", choices=("parquet", "csv"), default="parquet")
+    parser.add_argument("--work-dir", type=Path, default=None, help="где создавать рабочие каталоги")
+    parser.add_argument("--keep", action="store_true", help="не удалять рабочие каталоги")
+    parser.add_argument("--output", type=Path, help="записать результаты в JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON прошлого прогона для сравнения")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="допустимый рост времени/памяти относительно --baseline (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    if "synth" not in args.phases:
+        parser.error("фаза synth обязательна: остальные работают на сгенерированном каталоге")
+    args.phases = [phase for phase in PHASES if phase in args.phases]
+
+    print(f"Бенчмарк: {', '.join(args.phases)}")
+    print(f"  {'единиц':>10} {'фаза':<18} {'время':>11} {'пик RSS':>12} {'пропускная сп.':>19}")
+    results = bench(args.sizes, args)
+
+    report = {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "duckdb": duckdb.__version__,
+        "machine": platform.machine(),
+        "params": {"depth": args.depth, "fanout": args.fanout, "seed": args.seed, "format": args.format},
+        "results": [{k: v for k, v in r.items() if k != "tail"} for r in results],
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+        print(f"\nРезультаты: {args.output}")
+
+    failed = [r for r in results if r["exit_code"] != 0]
+    if failed:
+        names = ", ".join(f"{r['units']:,} {r['phase']}" for r in failed)
+        print(f"\n❌ Фазы с ошибкой: {names}")
+        return 1
+
+    if args.baseline:
+        found = regressions(report["results"], json.loads(args.baseline.read_text()), args.tolerance)
+        if found:
+            print(f"\n❌ Регрессии относительно {args.baseline} (> {args.tolerance:.0%}):")
+            for line in found:
+                print(line)
+            return 1
+        print(f"\n✅ Без регрессий относительно {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Многоуровневая разузловка BOM проекта «Гелиос»
+
+Единица = собственный BOM (units.mass_kg × unit_materials.fraction_pct)
++ компоненты (unit_components × quantity), рекурсивно по всем уровням.
+Свёрнутые векторы «материал → кг» считаются один раз на единицу за один
+проход по DAG сборок в топологическом порядке и мемоизируются, так что
+разузловка всего каталога стоит одного прохода, а не обхода на каждую единицу.
+
+Единицы без BOM (импортная электроника, камеры и т.п.) не раскладываются
+на материалы и входят в вектор неделимой позицией под собственным ID.
+"""
+
+import argparse
+import sys
+from collections import deque
+from pathlib import Path
+
+import duckdb
+
+DB_PATH = Path(__file__).parent / "helios.duckdb"
+
+
+class BomGraph:
+    """Граф состава: собственные материалы единиц и рёбра сборка → компонент"""
+
+    def __init__(self, own, components):
+        # own: unit_id → {material_id | unit_id: кг}, собственная масса единицы
+        # components: assembly_id → [(component_id, quantity)]
+        self.own = own
+        self.components = components
+        self._rollup = None
+        self._closure = None
+        self._where_used = None
+
+    @classmethod
+    def from_db(cls, con):
+        """Загрузка графа из БД тремя запросами"""
+        own = {unit_id: {} for (unit_id,) in con.execute("SELECT id FROM units").fetchall()}
+
+        rows = con.execute("""
+            SELECT um.unit_id, um.material_id,
+                   u.mass_kg::DOUBLE * um.fraction_pct::DOUBLE / 100
+            FROM unit_materials um
+            JOIN units u ON u.id = um.unit_id
+            WHERE u.mass_kg IS NOT NULL
+        """).fetchall()
+        for unit_id, material_id, mass_kg in rows:
+            own[unit_id][material_id] = mass_kg
+
+        # Единицы с массой, но без BOM — неделимая позиция
+        rows = con.execute("""
+            SELECT u.id, u.mass_kg::DOUBLE
+            FROM units u
+            WHERE u.mass_kg > 0
+              AND NOT EXISTS (SELECT 1 FROM unit_materials um WHERE um.unit_id = u.id)
+        """).fetchall()
+        for unit_id, mass_kg in rows:
+            own[unit_id] = {unit_id: mass_kg}
+
+        components = {}
+        rows = con.execute("""
+            SELECT assembly_id, component_id, quantity
+            FROM unit_components
+            ORDER BY assembly_id, component_id
+        """).fetchall()
+        for assembly_id, component_id, quantity in rows:
+            components.setdefault(assembly_id, []).append((component_id, quantity))
+            own.setdefault(assembly_id, {})
+            own.setdefault(component_id, {})
+
+        return cls(own, components)
+
+    def topological_order(self) -> list[str]:
+        """
+        Единицы в порядке «компоненты раньше сборок» (алгоритм Кана).
+        ValueError, если в unit_components есть цикл.
+        """
+        pending = {unit_id: len(self.components.get(unit_id, ())) for unit_id in self.own}
+        used_in = {}
+        for assembly_id, children in self.components.items():
+            for component_id, _ in children:
+                used_in.setdefault(component_id, []).append(assembly_id)
+
+        queue = deque(sorted(unit_id for unit_id, n in pending.items() if n == 0))
+        order = []
+        while queue:
+            unit_id = queue.popleft()
+            order.append(unit_id)
+            for assembly_id in used_in.get(unit_id, ()):
+                pending[assembly_id] -= 1
+                if pending[assembly_id] == 0:
+                    queue.append(assembly_id)
+
+        if len(order) < len(pending):
+            stuck = sorted(unit_id for unit_id, n in pending.items() if n > 0)
+            raise ValueError(f"Цикл в unit_components, затронуты: {', '.join(stuck[:10])}")
+        return order
+
+    def rollup(self) -> dict[str, dict[str, float]]:
+        """Полный вектор «материал → кг» на одну штуку каждой единицы (мемоизирован)"""
+        if self._rollup is None:
+            totals = {}
+            for unit_id in self.topological_order():
+                vector = dict(self.own[unit_id])
+                for component_id, quantity in self.components.get(unit_id, ()):
+                    for key, mass_kg in totals[component_id].items():
+                        vector[key] = vector.get(key, 0.0) + quantity * mass_kg
+                totals[unit_id] = vector
+            self._rollup = totals
+        return self._rollup
+
+    def closure_for(self, units, known=None) -> dict[str, dict[str, tuple[int, int]]]:
+        """
+        Замыкание состава для подмножества сборок units:
+        сборка → {компонент на любом уровне: (глубина, штук на одну сборку)}.
+        Глубина — кратчайший путь, количество — сумма произведений по всем путям.
+        known — готовые векторы сборок вне units (например, из БД).
+        """
+        known = known or {}
+        result = {}
+        for unit_id in self.topological_order():
+            if unit_id not in units:
+                continue
+            vector = {}
+            for component_id, quantity in self.components.get(unit_id, ()):
+                entries = [(component_id, 1, quantity)]
+                child = result[component_id] if component_id in result else known.get(component_id, {})
+                entries += [(d, depth + 1, quantity * n) for d, (depth, n) in child.items()]
+                for descendant_id, depth, n in entries:
+                    if descendant_id in vector:
+                        old_depth, old_n = vector[descendant_id]
+                        vector[descendant_id] = (min(old_depth, depth), old_n + n)
+                    else:
+                        vector[descendant_id] = (depth, n)
+            result[unit_id] = vector
+        return result
+
+    def closure(self) -> dict[str, dict[str, tuple[int, int]]]:
+        """Замыкание состава для всех сборок (мемоизировано), см. closure_for"""
+        if self._closure is None:
+            self._closure = self.closure_for(self.own)
+        return self._closure
+
+    def where_used(self, component_id) -> dict[str, int]:
+        """Сборки, содержащие компонент на любом уровне: сборка → штук на одну сборку"""
+        if self._where_used is None:
+            index = {}
+            for assembly_id, contained in self.closure().items():
+                for descendant_id, (_, quantity) in contained.items():
+                    index.setdefault(descendant_id, {})[assembly_id] = quantity
+            self._where_used = index
+        return dict(self._where_used.get(component_id, {}))
+
+    def explode(self, unit_id, quantity=1) -> dict[str, float]:
+        """Полная масса каждого материала в quantity штуках единицы"""
+        vector = self.rollup().get(unit_id)
+        if vector is None:
+            raise KeyError(f"Единица {unit_id} не найдена")
+        return {key: quantity * mass_kg for key, mass_kg in vector.items()}
+
+
+def where_used(con, component_id) -> list[tuple[str, int]]:
+    """Сборки, содержащие компонент на любом уровне, из unit_component_closure"""
+    return con.execute("""
+        SELECT ancestor_id, quantity
+        FROM unit_component_closure
+        WHERE descendant_id = ?
+        ORDER BY ancestor_id
+    """, [component_id]).fetchall()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Многоуровневая разузловка BOM")
+    parser.add_argument("unit_id", help="ID единицы, например ROB-021")
+    parser.add_argument("quantity", nargs="?", type=float, default=1, help="количество, шт.")
+    parser.add_argument("--where-used", action="store_true",
+                        help="показать сборки, в которые единица входит на любом уровне")
+    args = parser.parse_args(argv)
+
+    if not DB_PATH.exists():
+        print("ОШИБКА: База данных не найдена. Запустите init_db.py")
+        return 1
+
+    con = duckdb.connect(str(DB_PATH), read_only=True)
+
+    if args.where_used:
+        rows = where_used(con, args.unit_id)
+        con.close()
+        print(f"{args.unit_id} входит в {len(rows)} сборок:")
+        for assembly_id, quantity in rows:
+            print(f"  {assembly_id:<12} {quantity * args.quantity:>12g} шт.")
+        return 0
+    graph = BomGraph.from_db(con)
+    names = dict(con.execute("SELECT id, name_ru FROM materials UNION ALL SELECT id, name_ru FROM units").fetchall())
+    con.close()
+
+    try:
+        totals = graph.explode(args.unit_id, args.quantity)
+    except KeyError as e:
+        print(f"ОШИБКА: {e.args[0]}")
+        return 1
+
+    print(f"{args.unit_id} × {args.quantity:g}: {sum(totals.values()):,.3f} кг")
+    for key, mass_kg in sorted(totals.items(), key=lambda item: -item[1]):
+        print(f"  {key:<12} {names.get(key, ''):<30} {mass_kg:>16,.3f} кг")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Разреженное матричное представление BOM проекта «Гелиос»
+
+Каталог компилируется в две разреженные матрицы:
+- A (единицы × единицы): A[сборка, компонент] = штук компонента в сборке
+  (unit_components)
+- D (единицы × позиции): собственная масса позиции в единице, кг
+  (units.mass_kg × unit_materials.fraction_pct; единицы без BOM — неделимая
+  позиция под собственным ID, как в bom.BomGraph)
+
+Оператор полных потребностей по Леонтьеву решается один раз:
+R = (I − A)⁻¹ D. Граф сборок — DAG, поэтому A нильпотентна и обратная
+матрица — конечный ряд Неймана I + A + A² + … длины «глубина DAG + 1»:
+R строится глубиной-DAG разреженных умножений.
+
+После этого любой план производства x (вектор по единицам) переводится
+в потребность по позициям одним разреженным умножением Rᵀx, а пачка
+планов X (единицы × планы) — одним матричным произведением RᵀX.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import duckdb
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+DB_PATH = Path(__file__).parent / "helios.duckdb"
+# Сколько планов пачки выводить в консоль
+MAX_PRINTED = 10
+
+
+class BomMatrix:
+    """Скомпилированные матрицы A, D и оператор полных потребностей R"""
+
+    def __init__(self, units, keys, components, own):
+        self.units = list(units)
+        self.keys = list(keys)
+        self.index = {unit_id: i for i, unit_id in enumerate(self.units)}
+        self.key_index = {key: i for i, key in enumerate(self.keys)}
+        self.components = components.tocsr()  # A
+        self.own = own.tocsr()                # D
+
+        # DAG ⇔ все компоненты сильной связности одноэлементные и нет петель
+        n_strong, _ = connected_components(self.components, directed=True, connection="strong")
+        if n_strong < len(self.units) or self.components.diagonal().any():
+            raise ValueError("Цикл в unit_components: оператор (I − A)⁻¹ не определён "
+                             "(см. validate.py --cycles)")
+
+        # R = Σ Aᵏ D, k = 0..глубина DAG
+        requirements = self.own.copy()
+        term = self.own
+        while term.nnz:
+            term = self.components @ term
+            requirements = requirements + term
+        self.requirements = requirements.tocsr()  # R
+        self._requirements_t = self.requirements.T.tocsr()
+        self._units_t = None
+
+    @classmethod
+    def from_db(cls, con):
+        """Компиляция матриц из БД: три запроса, без обхода единиц в Python"""
+        units = con.execute("SELECT id FROM units ORDER BY id").fetchnumpy()["id"]
+        con.execute("""
+            CREATE OR REPLACE TEMP TABLE bom_matrix_units AS
+            SELECT id, (row_number() OVER (ORDER BY id) - 1)::BIGINT AS i FROM units
+        """)
+
+        edges = con.execute("""
+            SELECT a.i AS row, c.i AS col, uc.quantity::DOUBLE AS value
+            FROM unit_components uc
+            JOIN bom_matrix_units a ON a.id = uc.assembly_id
+            JOIN bom_matrix_units c ON c.id = uc.component_id
+        """).fetchnumpy()
+
+        # Позиции: материалы BOM и единицы с массой, но без BOM (неделимые)
+        entries = con.execute("""
+            SELECT bu.i AS row, um.material_id AS key,
+                   u.mass_kg::DOUBLE * um.fraction_pct::DOUBLE / 100 AS value
+            FROM unit_materials um
+            JOIN units u ON u.id = um.unit_id
+            JOIN bom_matrix_units bu ON bu.id = um.unit_id
+            WHERE u.mass_kg IS NOT NULL
+            UNION ALL
+            SELECT bu.i, u.id, u.mass_kg::DOUBLE
+            FROM units u
+            JOIN bom_matrix_units bu ON bu.id = u.id
+            WHERE u.mass_kg > 0
+              AND NOT EXISTS (SELECT 1 FROM unit_materials um WHERE um.unit_id = u.id)
+        """).fetchnumpy()
+        con.execute("DROP TABLE bom_matrix_units")
+
+        keys, key_cols = np.unique(entries["key"].astype(str), return_inverse=True)
+        n = len(units)
+        components = sparse.csr_matrix((edges["value"], (edges["row"], edges["col"])), shape=(n, n))
+        own = sparse.csr_matrix((entries["value"], (entries["row"], key_cols)), shape=(n, len(keys)))
+        return cls(units.astype(str), keys, components, own)
+
+    def plan_vector(self, plan) -> np.ndarray:
+        """План {unit_id: штук} → вектор по единицам"""
+        x = np.zeros(len(self.units))
+        for unit_id, quantity in plan.items():
+            if unit_id not in self.index:
+                raise KeyError(f"Единица {unit_id} не найдена")
+            x[self.index[unit_id]] += quantity
+        return x
+
+    def plan_matrix(self, unit_ids, plans, quantities, n_plans=None):
+        """Строки плана (единица, номер плана, штук) → разреженная X (единицы × планы)"""
+        rows = np.array([self.index[unit_id] if unit_id in self.index else -1 for unit_id in unit_ids])
+        if (rows < 0).any():
+            missing = sorted({unit_id for unit_id, r in zip(unit_ids, rows) if r < 0})
+            raise KeyError(f"Единицы не найдены: {', '.join(missing[:10])}")
+        plans = np.asarray(plans)
+        n_plans = n_plans if n_plans is not None else int(plans.max()) + 1 if len(plans) else 0
+        return sparse.csc_matrix((np.asarray(quantities, dtype=float), (rows, plans)),
+                                 shape=(len(self.units), n_plans))
+
+    def demand(self, x):
+        """
+        Потребность по позициям для плана x: вектор по единицам → вектор
+        по self.keys; матрица (единицы × планы) → (позиции × планы).
+        """
+        if isinstance(x, dict):
+            x = self.plan_vector(x)
+        return self._requirements_t @ x
+
+    def units_required(self, x):
+        """Полное число штук каждой единицы (с компонентами всех уровней): (I − A)⁻ᵀ x"""
+        if isinstance(x, dict):
+            x = self.plan_vector(x)
+        if self._units_t is None:
+            # Ряд Неймана для (I − A)ᵀ: та же конечная сумма по степеням Aᵀ
+            self._units_t = self.components.T.tocsr()
+        total = np.array(x, dtype=float)
+        term = total
+        while np.any(term):
+            term = self._units_t @ term
+            total = total + term
+        return total
+
+    def explode(self, plan) -> dict[str, float]:
+        """Потребность плана {unit_id: штук} как {позиция: кг} (ненулевые)"""
+        totals = self.demand(plan)
+        return {self.keys[i]: float(totals[i]) for i in np.flatnonzero(totals)}
+
+
+def read_plan(path: Path, con):
+    """CSV плана: unit_id, quantity[, plan] (пустой plan — один общий план)"""
+    quoted_path = str(path).replace("'", "''")
+    columns = [name for (name,) in con.execute(
+        f"SELECT column_name FROM (DESCRIBE SELECT * FROM read_csv('{quoted_path}', header = true))"
+    ).fetchall()]
+    plan_column = "plan::VARCHAR" if "plan" in columns else "''"
+    return con.execute(f"""
+        SELECT unit_id::VARCHAR AS unit_id, quantity::DOUBLE AS quantity, {plan_column} AS plan
+        FROM read_csv('{quoted_path}', header = true)
+    """).fetchnumpy()
+
+
+def load_plan(con, matrix, items=(), path=None):
+    """
+    План из позиций командной строки (UNIT[:N]) и CSV --plan →
+    (имена планов, разреженная X единицы × планы). KeyError — неизвестная единица.
+    """
+    unit_ids, plan_names, quantities = [], [], []
+    for item in items:
+        unit_id, _, quantity = item.partition(":")
+        unit_ids.append(unit_id)
+        plan_names.append("")
+        quantities.append(float(quantity or 1))
+    if path:
+        rows = read_plan(path, con)
+        unit_ids += rows["unit_id"].tolist()
+        plan_names += rows["plan"].tolist()
+        quantities += rows["quantity"].tolist()
+    labels, plan_index = np.unique(np.array(plan_names, dtype=str), return_inverse=True)
+    return labels, matrix.plan_matrix(unit_ids, plan_index, quantities, len(labels))
+
+
+def add_plan_arguments(parser):
+    """Аргументы плана производства: позиции UNIT[:N] и --plan CSV"""
+    parser.add_argument("items", nargs="*", metavar="UNIT[:N]", help="позиции плана, например ROB-021:100")
+    parser.add_argument("--plan", type=Path, help="CSV плана: unit_id,quantity[,plan]")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Потребность в материалах для плана производства")
+    add_plan_arguments(parser)
+    parser.add_argument("--out", type=Path, help="записать потребность (plan,key,kg) в CSV")
+    parser.add_argument("--top", type=int, default=20, help="показать N крупнейших позиций плана")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    if not args.items and not args.plan:
+        parser.error("нужны позиции плана или --plan")
+    if not args.db.exists():
+        print("ОШИБКА: База данных не найдена. Запустите init_db.py")
+        return 1
+
+    con = duckdb.connect(str(args.db), read_only=True)
+    try:
+        started = time.perf_counter()
+        matrix = BomMatrix.from_db(con)
+        compiled = time.perf_counter() - started
+        labels, x = load_plan(con, matrix, args.items, args.plan)
+        names = dict(con.execute(
+            "SELECT id, name_ru FROM materials UNION ALL SELECT id, name_ru FROM units").fetchall())
+    except (KeyError, ValueError) as e:
+        print(f"ОШИБКА: {e.args[0]}")
+        return 1
+    finally:
+        con.close()
+
+    started = time.perf_counter()
+    totals = sparse.csc_matrix(matrix.demand(x))
+    evaluated = time.perf_counter() - started
+
+    print(f"Матрицы: {len(matrix.units):,} единиц × {len(matrix.keys):,} позиций, "
+          f"nnz(R) = {matrix.requirements.nnz:,} — {compiled:.2f} с")
+    print(f"План: {x.nnz:,} позиций, {len(labels):,} планов — {evaluated * 1000:.1f} мс\n")
+
+    for p, label in enumerate(labels[:MAX_PRINTED]):
+        column = totals[:, p].toarray().ravel()
+        print(f"{'План ' + label if label else 'План'}: {column.sum():,.3f} кг")
+        for i in np.argsort(-column)[:args.top]:
+            if column[i] > 0:
+                key = matrix.keys[i]
+                print(f"  {key:<12} {names.get(key, ''):<36} {column[i]:>16,.3f} кг")
+    if len(labels) > MAX_PRINTED:
+        print(f"… ещё {len(labels) - MAX_PRINTED:,} планов (--out — все в CSV)")
+
+    if args.out:
+        result = totals.tocoo()
+        with args.out.open("w") as f:
+            f.write("plan,key,kg\n")
+            for r, c, kg in zip(result.row, result.col, result.data):
+                f.write(f"{labels[c]},{matrix.keys[r]},{kg:.6f}\n")
+        print(f"\nРезультат: {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Проверка инкрементальной сборки «Гелиос» на совпадение с полной
+
+Инкрементальные пути (init_db.py --incremental: seed_incremental,
+refresh_closures) легко сломать незаметно, поэтому здесь они сверяются
+с полной сборкой на случайных изменениях каталога. В каждом раунде копия
+seed-файлов меняется:
+
+- unit_components — изменённое количество, удалённое и добавленное ребро
+- units — перенос единицы (parent_id) под другой объект, снятие parent_id,
+  изменение power_kw, новая единица без категории (category_id = NULL)
+- unit_materials — замена материала строки BOM, перенос доли между строками
+  (сумма долей единицы сохраняется)
+
+после чего одна база обновляется через --incremental (состояние копится
+от раунда к раунду), а другая собирается с нуля, и производные таблицы
+(COMPARED) сравниваются построчно. validation_state после инкрементальной
+проверки (validate.changed_scope + сохранённые предупреждения) должна
+совпасть с состоянием полной проверки новой базы. Изменённые таблицы
+пишутся в seed-копию как Parquet (seed_file предпочитает его CSV).
+
+    ./venv/bin/python db/check_incremental.py --rounds 5
+    ./venv/bin/python db/check_incremental.py --units 10000   # синтетический каталог (synth.py)
+"""
+
+import argparse
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import duckdb
+
+from init_db import SEED_DIR, create_tables, seed_file, seed_reader
+
+DB_DIR = Path(__file__).parent
+# Таблицы, которые должны совпасть после --incremental и полной сборки
+COMPARED = (
+    "units",
+    "unit_materials",
+    "unit_components",
+    "unit_component_closure",
+    "unit_location_closure",
+    "unit_location_tree",
+    "validation_state",
+)
+# Таблицы seed, которые меняются в раундах
+MUTATED = ("units", "unit_materials", "unit_components")
+
+
+def load_seed(seed_dir: Path):
+    """Изменяемые таблицы seed в памяти с типами схемы"""
+    con = duckdb.connect()
+    create_tables(con)
+    for table in MUTATED:
+        con.execute(f"CREATE TEMP TABLE seed_{table} AS "
+                    f"SELECT * FROM {seed_reader(con, table, seed_file(seed_dir, table))}")
+    return con
+
+
+def mutate(con, rng: random.Random) -> list[str]:
+    """
+    Случайные изменения, не создающие циклов: новое ребро ведёт в лист
+    состава, единица переносится, только если на ней ничего не размещено.
+    Возвращает описание изменений.
+    """
+    done = []
+    edges = con.execute("SELECT assembly_id, component_id FROM seed_unit_components "
+                        "ORDER BY ALL").fetchall()
+    if len(edges) >= 2:
+        (a1, c1), (a2, c2) = rng.sample(edges, 2)
+        con.execute("UPDATE seed_unit_components SET quantity = quantity + 1 "
+                    "WHERE assembly_id = ? AND component_id = ?", [a1, c1])
+        con.execute("DELETE FROM seed_unit_components WHERE assembly_id = ? AND component_id = ?",
+                    [a2, c2])
+        done += [f"ребро {a1}→{c1}: quantity + 1", f"ребро {a2}→{c2} удалено"]
+
+    leaves = [unit_id for (unit_id,) in con.execute("""
+        SELECT id FROM seed_units
+        WHERE id NOT IN (SELECT assembly_id FROM seed_unit_components) ORDER BY id
+    """).fetchall()]
+    assemblies = [unit_id for (unit_id,) in con.execute(
+        "SELECT DISTINCT assembly_id FROM seed_unit_components ORDER BY 1").fetchall()]
+    existing = set(edges)
+    candidates = [(a, c) for a in rng.sample(assemblies, min(20, len(assemblies)))
+                  for c in rng.sample(leaves, min(20, len(leaves))) if a != c and (a, c) not in existing]
+    if candidates:
+        assembly_id, component_id = rng.choice(candidates)
+        con.execute("INSERT INTO seed_unit_components VALUES (?, ?, 2)", [assembly_id, component_id])
+        done.append(f"ребро {assembly_id}→{component_id} добавлено")
+
+    # Размещение: переносим единицу, на которой ничего не размещено, — цикла быть не может
+    units = [unit_id for (unit_id,) in con.execute("SELECT id FROM seed_units ORDER BY id").fetchall()]
+    free = [unit_id for (unit_id,) in con.execute("""
+        SELECT id FROM seed_units
+        WHERE id NOT IN (SELECT parent_id FROM seed_units WHERE parent_id IS NOT NULL) ORDER BY id
+    """).fetchall()]
+    moved = rng.choice(free)
+    target = rng.choice([unit_id for unit_id in units if unit_id != moved])
+    con.execute("UPDATE seed_units SET parent_id = ? WHERE id = ?", [target, moved])
+    done.append(f"{moved}.parent_id = {target}")
+    placed = [unit_id for (unit_id,) in con.execute(
+        "SELECT id FROM seed_units WHERE parent_id IS NOT NULL AND id <> ? ORDER BY id", [moved]).fetchall()]
+    if placed:
+        detached = rng.choice(placed)
+        con.execute("UPDATE seed_units SET parent_id = NULL WHERE id = ?", [detached])
+        done.append(f"{detached}.parent_id = NULL")
+    powered = rng.choice(units)
+    con.execute("UPDATE seed_units SET power_kw = COALESCE(power_kw, 0) + 7 WHERE id = ?", [powered])
+    done.append(f"{powered}.power_kw + 7")
+    # Новая единица без категории (category_id — FK-колонка, её изменение
+    # у существующей строки init_db выполняет полной пересборкой)
+    uncategorized = f"CHK-{len(units):06d}"
+    parent = rng.choice(units)
+    con.execute("""
+        INSERT INTO seed_units (id, category_id, name_ru, power_kw, mass_kg, parent_id)
+        VALUES (?, NULL, 'Проверка', 3, 10, ?)
+    """, [uncategorized, parent])
+    done.append(f"{uncategorized} (category_id = NULL) размещена на {parent}")
+
+    # BOM: только строки без диапазона оценки, сумма долей единицы не меняется
+    rows = con.execute("""
+        SELECT unit_id, material_id, fraction_pct::DOUBLE FROM seed_unit_materials
+        WHERE fraction_pct_min IS NULL AND fraction_pct_max IS NULL ORDER BY ALL
+    """).fetchall()
+    materials = [material_id for (material_id,) in con.execute(
+        "SELECT DISTINCT material_id FROM seed_unit_materials ORDER BY 1").fetchall()]
+    if rows:
+        unit_id, material_id, _ = rng.choice(rows)
+        used = {m for (m,) in con.execute(
+            "SELECT material_id FROM seed_unit_materials WHERE unit_id = ?", [unit_id]).fetchall()}
+        unused = [m for m in materials if m not in used]
+        if unused:
+            replacement = rng.choice(unused)
+            con.execute("UPDATE seed_unit_materials SET material_id = ? WHERE unit_id = ? AND material_id = ?",
+                        [replacement, unit_id, material_id])
+            done.append(f"BOM {unit_id}: {material_id} → {replacement}")
+    by_unit = {}
+    for unit_id, material_id, fraction in rows:
+        by_unit.setdefault(unit_id, []).append((material_id, fraction))
+    pairs = [unit_id for unit_id, lines in sorted(by_unit.items()) if len(lines) >= 2]
+    if pairs:
+        unit_id = rng.choice(pairs)
+        (m1, _), (m2, f2) = rng.sample(by_unit[unit_id], 2)
+        delta = round(min(1.0, f2 / 2), 3)
+        con.execute("""
+            UPDATE seed_unit_materials
+            SET fraction_pct = fraction_pct + CASE WHEN material_id = ? THEN ? ELSE -? END
+            WHERE unit_id = ? AND material_id IN (?, ?)
+        """, [m1, delta, delta, unit_id, m1, m2])
+        done.append(f"BOM {unit_id}: {delta}% {m2} → {m1}")
+    return done
+
+
+def save_seed(con, seed_dir: Path):
+    """Изменённые таблицы — в seed-копию как Parquet (CSV удаляется)"""
+    for table in MUTATED:
+        con.execute(f"COPY (SELECT * FROM seed_{table}) TO '{seed_dir / f'{table}.parquet'}' (FORMAT parquet)")
+        (seed_dir / f"{table}.csv").unlink(missing_ok=True)
+
+
+def init_db(db: Path, seed_dir: Path, incremental: bool) -> subprocess.CompletedProcess:
+    """init_db.py отдельным процессом (код 1 — не прошла валидация)"""
+    command = [sys.executable, str(DB_DIR / "init_db.py"), "--db", str(db), "--seed-dir", str(seed_dir)]
+    if incremental:
+        command.append("--incremental")
+    return subprocess.run(command, capture_output=True, text=True)
+
+
+def differences(incremental: Path, full: Path) -> dict[str, tuple[list, list]]:
+    """Таблица → (строки только в инкрементальной базе, строки только в полной), первые 5"""
+    con = duckdb.connect()
+    con.execute(f"ATTACH '{incremental}' AS inc (READ_ONLY)")
+    con.execute(f"ATTACH '{full}' AS full_db (READ_ONLY)")
+    found = {}
+    for table in COMPARED:
+        extra = con.execute(f"SELECT * FROM (SELECT * FROM inc.{table} EXCEPT ALL "
+                            f"SELECT * FROM full_db.{table}) ORDER BY ALL LIMIT 5").fetchall()
+        missing = con.execute(f"SELECT * FROM (SELECT * FROM full_db.{table} EXCEPT ALL "
+                              f"SELECT * FROM inc.{table}) ORDER BY ALL LIMIT 5").fetchall()
+        if extra or missing:
+            found[table] = (extra, missing)
+    con.close()
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Сверка init_db.py --incremental с полной сборкой")
+    parser.add_argument("--rounds", type=int, default=3, help="раундов случайных изменений")
+    parser.add_argument("--seed", type=int, default=0, help="зерно генератора изменений")
+    parser.add_argument("--units", type=int, help="синтетический каталог synth.py вместо db/seed")
+    parser.add_argument("--seed-dir", type=Path, default=SEED_DIR)
+    parser.add_argument("--keep", action="store_true", help="не удалять рабочий каталог")
+    args = parser.parse_args(argv)
+    if args.rounds < 1:
+        parser.error("--rounds должен быть ≥ 1")
+
+    work = Path(tempfile.mkdtemp(prefix="helios-incremental-"))
+    seed_dir, incremental_db, full_db = work / "seed", work / "incremental.duckdb", work / "full.duckdb"
+    rng = random.Random(args.seed)
+    failed = False
+    try:
+        if args.units:
+            subprocess.run([sys.executable, str(DB_DIR / "synth.py"), str(seed_dir),
+                            "--units", str(args.units), "--seed", str(args.seed)],
+                           check=True, capture_output=True)
+        else:
+            shutil.copytree(args.seed_dir, seed_dir)
+        init_db(incremental_db, seed_dir, incremental=False)
+
+        for round_no in range(1, args.rounds + 1):
+            con = load_seed(seed_dir)
+            changes = mutate(con, rng)
+            save_seed(con, seed_dir)
+            con.close()
+
+            incremental = init_db(incremental_db, seed_dir, incremental=True)
+            full_db.unlink(missing_ok=True)
+            full = init_db(full_db, seed_dir, incremental=False)
+
+            print(f"Раунд {round_no}: " + "; ".join(changes))
+            crashed = [name for name, run in (("--incremental", incremental), ("полная", full))
+                       if "Traceback" in run.stderr]
+            if crashed:
+                print(f"  ❌ init_db.py упал ({', '.join(crashed)}):")
+                print("    " + (incremental.stderr or full.stderr).strip().splitlines()[-1])
+                failed = True
+                break
+            if "полная пересборка" in incremental.stdout:
+                print("  ❌ --incremental перешёл на полную пересборку — инкрементальный путь не проверен")
+                failed = True
+                break
+            if incremental.returncode != full.returncode:
+                print(f"  ❌ валидация: --incremental — код {incremental.returncode}, "
+                      f"полная — код {full.returncode}")
+                failed = True
+                break
+            found = differences(incremental_db, full_db)
+            for table, (extra, missing) in found.items():
+                print(f"  ❌ {table}: расхождения с полной сборкой")
+                for row in extra:
+                    print(f"    только --incremental: {row}")
+                for row in missing:
+                    print(f"    только полная:        {row}")
+            if found:
+                failed = True
+                break
+            print(f"  ✓ {len(COMPARED)} таблиц совпадают")
+    finally:
+        if args.keep:
+            print(f"Рабочий каталог: {work}")
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+
+    print("❌ Инкрементальная сборка расходится с полной" if failed else "✅ Инкрементальная сборка совпадает с полной")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
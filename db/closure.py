@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Таблицы транзитивного замыкания иерархий «Гелиос»
+
+- unit_component_closure — физический состав (unit_components):
+  потомок, предок, глубина (кратчайший путь), множитель пути
+  (штук потомка на одну сборку-предка, сумма по всем путям)
+- unit_location_closure — размещение (units.parent_id):
+  потомок, предок, глубина
+- unit_location_tree — то же дерево размещения как обход в глубину
+  (nested set: поддерево = отрезок [lft, rgt]) с префиксными суммами
+  мощности, массы и числа роботов: итог по любому поддереву — O(1)
+
+Полная пересборка — build_closures(). После инкрементального сидинга
+refresh_closures() пересчитывает только затронутое: для состава — изменённые
+сборки и их предков, для размещения — поддеревья перемещённых единиц;
+индекс обхода при любом изменении units строится заново (O(n)).
+"""
+
+import numpy as np
+
+from bom import BomGraph
+from profiling import profiler
+
+
+def insert_columns(con, table, columns):
+    """Вставка колонок NumPy в таблицу одним INSERT ... SELECT"""
+    if not len(next(iter(columns.values()))):
+        return
+    names = ", ".join(columns)
+    con.register("closure_rows", columns)
+    try:
+        con.execute(f"INSERT INTO {table} ({names}) SELECT {names} FROM closure_rows")
+    finally:
+        con.unregister("closure_rows")
+
+
+def in_list(con, sql, ids):
+    """Запрос с параметром-списком ID (? → список VARCHAR)"""
+    return con.execute(sql, [sorted(ids)]).fetchall()
+
+
+def write_component_closure(con, vectors):
+    """Запись векторов замыкания состава: сборка → {потомок: (глубина, штук)}"""
+    descendants, ancestors, depths, quantities = [], [], [], []
+    for assembly_id, contained in vectors.items():
+        for descendant_id, (depth, quantity) in contained.items():
+            descendants.append(descendant_id)
+            ancestors.append(assembly_id)
+            depths.append(depth)
+            quantities.append(quantity)
+
+    insert_columns(con, "unit_component_closure", {
+        "descendant_id": np.array(descendants, dtype=object),
+        "ancestor_id": np.array(ancestors, dtype=object),
+        "depth": np.array(depths, dtype=np.int32),
+        "quantity": np.array(quantities, dtype=np.int64),
+    })
+    return len(quantities)
+
+
+def location_parents(con) -> dict:
+    """Размещение: unit_id → parent_id"""
+    return dict(con.execute("SELECT id, parent_id FROM units").fetchall())
+
+
+def write_location_closure(con, parents, units):
+    """
+    Запись цепочек предков для units по parents (unit_id → parent_id).
+    ValueError, если в parent_id есть цикл.
+    """
+    descendants, ancestors, depths = [], [], []
+    for unit_id in units:
+        seen = {unit_id}
+        parent_id, depth = parents.get(unit_id), 1
+        while parent_id is not None:
+            if parent_id in seen:
+                raise ValueError(f"Цикл в units.parent_id через {parent_id}")
+            seen.add(parent_id)
+            descendants.append(unit_id)
+            ancestors.append(parent_id)
+            depths.append(depth)
+            parent_id, depth = parents.get(parent_id), depth + 1
+
+    insert_columns(con, "unit_location_closure", {
+        "descendant_id": np.array(descendants, dtype=object),
+        "ancestor_id": np.array(ancestors, dtype=object),
+        "depth": np.array(depths, dtype=np.int32),
+    })
+    return len(depths)
+
+
+def write_location_tree(con) -> int:
+    """
+    Индекс обхода дерева размещения: preorder по parent_id (дети по id),
+    корни — единицы без родителя или с родителем вне units.
+    ValueError, если в parent_id есть цикл.
+    """
+    rows = con.execute("""
+        SELECT id, parent_id, COALESCE(power_kw, 0)::DOUBLE, COALESCE(mass_kg, 0)::DOUBLE,
+               COALESCE(category_id = 'robots', false)::INTEGER
+        FROM units ORDER BY id
+    """).fetchall()
+    index = {row[0]: i for i, row in enumerate(rows)}
+    children = [[] for _ in rows]
+    roots = []
+    for i, (_, parent_id, *_) in enumerate(rows):
+        if parent_id in index:
+            children[index[parent_id]].append(i)
+        else:
+            roots.append(i)
+
+    # Итеративный обход в глубину: order[позиция] = единица
+    order, depth, root = [], np.zeros(len(rows), dtype=np.int32), np.zeros(len(rows), dtype=np.int64)
+    stack = [(i, 0, i) for i in reversed(roots)]
+    while stack:
+        i, level, top = stack.pop()
+        order.append(i)
+        depth[i], root[i] = level, top
+        stack.extend((child, level + 1, top) for child in reversed(children[i]))
+    if len(order) < len(rows):
+        cycle = sorted(rows[i][0] for i in set(range(len(rows))) - set(order))
+        raise ValueError(f"Цикл в units.parent_id через {cycle[0]}")
+
+    # Размер поддерева — снизу вверх по обратному порядку обхода
+    order = np.array(order, dtype=np.int64)
+    lft = np.empty(len(rows), dtype=np.int32)
+    lft[order] = np.arange(len(order), dtype=np.int32)
+    size = np.ones(len(rows), dtype=np.int32)
+    for i in order[::-1]:
+        parent_id = rows[i][1]
+        if parent_id in index:
+            size[index[parent_id]] += size[i]
+
+    ids = np.array([row[0] for row in rows], dtype=object)
+    columns = {
+        "unit_id": ids[order],
+        "root_id": ids[root[order]],
+        "depth": depth[order],
+        "lft": lft[order],
+        "rgt": lft[order] + size[order] - 1,
+    }
+    for k, name, dtype in ((2, "power_kw", np.float64), (3, "mass_kg", np.float64), (4, "robots", np.int32)):
+        values = np.array([rows[i][k] for i in order], dtype=dtype)
+        through = np.cumsum(values, dtype=dtype)
+        columns[f"{name}_before"] = through - values
+        columns[f"{name}_through"] = through
+
+    con.execute("DELETE FROM unit_location_tree")
+    insert_columns(con, "unit_location_tree", columns)
+    return len(order)
+
+
+def subtree_totals(con, unit_ids) -> dict:
+    """
+    Итоги по поддеревьям размещения из unit_location_tree:
+    unit_id → (мощность кВт, масса кг, роботов), включая саму единицу
+    """
+    return {unit_id: (power, mass, robots) for unit_id, power, mass, robots in in_list(con, """
+        SELECT n.unit_id,
+               l.power_kw_through - n.power_kw_before,
+               l.mass_kg_through - n.mass_kg_before,
+               l.robots_through - n.robots_before
+        FROM unit_location_tree n
+        JOIN unit_location_tree l ON l.lft = n.rgt
+        WHERE n.unit_id IN (SELECT unnest(?::VARCHAR[]))
+    """, unit_ids)}
+
+
+def build_closures(con):
+    """Полная пересборка таблиц замыкания и индекса обхода. Возвращает число записей по таблицам."""
+    con.execute("DELETE FROM unit_component_closure")
+    con.execute("DELETE FROM unit_location_closure")
+
+    counts = {}
+    with profiler.phase("closure.unit_component_closure") as record:
+        graph = BomGraph.from_db(con)
+        counts["unit_component_closure"] = record["rows"] = write_component_closure(con, graph.closure())
+    with profiler.phase("closure.unit_location_closure") as record:
+        parents = location_parents(con)
+        counts["unit_location_closure"] = record["rows"] = write_location_closure(con, parents, parents)
+    with profiler.phase("closure.unit_location_tree") as record:
+        counts["unit_location_tree"] = record["rows"] = write_location_tree(con)
+    return counts
+
+
+def refresh_component_closure(con, dirty) -> int:
+    """
+    Пересчёт замыкания состава после изменения рёбер сборок dirty.
+    Новые пути к потомкам dirty проходят только через dirty и их прежних
+    предков, поэтому пересчитываются ровно эти сборки; векторы остальных
+    компонентов берутся из таблицы.
+    """
+    if not dirty:
+        return 0
+    affected = set(dirty) | {ancestor_id for (ancestor_id,) in in_list(con, """
+        SELECT DISTINCT ancestor_id FROM unit_component_closure
+        WHERE descendant_id IN (SELECT unnest(?::VARCHAR[]))
+    """, dirty)}
+
+    graph = BomGraph.from_db(con)
+    affected &= set(graph.own)
+    children = {
+        component_id
+        for unit_id in affected
+        for component_id, _ in graph.components.get(unit_id, ())
+    } - affected
+
+    known = {}
+    for ancestor_id, descendant_id, depth, quantity in in_list(con, """
+        SELECT ancestor_id, descendant_id, depth, quantity FROM unit_component_closure
+        WHERE ancestor_id IN (SELECT unnest(?::VARCHAR[]))
+    """, children):
+        known.setdefault(ancestor_id, {})[descendant_id] = (depth, quantity)
+
+    in_list(con, """
+        DELETE FROM unit_component_closure
+        WHERE ancestor_id IN (SELECT unnest(?::VARCHAR[]))
+    """, affected | set(dirty))
+    return write_component_closure(con, graph.closure_for(affected, known))
+
+
+def refresh_location_closure(con, dirty) -> int:
+    """Пересчёт цепочек предков для единиц dirty и всех их прежних потомков"""
+    if not dirty:
+        return 0
+    affected = set(dirty) | {descendant_id for (descendant_id,) in in_list(con, """
+        SELECT DISTINCT descendant_id FROM unit_location_closure
+        WHERE ancestor_id IN (SELECT unnest(?::VARCHAR[]))
+    """, dirty)}
+
+    in_list(con, """
+        DELETE FROM unit_location_closure
+        WHERE descendant_id IN (SELECT unnest(?::VARCHAR[]))
+    """, affected)
+
+    parents = location_parents(con)
+    return write_location_closure(con, parents, sorted(affected & set(parents)))
+
+
+def refresh_closures(con, changes):
+    """
+    Инкрементальное обновление по изменённым ключам сидинга
+    (changes: таблица → множество кортежей первичного ключа).
+    """
+    counts = {}
+    with profiler.phase("closure.refresh.unit_component_closure") as record:
+        counts["unit_component_closure"] = record["rows"] = refresh_component_closure(
+            con, {assembly_id for assembly_id, _ in changes.get("unit_components", ())})
+    with profiler.phase("closure.refresh.unit_location_closure") as record:
+        counts["unit_location_closure"] = record["rows"] = refresh_location_closure(
+            con, {unit_id for (unit_id,) in changes.get("units", ())})
+    if changes.get("units"):
+        # Мощность, масса и порядок обхода сдвигают префиксы всех следующих единиц
+        with profiler.phase("closure.refresh.unit_location_tree") as record:
+            counts["unit_location_tree"] = record["rows"] = write_location_tree(con)
+    return counts
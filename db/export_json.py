@@ -2,200 +2,696 @@
 """
 Экспорт базы данных номенклатуры в JSON для веб-интерфейса
 
-Поддержка i18n: экспорт для русского и английского языков
+Поддержка i18n: экспорт для русского и английского языков.
+Для аналитики (--columnar) — те же таблицы и развёрнутый BOM в Parquet и Arrow IPC
+с типами схемы (DECIMAL, INTEGER, BOOLEAN) вместо чисел JSON.
 """
 
+import argparse
+import hashlib
+import html
 import json
+import math
+import os
+import re
+import tempfile
 import duckdb
 from pathlib import Path
 
+import profiling
+from profiling import profiler
+
 DB_PATH = Path(__file__).parent / "helios.duckdb"
 EXPORT_DIR = Path(__file__).parent / "export"
-
-
-def export_planets(con, lang='ru'):
-    """Экспорт планет"""
-    name_field = 'name_ru' if lang == 'ru' else 'name_en'
-    rows = con.execute(f"""
-        SELECT id, {name_field}, gravity_m_s2, solar_constant_w_m2,
-               escape_velocity_km_s, has_atmosphere, sources
-        FROM planets
-    """).fetchall()
-
-    planets = []
-    for row in rows:
-        planets.append({
-            "id": row[0],
-            "name": row[1],
-            "gravity_m_s2": float(row[2]) if row[2] else None,
-            "solar_constant_w_m2": float(row[3]) if row[3] else None,
-            "escape_velocity_km_s": float(row[4]) if row[4] else None,
-            "has_atmosphere": row[5],
-            "sources": json.loads(row[6]) if row[6] else []
-        })
-    return planets
-
-
-def export_materials(con, lang='ru'):
-    """Экспорт материалов"""
-    name_field = 'name_ru' if lang == 'ru' else 'name_en'
-    desc_field = 'description_ru' if lang == 'ru' else 'description_en'
-    rows = con.execute(f"""
-        SELECT id, parent_id, {name_field}, symbol, {desc_field}, criticality, sources
-        FROM materials
-    """).fetchall()
-
-    materials = []
-    for row in rows:
-        materials.append({
-            "id": row[0],
-            "parent_id": row[1],
-            "name": row[2],
-            "symbol": row[3],
-            "description": row[4],
-            "criticality": row[5],
-            "sources": json.loads(row[6]) if row[6] else []
-        })
-    return materials
-
-
-def export_units(con, lang='ru'):
-    """Экспорт единиц"""
-    name_field = 'name_ru' if lang == 'ru' else 'name_en'
-    desc_field = 'description_ru' if lang == 'ru' else 'description_en'
-    rows = con.execute(f"""
-        SELECT id, category_id, {name_field}, {desc_field}, mass_kg, power_kw,
-               parent_id, is_assembly, production_planet_id, sources
-        FROM units
-    """).fetchall()
-
-    units = []
-    for row in rows:
-        units.append({
-            "id": row[0],
-            "category_id": row[1],
-            "name": row[2],
-            "description": row[3],
-            "mass_kg": float(row[4]) if row[4] else None,
-            "power_kw": float(row[5]) if row[5] else None,
-            "parent_id": row[6],
-            "is_assembly": row[7],
-            "production_planet_id": row[8],
-            "sources": json.loads(row[9]) if row[9] else []
-        })
-    return units
+BASE_PATH = Path(__file__).parent.parent
+MANIFEST_PATH = EXPORT_DIR / "manifest.json"
+# Колоночные выгрузки (в .gitignore): db/export/parquet/*.parquet, db/export/arrow/*.arrow
+COLUMNAR_DIRS = {"parquet": "parquet", "arrow": "arrow"}
+# Планета, относительно которой виджеты помечают материалы местными
+WIDGET_PLANET = "mercury"
+# Вставка статического виджета на странице: {{< include /<lang>/.../widgets/<ID>.md >}}
+WIDGET_INCLUDE = re.compile(r"\{\{<\s*include\s+\S*/widgets/([^/\s]+)\.md\s*>\}\}")
+# Единиц в корзине шардов (в среднем): число корзин — степень двойки
+SHARD_UNITS = 32
+
+
+# Языки экспорта: поля name_<lang>/description_<lang> выбираются за один проход
+LANGS = ("ru", "en")
+
+# JSON-массив источников как есть (NULL → [])
+SOURCES = "COALESCE(sources::JSON, '[]'::JSON)"
+
+
+def json_records(con, table, fields_by_lang, order_by, langs=LANGS):
+    """
+    Записи таблицы, сериализованные самим DuckDB (to_json), для всех языков
+    за один скан. Приведение типов делается один раз на колонку в SQL
+    (DECIMAL → DOUBLE, sources → JSON), а не в цикле по строкам.
+    fields_by_lang(lang) — список (ключ, SQL-выражение) в порядке ключей записи,
+    order_by — ключ сортировки (детерминированный порядок записей).
+    """
+    arrays = []
+    for lang in langs:
+        struct = ", ".join(f"'{key}': {expr}" for key, expr in fields_by_lang(lang))
+        arrays.append(f"to_json(list({{{struct}}} ORDER BY {order_by}))")
+    row = con.execute(f"SELECT {', '.join(arrays)} FROM {table}").fetchone()
+    return {lang: json.loads(value) if value else [] for lang, value in zip(langs, row)}
+
+
+def export_planets(con, langs=LANGS):
+    """Экспорт планет (все языки за один проход)"""
+    return json_records(con, "planets", lambda lang: [
+        ("id", "id"),
+        ("name", f"name_{lang}"),
+        ("gravity_m_s2", "gravity_m_s2::DOUBLE"),
+        ("solar_constant_w_m2", "solar_constant_w_m2::DOUBLE"),
+        ("escape_velocity_km_s", "escape_velocity_km_s::DOUBLE"),
+        ("has_atmosphere", "has_atmosphere"),
+        ("sources", SOURCES),
+    ], "id", langs)
+
+
+def export_materials(con, langs=LANGS):
+    """Экспорт материалов (все языки за один проход)"""
+    return json_records(con, "materials", lambda lang: [
+        ("id", "id"),
+        ("parent_id", "parent_id"),
+        ("name", f"name_{lang}"),
+        ("symbol", "symbol"),
+        ("description", f"description_{lang}"),
+        ("criticality", "criticality"),
+        ("sources", SOURCES),
+    ], "id", langs)
+
+
+def export_units(con, langs=LANGS):
+    """Экспорт единиц (все языки за один проход)"""
+    return json_records(con, "units", lambda lang: [
+        ("id", "id"),
+        ("category_id", "category_id"),
+        ("name", f"name_{lang}"),
+        ("description", f"description_{lang}"),
+        ("mass_kg", "mass_kg::DOUBLE"),
+        ("power_kw", "power_kw::DOUBLE"),
+        ("parent_id", "parent_id"),
+        ("is_assembly", "is_assembly"),
+        ("production_planet_id", "production_planet_id"),
+        ("sources", SOURCES),
+    ], "id", langs)
 
 
 def export_planet_materials(con):
     """Экспорт связей планета-материал"""
-    rows = con.execute("""
-        SELECT planet_id, material_id, concentration_pct, notes
-        FROM planet_materials
-    """).fetchall()
-
-    links = []
-    for row in rows:
-        links.append({
-            "planet_id": row[0],
-            "material_id": row[1],
-            "concentration_pct": float(row[2]) if row[2] else None,
-            "notes": row[3]
-        })
-    return links
+    return json_records(con, "planet_materials", lambda lang: [
+        ("planet_id", "planet_id"),
+        ("material_id", "material_id"),
+        ("concentration_pct", "concentration_pct::DOUBLE"),
+        ("notes", "notes"),
+    ], "planet_id, material_id", langs=("ru",))["ru"]
 
 
 def export_unit_materials(con):
     """Экспорт BOM (состав из материалов)"""
-    rows = con.execute("""
-        SELECT unit_id, material_id, fraction_pct
-        FROM unit_materials
-    """).fetchall()
-
-    bom = []
-    for row in rows:
-        bom.append({
-            "unit_id": row[0],
-            "material_id": row[1],
-            "fraction_pct": float(row[2]) if row[2] else None
-        })
-    return bom
+    return json_records(con, "unit_materials", lambda lang: [
+        ("unit_id", "unit_id"),
+        ("material_id", "material_id"),
+        ("fraction_pct", "fraction_pct::DOUBLE"),
+    ], "unit_id, material_id", langs=("ru",))["ru"]
 
 
 def export_unit_components(con):
     """Экспорт состава сборок (unit → unit)"""
+    return json_records(con, "unit_components", lambda lang: [
+        ("assembly_id", "assembly_id"),
+        ("component_id", "component_id"),
+        ("quantity", "quantity"),
+    ], "assembly_id, component_id", langs=("ru",))["ru"]
+
+
+def export_categories(con, langs=LANGS):
+    """Экспорт категорий (все языки за один проход)"""
+    return json_records(con, "categories", lambda lang: [
+        ("id", "id"),
+        ("name", f"name_{lang}"),
+    ], "id", langs)
+
+
+def export_where_used(con):
+    """
+    Экспорт индекса «где применяется» из unit_component_closure:
+    компонент → {сборка: штук на одну сборку, на любом уровне вложенности}
+    """
     rows = con.execute("""
-        SELECT assembly_id, component_id, quantity
-        FROM unit_components
+        SELECT descendant_id,
+               to_json(map(list(ancestor_id ORDER BY ancestor_id),
+                           list(quantity ORDER BY ancestor_id)))
+        FROM unit_component_closure
+        GROUP BY descendant_id
+        ORDER BY descendant_id
     """).fetchall()
+    return {component_id: json.loads(assemblies) for component_id, assemblies in rows}
+
+
+def export_location_tree(con):
+    """Экспорт индекса обхода дерева размещения (unit_location_tree) в порядке lft"""
+    return json_records(con, "unit_location_tree", lambda lang: [
+        ("unit_id", "unit_id"),
+        ("rgt", "rgt"),
+        ("depth", "depth"),
+        ("power_kw", "power_kw_through"),
+        ("mass_kg", "mass_kg_through"),
+        ("robots", "robots_through"),
+    ], "lft", langs=("ru",))["ru"]
+
+
+def export_all(con, langs=LANGS):
+    """
+    Экспорт всех данных сразу для всех языков.
+    Каждая таблица сканируется один раз; таблицы без языковых полей
+    (planet_materials, unit_materials, unit_components) общие для всех языков.
+    """
+    def timed(key, exporter, *args):
+        with profiler.phase(f"export.{key}") as record:
+            data = exporter(con, *args)
+            sample = data[langs[0]] if args else data
+            record["rows"] = len(sample)
+        return data
+
+    localized = {
+        "planets": timed("planets", export_planets, langs),
+        "materials": timed("materials", export_materials, langs),
+        "categories": timed("categories", export_categories, langs),
+        "units": timed("units", export_units, langs),
+    }
+    shared = {
+        "planet_materials": timed("planet_materials", export_planet_materials),
+        "unit_materials": timed("unit_materials", export_unit_materials),
+        "unit_components": timed("unit_components", export_unit_components),
+        "where_used": timed("where_used", export_where_used),
+        "location_tree": timed("location_tree", export_location_tree),
+    }
+    return {
+        lang: {**{key: data[lang] for key, data in localized.items()}, **shared}
+        for lang in langs
+    }
 
-    components = []
-    for row in rows:
-        components.append({
-            "assembly_id": row[0],
-            "component_id": row[1],
-            "quantity": row[2]
-        })
-    return components
 
+def write_artifact(path, content):
+    """
+    Атомарная запись артефакта с пропуском неизменённых.
+    Пишется во временный файл рядом и переименовывается (os.replace), так что
+    читатель никогда не видит частично записанный файл. Если SHA-256 содержимого
+    совпадает с уже лежащим файлом, файл не трогается (mtime не меняется).
+    Возвращает (sha256, записан ли файл).
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    digest = hashlib.sha256(data).hexdigest()
+    if path.exists() and hashlib.sha256(path.read_bytes()).hexdigest() == digest:
+        return digest, False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return digest, True
+
+
+# Таблицы веб-данных: ключ в data.json / data.js → ключ export_all
+OJS_TABLES = [
+    ("planets", "planets"),
+    ("materials", "materials"),
+    ("categories", "categories"),
+    ("units", "units"),
+    ("planetMaterials", "planet_materials"),
+    ("unitMaterials", "unit_materials"),
+    ("unitComponents", "unit_components"),
+]
+
+# Ссылочные колонки компактного формата: колонка → таблица, чей ID
+# кодируется номером строки в этой таблице
+COMPACT_REFS = {
+    "materials": {"parent_id": "materials"},
+    "units": {"category_id": "categories", "parent_id": "units", "production_planet_id": "planets"},
+    "planetMaterials": {"planet_id": "planets", "material_id": "materials"},
+    "unitMaterials": {"unit_id": "units", "material_id": "materials"},
+    "unitComponents": {"assembly_id": "units", "component_id": "units"},
+}
+
+
+def location_tree(records):
+    """Индекс обхода колонками: префиксы (сумма по позициям < i) с ведущим нулём"""
+    return {
+        "units": [record["unit_id"] for record in records],
+        "position": {record["unit_id"]: i for i, record in enumerate(records)},
+        "rgt": [record["rgt"] for record in records],
+        "depth": [record["depth"] for record in records],
+        "powerKw": [0.0] + [record["power_kw"] for record in records],
+        "massKg": [0.0] + [record["mass_kg"] for record in records],
+        "robots": [0] + [record["robots"] for record in records],
+    }
 
-def export_categories(con, lang='ru'):
-    """Экспорт категорий"""
-    name_field = 'name_ru' if lang == 'ru' else 'name_en'
-    rows = con.execute(f"""
-        SELECT id, {name_field} FROM categories
-    """).fetchall()
 
-    categories = []
-    for row in rows:
-        categories.append({
-            "id": row[0],
-            "name": row[1]
-        })
-    return categories
+def build_indexes(all_data):
+    """
+    Готовые индексы смежности для виджетов: ID → номера строк в таблицах
+    data.json (unitMaterials, unitComponents), планета → ID материалов,
+    компонент → {сборка: штук} на любом уровне (whereUsed).
+    Виджет единицы читает только свои строки вместо filter() по всей таблице.
 
+    locationTree — дерево размещения в порядке обхода: поддерево единицы
+    на позиции i = позиции i..rgt[i], итог по нему — prefix[rgt[i] + 1] − prefix[i]
+    для prefix = powerKw, massKg, robots; position — ID → i.
+    """
+    def group(records, key_field, value=lambda i, record: i):
+        index = {}
+        for i, record in enumerate(records):
+            index.setdefault(record[key_field], []).append(value(i, record))
+        return index
 
-def export_all_for_lang(con, lang='ru'):
-    """Экспорт всех данных для указанного языка"""
     return {
-        "planets": export_planets(con, lang),
-        "materials": export_materials(con, lang),
-        "categories": export_categories(con, lang),
-        "units": export_units(con, lang),
-        "planet_materials": export_planet_materials(con),
-        "unit_materials": export_unit_materials(con),
-        "unit_components": export_unit_components(con),
+        "unitMaterialsByUnit": group(all_data["unit_materials"], "unit_id"),
+        "componentsByAssembly": group(all_data["unit_components"], "assembly_id"),
+        "assembliesByComponent": group(all_data["unit_components"], "component_id"),
+        "materialsByPlanet": group(all_data["planet_materials"], "planet_id",
+                                   lambda i, record: record["material_id"]),
+        "whereUsed": all_data["where_used"],
+        "locationTree": location_tree(all_data["location_tree"]),
     }
 
 
 def generate_data_json(all_data, output_path):
     """Генерация data.json для OJS виджетов"""
-    ojs_data = {
-        "planets": all_data["planets"],
-        "materials": all_data["materials"],
-        "categories": all_data["categories"],
-        "units": all_data["units"],
-        "planetMaterials": all_data["planet_materials"],
-        "unitMaterials": all_data["unit_materials"],
-        "unitComponents": all_data["unit_components"],
+    ojs_data = {key: all_data[source] for key, source in OJS_TABLES}
+    ojs_data["indexes"] = build_indexes(all_data)
+    return write_artifact(output_path, json.dumps(ojs_data, ensure_ascii=False, indent=2))
+
+
+def generate_data_compact(all_data, output_path):
+    """
+    Генерация data.compact.json — компактный вариант data.json.
+    Каждая таблица хранится колонками (struct-of-arrays), ссылки на units,
+    materials, planets и categories — номерами строк в этих таблицах
+    (словарь ID = колонка id соответствующей таблицы). Индексы build_indexes
+    хранятся как есть. Декодер — decodeCompact в ojs-data.qmd; результат
+    декодирования совпадает с data.json.
+    """
+    tables = {}
+    for key, source in OJS_TABLES:
+        records = all_data[source]
+        columns = list(records[0]) if records else []
+        tables[key] = {column: [record[column] for record in records] for column in columns}
+
+    positions = {
+        key: {id_: i for i, id_ in enumerate(tables[key].get("id", []))}
+        for key in ("planets", "materials", "categories", "units")
+    }
+    for key, refs in COMPACT_REFS.items():
+        for column, target in refs.items():
+            if column in tables[key]:
+                index = positions[target]
+                tables[key][column] = [
+                    index.get(value, value) if value is not None else None
+                    for value in tables[key][column]
+                ]
+
+    compact = {
+        "format": "helios-compact/1",
+        "refs": COMPACT_REFS,
+        "tables": tables,
+        "indexes": build_indexes(all_data),
     }
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(ojs_data, f, ensure_ascii=False, indent=2)
+    return write_artifact(output_path, json.dumps(compact, ensure_ascii=False, separators=(",", ":")))
+
+
+def export_unit_shards(con, planet=WIDGET_PLANET, langs=LANGS):
+    """
+    Данные виджета каждой единицы (unitWidget в ojs-data.qmd) одним запросом
+    для всех языков: сама единица, её BOM, компоненты с их материалами и
+    готовые итоги по местному/импорту. Материал местный, если доступен на
+    planet; компонент — если производится на той же планете, что и сборка.
+    JSON собирает DuckDB (to_json), суммы итогов — в порядке строк, как в JS.
+    Возвращает {lang: [(unit_id, JSON шарда)]} в порядке unit_id.
+    """
+    def named(alias, lang, fallback):
+        return f"COALESCE(NULLIF({alias}.name_{lang}, ''), {fallback})"
+
+    def mass_sum(items, only_imported=False):
+        value = "COALESCE(x.mass_kg, 0)"
+        if only_imported:
+            value = f"CASE WHEN x.is_local THEN 0 ELSE {value} END"
+        return f"COALESCE(list_sum(list_transform({items}, x -> {value})), 0)"
+
+    lists = ",\n".join(f"""
+        list({{'material_id': l.material_id, 'symbol': l.symbol, 'name': {named('l', lang, 'l.material_id')},
+              'fraction_pct': l.fraction_pct,
+              'mass_kg': CASE WHEN u.mass_kg <> 0 THEN u.mass_kg::DOUBLE * l.fraction_pct / 100 END,
+              'is_local': l.is_local}} ORDER BY l.material_id) AS own_{lang},
+        list({{'symbol': l.symbol, 'name': {named('l', lang, 'l.material_id')},
+              'fraction_pct': l.fraction_pct, 'is_local': l.is_local}} ORDER BY l.material_id) AS chips_{lang}"""
+        for lang in langs)
+    parts = ",\n".join(f"""
+        list({{'id': uc.component_id, 'name': {named('c', lang, 'uc.component_id')}, 'quantity': uc.quantity,
+              'mass_kg': CASE WHEN c.mass_kg <> 0 THEN c.mass_kg::DOUBLE * uc.quantity END,
+              'is_local': c.production_planet_id IS NOT DISTINCT FROM a.production_planet_id,
+              'materials': COALESCE(o.chips_{lang}, [])}} ORDER BY uc.component_id) AS parts_{lang}"""
+        for lang in langs)
+    shards = ", ".join(f"""to_json({{
+            'unit': {{'id': u.id, 'name': u.name_{lang}, 'mass_kg': u.mass_kg::DOUBLE,
+                     'power_kw': u.power_kw::DOUBLE, 'production_planet_id': u.production_planet_id}},
+            'planet': pl.name_{lang},
+            'materials': COALESCE(o.own_{lang}, []),
+            'components': COALESCE(p.parts_{lang}, []),
+            'totals': {{'mass_kg': t.total, 'import_pct': t.import_pct, 'local_pct': 100 - t.import_pct,
+                       'has_critical_imports': t.has_critical_imports}}
+        }})"""
+        for lang in langs)
+    first = langs[0]
+    rows = con.execute(f"""
+        WITH lines AS (
+            SELECT um.unit_id, um.material_id, m.symbol, {", ".join(f"m.name_{lang}" for lang in langs)},
+                   um.fraction_pct::DOUBLE AS fraction_pct, pm.material_id IS NOT NULL AS is_local
+            FROM unit_materials um
+            LEFT JOIN materials m ON m.id = um.material_id
+            LEFT JOIN planet_materials pm ON pm.planet_id = $planet AND pm.material_id = um.material_id
+        ), own AS (
+            SELECT l.unit_id, {lists}
+            FROM lines l
+            JOIN units u ON u.id = l.unit_id
+            GROUP BY l.unit_id
+        ), parts AS (
+            SELECT uc.assembly_id AS unit_id, {parts}
+            FROM unit_components uc
+            JOIN units a ON a.id = uc.assembly_id
+            JOIN units c ON c.id = uc.component_id
+            LEFT JOIN own o ON o.unit_id = uc.component_id
+            GROUP BY uc.assembly_id
+        ), sums AS (
+            SELECT u.id,
+                   {mass_sum(f"o.own_{first}")} + {mass_sum(f"p.parts_{first}")} AS total,
+                   {mass_sum(f"o.own_{first}", True)} + {mass_sum(f"p.parts_{first}", True)} AS imported,
+                   COALESCE(list_bool_or(list_transform(p.parts_{first}, x -> NOT x.is_local)), false)
+                       AS has_critical_imports
+            FROM units u
+            LEFT JOIN own o ON o.unit_id = u.id
+            LEFT JOIN parts p ON p.unit_id = u.id
+        ), totals AS (
+            SELECT id, total, has_critical_imports,
+                   CASE WHEN total > 0 THEN imported / total * 100 ELSE 0 END AS import_pct
+            FROM sums
+        )
+        SELECT u.id, {shards}
+        FROM units u
+        JOIN totals t ON t.id = u.id
+        LEFT JOIN own o ON o.unit_id = u.id
+        LEFT JOIN parts p ON p.unit_id = u.id
+        LEFT JOIN planets pl ON pl.id = u.production_planet_id
+        ORDER BY u.id
+    """, {"planet": planet}).fetchall()
+    return {lang: [(row[0], row[i + 1]) for row in rows] for i, lang in enumerate(langs)}
+
+
+def fnv1a(text):
+    """32-битный FNV-1a от UTF-8 строки — тот же, что fnv1a в ojs-data.qmd"""
+    h = 0x811C9DC5
+    for byte in text.encode("utf-8"):
+        h = ((h ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def shard_bits(count):
+    """Бит префикса хэша: 2**bits корзин по ~SHARD_UNITS единиц"""
+    return max(0, math.ceil(math.log2(count / SHARD_UNITS))) if count else 0
+
+
+def generate_unit_shards(records, shard_dir):
+    """
+    Генерация шардов виджетов: единицы раскладываются по 2**bits корзинам
+    по старшим битам fnv1a(unit_id), корзина — <shard_dir>/<sha256[:16]>.json
+    (имя = хэш содержимого) с объектом {unit_id: шард}. index.json хранит bits
+    и имена файлов корзин (null — пустая корзина); браузер сам вычисляет
+    корзину единицы. Неизменившаяся корзина сохраняет имя и не перезаписывается;
+    файлы, на которые индекс больше не ссылается, удаляются.
+    records — [(unit_id, JSON шарда)] из export_unit_shards.
+    Возвращает (sha256 индекса, записан ли индекс).
+    """
+    bits = shard_bits(len(records))
+    buckets = [[] for _ in range(1 << bits)]
+    for unit_id, shard in records:
+        buckets[fnv1a(unit_id) >> (32 - bits) if bits else 0].append(
+            f"{json.dumps(unit_id, ensure_ascii=False)}:{shard}")
+
+    files = []
+    for entries in buckets:
+        if not entries:
+            files.append(None)
+            continue
+        data = ("{" + ",".join(entries) + "}").encode("utf-8")
+        name = f"{hashlib.sha256(data).hexdigest()[:16]}.json"
+        files.append(name)
+        if not (shard_dir / name).exists():
+            write_artifact(shard_dir / name, data)
+
+    current = set(files) | {"index.json"}
+    for path in shard_dir.glob("*.json"):
+        if path.name not in current:
+            path.unlink()
+    index = {"format": "helios-shards/2", "bits": bits, "buckets": files}
+    return write_artifact(shard_dir / "index.json", json.dumps(index, ensure_ascii=False, indent=1))
+
+
+# Подписи статического виджета единицы — те же, что у unitWidget в ojs-data.qmd
+WIDGET_LABELS = {
+    "ru": {
+        "kg": "кг", "g": "г", "kw": "кВт", "production": "Производство",
+        "components": "Компоненты", "component": "Компонент", "materials": "Материалы",
+        "material": "Материал", "mass": "Масса", "source": "Источник",
+        "local": "✓ местный", "import": "⚠ импорт", "total": "Итого",
+        "local_share": "местное", "import_share": "импорт",
+        "critical": "⚠ Содержит импортные компоненты", "details": "Подробнее →",
+    },
+    "en": {
+        "kg": "kg", "g": "g", "kw": "kW", "production": "Production",
+        "components": "Components", "component": "Component", "materials": "Materials",
+        "material": "Material", "mass": "Mass", "source": "Source",
+        "local": "✓ local", "import": "⚠ import", "total": "Total",
+        "local_share": "local", "import_share": "import",
+        "critical": "⚠ Contains imported components", "details": "Details →",
+    },
+}
+
+
+def format_number(value, lang):
+    """Число как toLocaleString() в браузере: разряды, до 3 знаков после запятой"""
+    text = f"{value:,.3f}".rstrip("0").rstrip(".")
+    if lang == "ru":
+        text = text.replace(",", "\u00a0").replace(".", ",")
+    return text
+
+
+def format_pct(value):
+    """Процент как в JS-шаблоне: 38.0 → 38, 0.5 → 0.5"""
+    return f"{value:g}"
+
+
+def render_unit_widget(shard, lang):
+    """
+    Статический HTML виджета единицы — та же разметка и те же итоги
+    (importPct, localPct, hasCriticalImports), что строит unitWidget в браузере
+    """
+    labels = WIDGET_LABELS[lang]
+    esc = html.escape
+    unit, totals = shard["unit"], shard["totals"]
+
+    def mass(value):
+        if not value:
+            return "—"
+        if value >= 1:
+            return f"{value:.0f} {labels['kg']}"
+        return f"{value * 1000:.0f} {labels['g']}"
+
+    def source(is_local, local_label):
+        return f'<td class="{"local" if is_local else "import"}">{local_label if is_local else labels["import"]}</td>'
+
+    meta = []
+    if unit["mass_kg"]:
+        meta.append(f"<strong>{format_number(unit['mass_kg'], lang)}</strong> {labels['kg']}")
+    if unit["power_kw"]:
+        meta.append(f"<strong>{format_number(unit['power_kw'], lang)}</strong> {labels['kw']}")
+    if shard["planet"]:
+        meta.append(f"{labels['production']}: {esc(shard['planet'])}")
+
+    parts = [
+        '<div class="db-widget">',
+        f'<h4>{esc(unit["name"] or unit["id"])} '
+        f'<span style="color: #6c757d; font-weight: normal;">({esc(unit["id"])})</span></h4>',
+        f'<div class="meta">{" | ".join(meta)}</div>',
+    ]
+    if shard["components"]:
+        parts += [
+            f'<div class="section-header">{labels["components"]}</div>',
+            '<table class="components-table">',
+            f'<thead><tr><th>{labels["component"]}</th><th>{labels["mass"]}</th>'
+            f'<th>{labels["source"]}</th></tr></thead>',
+            "<tbody>",
+        ]
+        for c in shard["components"]:
+            quantity = f" ×{c['quantity']}" if c["quantity"] > 1 else ""
+            chips = "".join(
+                f'<span class="{"local" if m["is_local"] else "import"}">'
+                f'{esc(m["symbol"] or m["name"])} {format_pct(m["fraction_pct"])}%</span>'
+                for m in c["materials"]
+            )
+            parts.append(
+                f'<tr class="component-row"><td><strong>{esc(c["name"])}</strong>{quantity}'
+                f'<div class="component-materials">{chips}</div></td>'
+                f'<td>{mass(c["mass_kg"])}</td>{source(c["is_local"], "✓")}</tr>'
+            )
+        parts += ["</tbody>", "</table>"]
+    if shard["materials"]:
+        parts += [
+            f'<div class="section-header">{labels["materials"]}</div>',
+            '<table class="materials-table">',
+            f'<thead><tr><th>{labels["material"]}</th><th>%</th><th>{labels["mass"]}</th>'
+            f'<th>{labels["source"]}</th></tr></thead>',
+            "<tbody>",
+        ]
+        for m in shard["materials"]:
+            symbol = f"<strong>{esc(m['symbol'])}</strong> " if m["symbol"] else ""
+            parts.append(
+                f"<tr><td>{symbol}{esc(m['name'])}</td><td>{format_pct(m['fraction_pct'])}%</td>"
+                f"<td>{mass(m['mass_kg'])}</td>{source(m['is_local'], labels['local'])}</tr>"
+            )
+        # Доля импорта меньше 1% показывается как «>99% / <1%», а не «100% / 0%»
+        tiny = 0 < totals["import_pct"] < 1
+        local_pct = ">99" if tiny else f"{totals['local_pct']:.0f}"
+        import_pct = "<1" if tiny else f"{totals['import_pct']:.0f}"
+        critical = f"<br/><strong>{labels['critical']}</strong>" if totals["has_critical_imports"] else ""
+        parts += [
+            "</tbody>",
+            "</table>",
+            f'<div class="summary">{labels["total"]}: '
+            f'<span class="local-pct">{esc(local_pct)}% {labels["local_share"]}</span> | '
+            f'<span class="import-pct">{esc(import_pct)}% {labels["import_share"]}</span>'
+            f"{critical}</div>",
+        ]
+    parts += [
+        f'<div class="link"><a href="data/nomenclature.html?unit={esc(unit["id"])}">{labels["details"]}</a></div>',
+        "</div>",
+    ]
+    return "\n".join(parts)
+
+
+def included_widgets(lang, root=BASE_PATH):
+    """ID единиц, чьи виджеты вставлены {{< include >}} в страницы <root>/<lang>/**/*.qmd"""
+    return {match for page in (root / lang).rglob("*.qmd")
+            for match in WIDGET_INCLUDE.findall(page.read_text(encoding="utf-8"))}
+
+
+def generate_unit_widgets(shards, lang, widget_dir):
+    """
+    Генерация статических виджетов: <widget_dir>/<unit_id>.md — HTML виджета
+    в raw-блоке Pandoc для {{< include >}} на страницах, и index.json
+    (unit_id → SHA-256 фрагмента). shards — только единицы, которые
+    вставлены в страницы (included_widgets) или заданы --widgets; остальные
+    фрагменты удаляются.
+    Возвращает (sha256 индекса, записан ли индекс).
+    """
+    digests = {}
+    for unit_id, shard in shards.items():
+        content = f"```{{=html}}\n{render_unit_widget(shard, lang)}\n```\n"
+        digests[unit_id], _ = write_artifact(widget_dir / f"{unit_id}.md", content)
+
+    for path in widget_dir.glob("*.md"):
+        if path.stem not in digests:
+            path.unlink()
+    index = {"format": "helios-widgets/1", "units": digests}
+    return write_artifact(widget_dir / "index.json", json.dumps(index, ensure_ascii=False, indent=1, sort_keys=True))
+
+
+# Таблицы колоночного экспорта: имя файла → запрос (порядок строк фиксирован)
+COLUMNAR_TABLES = {
+    "planets": "SELECT * FROM planets ORDER BY id",
+    "materials": "SELECT * FROM materials ORDER BY id",
+    "planet_materials": "SELECT * FROM planet_materials ORDER BY planet_id, material_id",
+    "categories": "SELECT * FROM categories ORDER BY id",
+    "units": "SELECT * FROM units ORDER BY id",
+    "unit_materials": "SELECT * FROM unit_materials ORDER BY unit_id, material_id",
+    "unit_components": "SELECT * FROM unit_components ORDER BY assembly_id, component_id",
+    # Развёрнутый BOM: кг каждой позиции на одну единицу с компонентами всех
+    # уровней (unit_component_closure); позиции — как в bom_matrix.BomMatrix:
+    # материалы и неделимые единицы без BOM под собственным ID
+    "bom_exploded": """
+        WITH own AS (
+            SELECT um.unit_id, um.material_id AS key,
+                   u.mass_kg::DOUBLE * um.fraction_pct::DOUBLE / 100 AS kg
+            FROM unit_materials um
+            JOIN units u ON u.id = um.unit_id
+            WHERE u.mass_kg IS NOT NULL
+            UNION ALL
+            SELECT u.id, u.id, u.mass_kg::DOUBLE
+            FROM units u
+            WHERE u.mass_kg > 0
+              AND NOT EXISTS (SELECT 1 FROM unit_materials um WHERE um.unit_id = u.id)
+        ), paths AS (
+            SELECT ancestor_id, descendant_id, quantity::DOUBLE AS quantity FROM unit_component_closure
+            UNION ALL
+            SELECT id, id, 1 FROM units
+        )
+        SELECT p.ancestor_id AS unit_id, o.key, SUM(p.quantity * o.kg) AS kg
+        FROM paths p
+        JOIN own o ON o.unit_id = p.descendant_id
+        GROUP BY ALL
+        ORDER BY unit_id, key
+    """,
+}
+
+
+def export_columnar(con, export_dir):
+    """
+    Выгрузка COLUMNAR_TABLES в Parquet (zstd) и Arrow IPC (файловый формат
+    без сжатия — читается через memory map без копирования).
+    Каждая таблица запрашивается один раз как Arrow-таблица с типами DuckDB;
+    файлы собираются в памяти и пишутся через write_artifact (неизменённые
+    не перезаписываются). pyarrow нужен только здесь: без него выгрузка
+    пропускается. Возвращает [(путь, строк, (sha256, записан ли файл))].
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("    pyarrow не установлен — пропущено (pip install pyarrow)")
+        return []
+
+    results = []
+    for name, query in COLUMNAR_TABLES.items():
+        with profiler.phase(f"write.columnar.{name}") as record:
+            table = con.execute(query).to_arrow_table()
+            record["rows"] = table.num_rows
+
+            parquet = pa.BufferOutputStream()
+            pq.write_table(table, parquet, compression="zstd")
+            ipc = pa.BufferOutputStream()
+            with pa.ipc.new_file(ipc, table.schema) as writer:
+                writer.write_table(table)
+
+            for kind, buffer in (("parquet", parquet), ("arrow", ipc)):
+                path = export_dir / COLUMNAR_DIRS[kind] / f"{name}.{kind}"
+                results.append((path, table.num_rows, write_artifact(path, buffer.getvalue().to_pybytes())))
+    return results
 
 
 def generate_data_js(data_dict, output_path):
     """Генерация data.js для веб-интерфейса"""
     js_content = "const DATA = {\n"
 
-    items = [
-        ("planets", data_dict["planets"]),
-        ("materials", data_dict["materials"]),
-        ("categories", data_dict["categories"]),
-        ("units", data_dict["units"]),
-        ("planetMaterials", data_dict["planet_materials"]),
-        ("unitMaterials", data_dict["unit_materials"]),
-        ("unitComponents", data_dict["unit_components"]),
-    ]
+    items = [(key, data_dict[source]) for key, source in OJS_TABLES]
 
     for i, (key, data) in enumerate(items):
         json_str = json.dumps(data, ensure_ascii=False)
@@ -204,64 +700,100 @@ def generate_data_js(data_dict, output_path):
 
     js_content += "};\n"
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(js_content)
-
-
-def main():
-    print(f"Экспорт базы данных: {DB_PATH}")
-
-    if not DB_PATH.exists():
+    return write_artifact(output_path, js_content)
+
+
+def report(manifest, path, result, base=BASE_PATH):
+    """Учёт артефакта в манифесте и строка лога"""
+    digest, written = result
+    manifest[path.relative_to(base).as_posix()] = digest
+    status = "записан" if written else "без изменений"
+    return f"{digest[:12]}, {status}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Экспорт базы данных «Гелиос» в JSON/JS")
+    parser.add_argument("--db", type=Path, default=DB_PATH,
+                        help="файл базы данных (по умолчанию db/helios.duckdb)")
+    parser.add_argument("--out", type=Path, default=BASE_PATH,
+                        help="корень для артефактов: <out>/<lang>/science/data/db и "
+                             "<out>/db/export (по умолчанию корень репозитория)")
+    parser.add_argument("--columnar", action="store_true",
+                        help="также выгрузить таблицы и развёрнутый BOM в Parquet и Arrow IPC "
+                             "(db/export/parquet, db/export/arrow; нужен pyarrow)")
+    parser.add_argument("--widgets", nargs="+", metavar="ID",
+                        help="статические виджеты только этих единиц (по умолчанию — "
+                             "вставленных {{< include >}} в страницы)")
+    profiling.add_argument(parser)
+    args = parser.parse_args(argv)
+    profiling.configure(args.profile)
+    db_path, base = args.db, args.out
+    export_dir = base / EXPORT_DIR.relative_to(BASE_PATH)
+    manifest_path = export_dir / MANIFEST_PATH.name
+
+    print(f"Экспорт базы данных: {db_path}")
+
+    if not db_path.exists():
         print("ОШИБКА: База данных не найдена. Запустите init_db.py")
         return
 
-    EXPORT_DIR.mkdir(exist_ok=True)
-
-    con = duckdb.connect(str(DB_PATH), read_only=True)
-
-    # Пути для экспорта
-    base_path = Path(__file__).parent.parent
-
-    # Экспорт для русского языка
-    print("\n  Экспорт RU:")
-    ru_data = export_all_for_lang(con, 'ru')
-    ru_json_path = base_path / "ru" / "science" / "data" / "db" / "data.json"
-    ru_js_path = base_path / "ru" / "science" / "data" / "db" / "data.js"
-    generate_data_json(ru_data, ru_json_path)
-    generate_data_js(ru_data, ru_js_path)
-    print(f"    data.json: {ru_json_path}")
-    print(f"    data.js: {ru_js_path}")
-
-    # Экспорт для английского языка
-    print("\n  Экспорт EN:")
-    en_data = export_all_for_lang(con, 'en')
-    en_json_path = base_path / "en" / "science" / "data" / "db" / "data.json"
-    en_js_path = base_path / "en" / "science" / "data" / "db" / "data.js"
-    generate_data_json(en_data, en_json_path)
-    generate_data_js(en_data, en_js_path)
-    print(f"    data.json: {en_json_path}")
-    print(f"    data.js: {en_js_path}")
+    con = duckdb.connect(str(db_path), read_only=True)
+    all_data = export_all(con)
+    with profiler.phase("export.unit_shards") as record:
+        unit_shards = export_unit_shards(con)
+        record["rows"] = len(unit_shards[LANGS[0]])
+    con.close()
+
+    # Манифест: путь артефакта → SHA-256 содержимого
+    manifest = {}
+
+    for lang in LANGS:
+        print(f"\n  Экспорт {lang.upper()}:")
+        json_path = base / lang / "science" / "data" / "db" / "data.json"
+        compact_path = json_path.with_name("data.compact.json")
+        js_path = base / lang / "science" / "data" / "db" / "data.js"
+        rows = sum(len(all_data[lang][source]) for _, source in OJS_TABLES)
+        for generate, path in ((generate_data_json, json_path),
+                               (generate_data_compact, compact_path),
+                               (generate_data_js, js_path)):
+            with profiler.phase(f"write.{lang}.{path.name}", rows):
+                result = generate(all_data[lang], path)
+            print(f"    {path.name}: {path} ({report(manifest, path, result, base)})")
+        records = unit_shards[lang]
+        wanted = set(args.widgets) if args.widgets else included_widgets(lang)
+        shards = {unit_id: json.loads(shard) for unit_id, shard in records if unit_id in wanted}
+        for unit_id in sorted(wanted - shards.keys()):
+            print(f"    ⚠ виджет {unit_id}: единицы нет в базе")
+        for directory, generate, params in (("shards", generate_unit_shards, (records,)),
+                                            ("widgets", generate_unit_widgets, (shards, lang))):
+            index_path = json_path.with_name(directory) / "index.json"
+            count = len(params[0])
+            with profiler.phase(f"write.{lang}.{directory}", count):
+                result = generate(*params, index_path.parent)
+            print(f"    {directory}/: {count} единиц ({report(manifest, index_path, result, base)})")
 
     # Также экспортируем отдельные JSON файлы в db/export/ (для совместимости)
     print("\n  Экспорт в db/export/ (RU):")
-    exports = [
-        ("planets.json", ru_data["planets"]),
-        ("materials.json", ru_data["materials"]),
-        ("categories.json", ru_data["categories"]),
-        ("units.json", ru_data["units"]),
-        ("planet_materials.json", ru_data["planet_materials"]),
-        ("unit_materials.json", ru_data["unit_materials"]),
-        ("unit_components.json", ru_data["unit_components"]),
-    ]
-    for filename, data in exports:
-        filepath = EXPORT_DIR / filename
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"    {filename}: {len(data)} записей")
-
-    con.close()
+    for _, key in OJS_TABLES:
+        data = all_data["ru"][key]
+        filename = f"{key}.json"
+        filepath = export_dir / filename
+        with profiler.phase(f"write.export.{filename}", len(data)):
+            result = write_artifact(filepath, json.dumps(data, ensure_ascii=False, indent=2))
+        print(f"    {filename}: {len(data)} записей ({report(manifest, filepath, result, base)})")
+
+    # Колоночные выгрузки (не отслеживаются git) — только по --columnar
+    if args.columnar:
+        print("\n  Экспорт в db/export/ (Parquet, Arrow IPC):")
+        con = duckdb.connect(str(db_path), read_only=True)
+        for path, rows, result in export_columnar(con, export_dir):
+            print(f"    {path.relative_to(export_dir)}: {rows} записей ({report(manifest, path, result, base)})")
+        con.close()
+
+    _, written = write_artifact(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True))
+    print(f"\n  Манифест: {manifest_path}{'' if written else ' (без изменений)'}")
     print(f"\nГотово!")
+    profiler.finish("export_json")
 
 
 if __name__ == "__main__":
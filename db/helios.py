@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Запросы к базе «Гелиос» для скриптов и ноутбуков
+
+Одно общее read-only соединение с helios.duckdb и типизированные функции
+вместо SQL из README: единица, BOM с массами, доступность материалов
+на планете, «где применяется», разузловка и итоги по размещению.
+
+Результаты запросов лежат в LRU-кэше. Перед каждым вызовом сверяется
+отпечаток файла базы (mtime, размер, inode — свои у файла и его .wal):
+после init_db.py соединение переоткрывается, а кэш сбрасывается, так что
+повторные вызовы с теми же аргументами не планируют запрос заново, но и
+не возвращают устаревшие данные. Результаты — неизменяемые кортежи.
+
+Открытое соединение держит блокировку файла: init_db.py --incremental
+из другого процесса не сможет писать в базу, пока не вызван helios.close()
+(полная пересборка создаёт файл заново и не мешает).
+
+Модуль импортируется из каталога db/ (или с db/ в sys.path) как helios,
+без пакета db: из корня репозитория — sys.path.append("db"), из ноутбука
+в другом каталоге — путь к db/. Остальные модули db/ он находит сам.
+
+    import sys; sys.path.append("db")
+    import helios
+    helios.unit("ROB-021").mass_kg          # 1000.0
+    helios.explode("FAC-001", 2)            # (('MAT-FE', ...), ...)
+    helios.use("/tmp/other.duckdb")         # другая база
+"""
+
+import argparse
+import sys
+import threading
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import duckdb
+
+# Модули db/ (bom, closure, profiling) импортируются плоско, как в скриптах:
+# каталог модуля ставится в начало sys.path явно, чтобы импорт работал из
+# ноутбука с любым рабочим каталогом и не подхватывал одноимённые пакеты
+DB_DIR = Path(__file__).resolve().parent
+if sys.path[:1] != [str(DB_DIR)]:
+    sys.path.insert(0, str(DB_DIR))
+
+from bom import where_used as closure_where_used
+from closure import subtree_totals
+
+DB_PATH = DB_DIR / "helios.duckdb"
+# Записей на каждую функцию запроса
+CACHE_SIZE = 1024
+
+
+class Unit(NamedTuple):
+    id: str
+    category_id: Optional[str]
+    name_ru: str
+    name_en: Optional[str]
+    mass_kg: Optional[float]
+    power_kw: Optional[float]
+    parent_id: Optional[str]
+    is_assembly: Optional[bool]
+    production_planet_id: Optional[str]
+
+
+class BomLine(NamedTuple):
+    """Строка собственного BOM: масса = units.mass_kg × fraction_pct / 100"""
+    material_id: str
+    symbol: Optional[str]
+    name_ru: str
+    fraction_pct: float
+    mass_kg: Optional[float]
+
+
+class Availability(NamedTuple):
+    """
+    Материал BOM на планете: status — 'regolith' (есть concentration_pct),
+    'available' (доступен не из реголита), 'missing' (нет записи planet_materials)
+    """
+    material_id: str
+    name_ru: str
+    status: str
+    concentration_pct: Optional[float]
+
+
+class LocationTotals(NamedTuple):
+    """Итог по объекту со всем, что на нём размещено (unit_location_tree)"""
+    power_kw: float
+    mass_kg: float
+    robots: int
+
+
+class _State:
+    path = DB_PATH
+    con = None
+    fingerprint = None
+    lock = threading.RLock()
+
+
+_queries = []
+
+
+def _fingerprint(path: Path):
+    """(mtime, размер, inode) файла базы и его WAL; None — файла нет"""
+    stamp = []
+    for file in (path, path.with_name(path.name + ".wal")):
+        try:
+            st = file.stat()
+        except FileNotFoundError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_mtime_ns, st.st_size, st.st_ino))
+    return tuple(stamp)
+
+
+def connection():
+    """
+    Общее read-only соединение; переоткрывается (со сбросом кэша),
+    если файл базы изменился. FileNotFoundError, если базы нет.
+    """
+    with _State.lock:
+        fingerprint = _fingerprint(_State.path)
+        if fingerprint[0] is None:
+            raise FileNotFoundError(f"База данных не найдена: {_State.path}. Запустите init_db.py")
+        if _State.con is None or fingerprint != _State.fingerprint:
+            close()
+            _State.con = duckdb.connect(str(_State.path), read_only=True)
+            _State.fingerprint = fingerprint
+        return _State.con
+
+
+def close():
+    """Закрыть соединение и сбросить кэш (например, перед init_db.py в том же процессе)"""
+    with _State.lock:
+        if _State.con is not None:
+            _State.con.close()
+        _State.con = _State.fingerprint = None
+        for query in _queries:
+            query.cache_clear()
+
+
+def use(path):
+    """Работать с другим файлом базы"""
+    with _State.lock:
+        close()
+        _State.path = Path(path)
+
+
+def cache_info() -> dict:
+    """Статистика LRU-кэша по функциям: имя → CacheInfo(hits, misses, ...)"""
+    return {query.__wrapped__.__name__: query.cache_info() for query in _queries}
+
+
+def _cached(function):
+    """LRU-кэш запроса; перед обращением к кэшу проверяется отпечаток базы"""
+    query = lru_cache(maxsize=CACHE_SIZE)(function)
+    _queries.append(query)
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with _State.lock:
+            con = connection()
+            return query(con, *args, **kwargs)
+    return wrapper
+
+
+@_cached
+def unit(con, unit_id: str) -> Unit:
+    """Единица по ID; KeyError, если её нет"""
+    row = con.execute("""
+        SELECT id, category_id, name_ru, name_en, mass_kg::DOUBLE, power_kw::DOUBLE,
+               parent_id, is_assembly, production_planet_id
+        FROM units WHERE id = ?
+    """, [unit_id]).fetchone()
+    if row is None:
+        raise KeyError(f"Единица {unit_id} не найдена")
+    return Unit(*row)
+
+
+@_cached
+def units(con, category_id: Optional[str] = None) -> tuple[Unit, ...]:
+    """Все единицы (или единицы категории) по ID"""
+    return tuple(Unit(*row) for row in con.execute("""
+        SELECT id, category_id, name_ru, name_en, mass_kg::DOUBLE, power_kw::DOUBLE,
+               parent_id, is_assembly, production_planet_id
+        FROM units
+        WHERE ? IS NULL OR category_id = ?
+        ORDER BY id
+    """, [category_id, category_id]).fetchall())
+
+
+@_cached
+def bom(con, unit_id: str) -> tuple[BomLine, ...]:
+    """Собственный BOM единицы с массами материалов (без компонентов)"""
+    return tuple(BomLine(*row) for row in con.execute("""
+        SELECT um.material_id, m.symbol, m.name_ru, um.fraction_pct::DOUBLE,
+               u.mass_kg::DOUBLE * um.fraction_pct::DOUBLE / 100
+        FROM unit_materials um
+        JOIN units u ON u.id = um.unit_id
+        JOIN materials m ON m.id = um.material_id
+        WHERE um.unit_id = ?
+        ORDER BY um.fraction_pct DESC, um.material_id
+    """, [unit_id]).fetchall())
+
+
+@_cached
+def availability(con, unit_id: str, planet_id: Optional[str] = None) -> tuple[Availability, ...]:
+    """
+    Доступность материалов собственного BOM единицы на planet_id
+    (по умолчанию — на планете производства единицы)
+    """
+    return tuple(Availability(*row) for row in con.execute("""
+        SELECT um.material_id, m.name_ru,
+               CASE WHEN plm.concentration_pct IS NOT NULL THEN 'regolith'
+                    WHEN plm.planet_id IS NOT NULL THEN 'available'
+                    ELSE 'missing' END,
+               plm.concentration_pct::DOUBLE
+        FROM units u
+        JOIN unit_materials um ON um.unit_id = u.id
+        JOIN materials m ON m.id = um.material_id
+        LEFT JOIN planet_materials plm
+            ON plm.planet_id = COALESCE(?, u.production_planet_id)
+            AND plm.material_id = um.material_id
+        WHERE u.id = ?
+        ORDER BY um.material_id
+    """, [planet_id, unit_id]).fetchall())
+
+
+@_cached
+def where_used(con, component_id: str) -> tuple[tuple[str, int], ...]:
+    """Сборки, содержащие компонент на любом уровне: (сборка, штук на одну сборку)"""
+    return tuple(closure_where_used(con, component_id))
+
+
+@_cached
+def explode(con, unit_id: str, quantity: float = 1) -> tuple[tuple[str, float], ...]:
+    """
+    Разузловка quantity штук единицы по всем уровням состава
+    (unit_component_closure): (материал или неделимая единица, кг),
+    по убыванию массы — то же, что bom.BomGraph.explode
+    """
+    unit(unit_id)
+    return tuple(con.execute("""
+        WITH paths AS (
+            SELECT descendant_id, quantity::DOUBLE AS quantity
+            FROM unit_component_closure WHERE ancestor_id = $unit
+            UNION ALL
+            SELECT $unit, 1
+        ), own AS (
+            SELECT um.unit_id, um.material_id AS key,
+                   u.mass_kg::DOUBLE * um.fraction_pct::DOUBLE / 100 AS kg
+            FROM unit_materials um
+            JOIN units u ON u.id = um.unit_id
+            WHERE u.mass_kg IS NOT NULL
+            UNION ALL
+            SELECT u.id, u.id, u.mass_kg::DOUBLE
+            FROM units u
+            WHERE u.mass_kg > 0
+              AND NOT EXISTS (SELECT 1 FROM unit_materials um WHERE um.unit_id = u.id)
+        )
+        SELECT o.key, $quantity * SUM(p.quantity * o.kg) AS kg
+        FROM paths p
+        JOIN own o ON o.unit_id = p.descendant_id
+        GROUP BY o.key
+        ORDER BY kg DESC, o.key
+    """, {"unit": unit_id, "quantity": float(quantity)}).fetchall())
+
+
+@_cached
+def location_totals(con, unit_id: str) -> LocationTotals:
+    """Мощность, масса и число роботов объекта вместе со всем, что на нём размещено"""
+    totals = subtree_totals(con, [unit_id]).get(unit_id)
+    if totals is None:
+        raise KeyError(f"Единица {unit_id} не найдена")
+    return LocationTotals(*totals)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Карточка единицы из базы «Гелиос»")
+    parser.add_argument("unit_id", help="ID единицы, например ROB-021")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    use(args.db)
+    try:
+        item = unit(args.unit_id)
+    except FileNotFoundError:
+        print("ОШИБКА: База данных не найдена. Запустите init_db.py")
+        return 1
+    except KeyError as e:
+        print(f"ОШИБКА: {e.args[0]}")
+        return 1
+
+    print(f"{item.id} — {item.name_ru}")
+    print(f"  масса: {item.mass_kg or 0:,.1f} кг, мощность: {item.power_kw or 0:,.1f} кВт, "
+          f"производство: {item.production_planet_id or '—'}")
+    for line in bom(args.unit_id):
+        print(f"  {line.material_id:<12} {line.fraction_pct:>6.2f}%  {line.mass_kg or 0:>14,.3f} кг")
+
+    totals = location_totals(args.unit_id)
+    print(f"\nС размещёнными единицами: {totals.power_kw:,.1f} кВт, {totals.mass_kg:,.1f} кг, "
+          f"роботов: {totals.robots}")
+    assemblies = where_used(args.unit_id)
+    if assemblies:
+        print("Где применяется: " + ", ".join(f"{a}: {q}" for a, q in assemblies))
+    print("\nРазузловка на 1 шт.:")
+    for key, kg in explode(args.unit_id)[:10]:
+        print(f"  {key:<12} {kg:>16,.3f} кг")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
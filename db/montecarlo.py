@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Монте-Карло по неопределённости масс и BOM проекта «Гелиос»
+
+units.mass_kg и unit_materials.fraction_pct — точечные оценки; необязательные
+диапазоны *_min/*_max (или общий разброс --mass-spread/--fraction-spread для
+параметров без диапазона) задают треугольное распределение с модой в точечной
+оценке. Доли BOM каждой единицы после выборки нормируются к исходной сумме.
+
+Свёрнутые показатели линейны по собственным массам позиций BOM (единица ×
+материал), поэтому каталог компилируется один раз в разреженный оператор
+«позиции → показатели» через замыкание состава (bom.BomGraph.closure), а каждая
+пачка выборок — одно матричное умножение. Меняются только позиции единиц
+с неопределёнными параметрами, остальное — постоянная часть.
+
+Показатели на единицу: импортная масса (кг), доля местного производства,
+потребность в каждом материале (кг). Выборки распределяются по пулу процессов;
+каждый процесс копит гистограммы между аналитическими границами показателя,
+так что миллионы выборок не требуют их хранения, а перцентили точны
+до (max − min) / BINS.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import duckdb
+import numpy as np
+from scipy import sparse
+
+from bom import BomGraph
+
+DB_PATH = Path(__file__).parent / "helios.duckdb"
+PERCENTILES = (5, 50, 95)
+BINS = 1024
+# Выборок на одно матричное умножение (ограничивает память процесса)
+CHUNK = 4096
+# Предел ячеек гистограмм на процесс (показатели с разбросом × BINS)
+MAX_CELLS = 2**26
+
+
+class Model:
+    """
+    Скомпилированный каталог: позиции BOM (единица × материал или неделимая
+    импортная единица), их параметры и оператор «позиции → показатели»
+    для единиц targets
+    """
+
+    def __init__(self, units, keys, entry_unit, entry_key, imported,
+                 mass, mass_lo, mass_hi, frac, frac_lo, frac_hi, targets, closure):
+        self.units, self.keys, self.targets = units, keys, targets
+        n_units, n_entries, n_targets = len(units), len(entry_unit), len(targets)
+
+        # P: единица × позиция; исходные суммы долей единиц
+        p = sparse.csr_matrix((np.ones(n_entries), (entry_unit, np.arange(n_entries))),
+                              shape=(n_units, n_entries))
+        point_sum = p @ frac
+
+        # Оператор: строки — импорт и местная масса по targets, затем потребность
+        # (target, ключ); колонки — позиции. T — замыкание с единичной диагональю.
+        index = {unit_id: i for i, unit_id in enumerate(units)}
+        rows, cols, vals = [], [], []
+        for t, unit_id in enumerate(targets):
+            rows.append(t)
+            cols.append(index[unit_id])
+            vals.append(1.0)
+            for descendant_id, (_, quantity) in closure.get(unit_id, {}).items():
+                rows.append(t)
+                cols.append(index[descendant_id])
+                vals.append(float(quantity))
+        total = (sparse.csr_matrix((vals, (rows, cols)), shape=(n_targets, n_units)) @ p).tocoo()
+
+        imported_part = imported[total.col]
+        demand_rows = {}
+        demand_index = np.array([demand_rows.setdefault((t, k), len(demand_rows))
+                                 for t, k in zip(total.row, entry_key[total.col])], dtype=np.int64)
+        self.demand = [(targets[t], keys[k]) for t, k in demand_rows]
+        operator = sparse.csr_matrix((
+            np.concatenate([total.data[imported_part], total.data[~imported_part], total.data]),
+            (np.concatenate([total.row[imported_part], n_targets + total.row[~imported_part],
+                             2 * n_targets + demand_index]),
+             np.concatenate([total.col[imported_part], total.col[~imported_part], total.col])),
+        ), shape=(2 * n_targets + len(demand_rows), n_entries))
+
+        # Меняются только позиции единиц с неопределённой массой или долями,
+        # входящих в состав targets: выборка строится по ним, остальные входят
+        # в постоянную часть (все позиции единицы входят в состав вместе)
+        uncertain_frac = frac_lo < frac_hi
+        varying_units = np.zeros(n_units, dtype=bool)
+        varying_units[mass_lo < mass_hi] = True
+        varying_units[entry_unit[uncertain_frac]] = True
+        relevant = np.zeros(n_units, dtype=bool)
+        relevant[entry_unit[operator.getnnz(axis=0) > 0]] = True
+        varying_units &= relevant
+        self.varying = np.flatnonzero(varying_units[entry_unit])
+        units_used = np.flatnonzero(varying_units)
+        local_unit = np.full(n_units, -1)
+        local_unit[units_used] = np.arange(len(units_used))
+
+        self.mass, self.mass_lo, self.mass_hi = mass[units_used], mass_lo[units_used], mass_hi[units_used]
+        self.uncertain_mass = np.flatnonzero(self.mass_lo < self.mass_hi)
+        self.entry_unit = local_unit[entry_unit[self.varying]]
+        self.frac, self.frac_lo, self.frac_hi = (v[self.varying] for v in (frac, frac_lo, frac_hi))
+        self.uncertain_frac = np.flatnonzero(self.frac_lo < self.frac_hi)
+        self.share = point_sum[entry_unit[self.varying]] / 100
+        self.p = sparse.csr_matrix(
+            (np.ones(len(self.varying)), (self.entry_unit, np.arange(len(self.varying)))),
+            shape=(len(units_used), len(self.varying)))
+
+        own_point = mass[entry_unit] * frac * (point_sum[entry_unit] / 100) / np.maximum(
+            point_sum[entry_unit], 1e-300)
+        self.operator = operator[:, self.varying].tocsr()
+        self.fixed = operator @ own_point - self.operator @ own_point[self.varying]
+        self.point = self.quantities(operator @ own_point)
+        self.bounds = self.output_bounds()
+        # Гистограммы копятся только по показателям с разбросом
+        self.live = np.flatnonzero(self.bounds[1] > self.bounds[0])
+
+    def quantities(self, raw):
+        """Сырые строки оператора → показатели [импорт, доля местного, потребность]"""
+        n = len(self.targets)
+        imported, local = raw[..., :n], raw[..., n:2 * n]
+        share = local / np.maximum(imported + local, 1e-300)
+        return np.concatenate([imported, share, raw[..., 2 * n:]], axis=-1)
+
+    def own(self, mass, frac):
+        """Собственные массы изменяемых позиций (выборки × позиции)"""
+        sums = (self.p @ frac.T).T
+        unit = self.entry_unit
+        return mass[:, unit] * frac * self.share / np.maximum(sums[:, unit], 1e-300)
+
+    def output_bounds(self):
+        """
+        Границы показателей: оператор неотрицателен, поэтому импорт и местная
+        масса лежат между значениями на покомпонентных минимумах и максимумах
+        собственных масс; доля местного — между их отношениями.
+        """
+        sum_lo, sum_hi = self.p @ self.frac_lo, self.p @ self.frac_hi
+        unit = self.entry_unit
+        own_lo = self.mass_lo[unit] * self.share * self.frac_lo / np.maximum(
+            self.frac_lo + sum_hi[unit] - self.frac_hi, 1e-300)
+        own_hi = self.mass_hi[unit] * self.share * self.frac_hi / np.maximum(
+            self.frac_hi + sum_lo[unit] - self.frac_lo, 1e-300)
+        lo = self.fixed + self.operator @ own_lo
+        hi = self.fixed + self.operator @ own_hi
+
+        n = len(self.targets)
+        local_lo = lo[n:2 * n] / np.maximum(lo[n:2 * n] + hi[:n], 1e-300)
+        local_hi = hi[n:2 * n] / np.maximum(hi[n:2 * n] + lo[:n], 1e-300)
+        return (np.concatenate([lo[:n], local_lo, lo[2 * n:]]),
+                np.concatenate([hi[:n], local_hi, hi[2 * n:]]))
+
+    def sample(self, rng, n):
+        """Показатели с разбросом (self.live) для n выборок: (n × показатели)"""
+        mass = np.broadcast_to(self.mass, (n, len(self.mass))).copy()
+        for i in self.uncertain_mass:
+            mass[:, i] = rng.triangular(self.mass_lo[i], self.mass[i], self.mass_hi[i], n)
+        frac = np.broadcast_to(self.frac, (n, len(self.frac))).copy()
+        u = self.uncertain_frac
+        frac[:, u] = rng.triangular(self.frac_lo[u], self.frac[u], self.frac_hi[u], (n, len(u)))
+        raw = self.fixed + (self.operator @ self.own(mass, frac).T).T
+        return self.quantities(raw)[:, self.live]
+
+    @classmethod
+    def from_db(cls, con, targets=None, mass_spread=0.0, fraction_spread=0.0):
+        """Компиляция каталога; targets — единицы для отчёта (по умолчанию все)"""
+        graph = BomGraph.from_db(con)
+        rows = con.execute("""
+            SELECT id, COALESCE(mass_kg, 0)::DOUBLE, mass_kg_min::DOUBLE, mass_kg_max::DOUBLE
+            FROM units ORDER BY id
+        """).fetchall()
+        units = [unit_id for unit_id, *_ in rows]
+        index = {unit_id: i for i, unit_id in enumerate(units)}
+        mass = np.array([m for _, m, _, _ in rows])
+        mass_lo = np.array([m * (1 - mass_spread) if lo is None else lo for _, m, lo, _ in rows])
+        mass_hi = np.array([m * (1 + mass_spread) if hi is None else hi for _, m, _, hi in rows])
+
+        # Позиции: BOM (местная, если материал есть на планете производства
+        # не-Земли) и неделимые единицы без BOM (местная, если не с Земли)
+        entries = con.execute("""
+            SELECT um.unit_id, um.material_id, um.fraction_pct::DOUBLE,
+                   um.fraction_pct_min::DOUBLE, um.fraction_pct_max::DOUBLE,
+                   u.production_planet_id = 'earth' OR pm.material_id IS NULL AS imported
+            FROM unit_materials um
+            JOIN units u ON u.id = um.unit_id
+            LEFT JOIN planet_materials pm
+                   ON pm.planet_id = u.production_planet_id AND pm.material_id = um.material_id
+            WHERE u.mass_kg IS NOT NULL
+            UNION ALL
+            SELECT u.id, u.id, 100, NULL, NULL, u.production_planet_id = 'earth'
+            FROM units u
+            WHERE u.mass_kg > 0
+              AND NOT EXISTS (SELECT 1 FROM unit_materials um WHERE um.unit_id = u.id)
+            ORDER BY 1, 2
+        """).fetchall()
+        keys = sorted({key for _, key, *_ in entries})
+        key_index = {key: i for i, key in enumerate(keys)}
+        frac = np.array([f for _, _, f, _, _, _ in entries])
+        frac_lo = np.array([f * (1 - fraction_spread) if lo is None else lo
+                            for _, _, f, lo, _, _ in entries])
+        frac_hi = np.array([f * (1 + fraction_spread) if hi is None else hi
+                            for _, _, f, _, hi, _ in entries])
+
+        targets = list(targets or units)
+        missing = [unit_id for unit_id in targets if unit_id not in index]
+        if missing:
+            raise KeyError(f"Единицы не найдены: {', '.join(missing)}")
+
+        return cls(units, keys,
+                   np.array([index[unit_id] for unit_id, *_ in entries], dtype=np.int64),
+                   np.array([key_index[key] for _, key, *_ in entries], dtype=np.int64),
+                   np.array([bool(imported) for *_, imported in entries]),
+                   mass, mass_lo, mass_hi, frac, frac_lo, frac_hi, targets, graph.closure())
+
+
+# Модель процесса пула: передаётся один раз через initializer
+_model = None
+
+
+def _init_worker(model):
+    global _model
+    _model = model
+
+
+def _run(seed, draws, model=None):
+    """Гистограммы и суммы показателей с разбросом для draws выборок (в процессе пула)"""
+    model = model or _model
+    rng = np.random.default_rng(seed)
+    lo, hi = (bound[model.live] for bound in model.bounds)
+    offsets = np.arange(len(lo)) * BINS
+    counts = np.zeros(len(lo) * BINS, dtype=np.int64)
+    sums = np.zeros(len(lo))
+    while draws > 0:
+        n = min(draws, CHUNK)
+        values = model.sample(rng, n)
+        bins = np.clip(((values - lo) / (hi - lo) * BINS).astype(np.int64), 0, BINS - 1)
+        counts += np.bincount((bins + offsets).ravel(), minlength=len(counts))
+        sums += values.sum(axis=0)
+        draws -= n
+    return counts, sums
+
+
+def simulate(model, draws, workers=None, seed=0) -> dict:
+    """
+    draws выборок на workers процессах. Возвращает перцентили PERCENTILES
+    и среднее каждого показателя: import_kg / local_fraction — массивы
+    по model.targets, demand_kg — по model.demand.
+    ValueError, если draws < 1.
+    """
+    if draws < 1:
+        raise ValueError(f"Число выборок должно быть ≥ 1, получено {draws}")
+    workers = max(1, min(workers or os.cpu_count() or 1, draws))
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    shares = [draws // workers + (i < draws % workers) for i in range(workers)]
+    if workers == 1 or not len(model.live):
+        parts = [_run(seeds[0], draws, model)]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model,)) as pool:
+            parts = list(pool.map(_run, seeds, shares))
+
+    counts = sum(c for c, _ in parts).reshape(-1, BINS)
+    mean = model.point.copy()
+    mean[model.live] = sum(s for _, s in parts) / draws
+    lo, hi = (bound[model.live] for bound in model.bounds)
+    # Перцентиль — линейная интерполяция внутри бина; без разброса — точечная оценка
+    cumulative = np.cumsum(counts, axis=1)
+    rows = np.arange(len(counts))
+    result = {}
+    for q in PERCENTILES:
+        target = q / 100 * draws
+        b = np.minimum((cumulative < target).sum(axis=1), BINS - 1)
+        before = np.where(b > 0, cumulative[rows, b - 1], 0)
+        position = (b + np.clip((target - before) / np.maximum(counts[rows, b], 1), 0, 1)) / BINS
+        values = model.point.copy()
+        values[model.live] = lo + position * (hi - lo)
+        result[q] = values
+
+    n = len(model.targets)
+
+    def split(values):
+        return {"import_kg": values[:n], "local_fraction": values[n:2 * n], "demand_kg": values[2 * n:]}
+    return {"draws": draws, "workers": workers, "mean": split(mean),
+            "percentiles": {q: split(values) for q, values in result.items()}}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Монте-Карло по неопределённости масс и BOM")
+    parser.add_argument("units", nargs="*", help="единицы для отчёта (по умолчанию все)")
+    parser.add_argument("--draws", type=int, default=100_000, help="число выборок каталога")
+    parser.add_argument("--workers", type=int, default=None, help="процессов (по умолчанию — ядер)")
+    parser.add_argument("--seed", type=int, default=0, help="зерно генератора")
+    parser.add_argument("--mass-spread", type=float, default=0.0,
+                        help="±доля для масс без диапазона (0.1 = ±10%%)")
+    parser.add_argument("--fraction-spread", type=float, default=0.0,
+                        help="±доля для долей BOM без диапазона")
+    parser.add_argument("--materials", action="store_true", help="показать потребность в материалах")
+    parser.add_argument("--all", action="store_true", help="показать и единицы без разброса")
+    parser.add_argument("--json", type=Path, help="записать результат в JSON")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    if args.draws < 1:
+        parser.error("--draws должен быть ≥ 1")
+    if not args.db.exists():
+        print("ОШИБКА: База данных не найдена. Запустите init_db.py")
+        return 1
+
+    con = duckdb.connect(str(args.db), read_only=True)
+    try:
+        model = Model.from_db(con, args.units, args.mass_spread, args.fraction_spread)
+    except (KeyError, ValueError) as e:
+        print(f"ОШИБКА: {e.args[0]}")
+        return 1
+    finally:
+        con.close()
+
+    if len(model.live) * BINS > MAX_CELLS:
+        print(f"ОШИБКА: {len(model.live):,} показателей с разбросом — слишком много для гистограмм; "
+              f"укажите единицы для отчёта")
+        return 1
+
+    started = time.perf_counter()
+    result = simulate(model, args.draws, args.workers, args.seed)
+    elapsed = time.perf_counter() - started
+    print(f"Монте-Карло: {args.draws:,} выборок, {len(model.varying)} позиций BOM "
+          f"и {len(model.live)} показателей с разбросом, "
+          f"{result['workers']} процессов — {elapsed:.2f} с\n")
+
+    p = result["percentiles"]
+    label = " / ".join(f"P{q}" for q in PERCENTILES)
+    n = len(model.targets)
+    lo, hi = model.bounds
+    varies = (hi > lo)[:n] | (hi > lo)[n:2 * n]
+    shown = [t for t in range(n) if args.all or args.units or varies[t]]
+    print(f"  {'единица':<12} {'импорт, кг (' + label + ')':>40} {'местное, %':>26}")
+    for t in shown:
+        imp = [p[q]["import_kg"][t] for q in PERCENTILES]
+        loc = [100 * p[q]["local_fraction"][t] for q in PERCENTILES]
+        print(f"  {model.targets[t]:<12} {imp[0]:>12,.1f} {imp[1]:>12,.1f} {imp[2]:>12,.1f}"
+              f"   {loc[0]:>7.2f} {loc[1]:>7.2f} {loc[2]:>7.2f}")
+    if len(shown) < n:
+        print(f"  (ещё {n - len(shown)} единиц без разброса; --all — показать)")
+
+    if args.materials:
+        print(f"\n  {'единица':<12} {'материал':<12} {'потребность, кг (' + label + ')':>40}")
+        varies_demand = (hi > lo)[2 * n:]
+        for i, (unit_id, key) in enumerate(model.demand):
+            if args.all or args.units or varies_demand[i]:
+                values = [p[q]["demand_kg"][i] for q in PERCENTILES]
+                print(f"  {unit_id:<12} {key:<12} {values[0]:>12,.2f} {values[1]:>12,.2f} {values[2]:>12,.2f}")
+
+    if args.json:
+        def table(values):
+            return {
+                "import_kg": dict(zip(model.targets, values["import_kg"].round(4).tolist())),
+                "local_fraction": dict(zip(model.targets, values["local_fraction"].round(6).tolist())),
+                "demand_kg": [[u, k, v] for (u, k), v in zip(model.demand, values["demand_kg"].round(4).tolist())],
+            }
+        args.json.write_text(json.dumps({
+            "draws": args.draws,
+            "seed": args.seed,
+            "mean": table(result["mean"]),
+            "percentiles": {f"p{q}": table(values) for q, values in p.items()},
+        }, ensure_ascii=False) + "\n")
+        print(f"\nРезультат: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
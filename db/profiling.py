@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Профилирование конвейера «Гелиос» по запросу
+
+Включается флагом --profile [ФАЙЛ] у init_db.py, validate.py и export_json.py
+или переменной окружения HELIOS_PROFILE (1 — отчёт по умолчанию, иначе путь).
+Для каждой фазы (секция сидинга, таблица замыкания, проход валидации,
+экспортёр, артефакт) пишется время, число строк, строк/с, пиковая RSS
+процесса и прирост RSS за фазу. В конце — JSON-отчёт и сводка в консоль.
+
+Выключенный профилировщик ничего не измеряет: phase() отдаёт пустую запись.
+"""
+
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+ENV = "HELIOS_PROFILE"
+REPORT_DIR = Path(__file__).parent / "profile"
+
+
+def current_rss_mb():
+    """Текущая RSS процесса, МБ (Linux: /proc/self/statm), иначе None"""
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def peak_rss_mb():
+    """Пиковая RSS процесса с начала работы, МБ"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux — КБ, macOS — байты
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+class Profiler:
+    """Сбор записей о фазах; общий на процесс (см. profiler)"""
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.records = []
+        self._lock = threading.Lock()
+        self._started = None
+
+    def enable(self, path=None):
+        self.enabled = True
+        self.path = path
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name, rows=None):
+        """
+        Замер фазы. Число строк можно передать сразу или записать
+        в отданную запись: with profiler.phase("...") as record: record["rows"] = n
+        """
+        record = {"name": name, "rows": rows}
+        if not self.enabled:
+            yield record
+            return
+        rss_before = current_rss_mb()
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            wall_s = time.perf_counter() - started
+            rss_after = current_rss_mb()
+            record["wall_s"] = round(wall_s, 4)
+            record["rows_per_s"] = round(record["rows"] / wall_s) if record["rows"] and wall_s else None
+            record["peak_rss_mb"] = round(peak_rss_mb(), 1)
+            record["rss_delta_mb"] = (round(rss_after - rss_before, 1)
+                                      if rss_before is not None and rss_after is not None else None)
+            record["thread"] = threading.current_thread().name
+            with self._lock:
+                self.records.append(record)
+
+    def report(self, script) -> dict:
+        return {
+            "script": script,
+            "argv": sys.argv[1:],
+            "wall_s": round(time.perf_counter() - self._started, 4),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "phases": self.records,
+        }
+
+    def finish(self, script):
+        """JSON-отчёт и сводка; ничего не делает, если профилирование выключено"""
+        if not self.enabled:
+            return
+        report = self.report(script)
+        path = Path(self.path) if self.path else REPORT_DIR / f"{script}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+
+        print(f"\nПрофиль {script}: {report['wall_s']:.2f} с, пик RSS {report['peak_rss_mb']:.1f} МБ")
+        print(f"  {'фаза':<44} {'время, с':>9} {'строк':>12} {'строк/с':>12} {'пик, МБ':>9} {'Δ, МБ':>8}")
+        for r in sorted(self.records, key=lambda r: -r["wall_s"]):
+            print(f"  {r['name']:<44} {r['wall_s']:>9.3f} "
+                  f"{r['rows'] if r['rows'] is not None else '—':>12} "
+                  f"{r['rows_per_s'] if r['rows_per_s'] is not None else '—':>12} "
+                  f"{r['peak_rss_mb']:>9.1f} "
+                  f"{r['rss_delta_mb'] if r['rss_delta_mb'] is not None else '—':>8}")
+        print(f"  Отчёт: {path}")
+
+
+profiler = Profiler()
+
+
+def configure(flag=None):
+    """
+    Включение по флагу --profile (True или путь к отчёту) либо по HELIOS_PROFILE.
+    Вызывается из main() скриптов до начала работы.
+    """
+    value = flag if flag is not None else os.environ.get(ENV)
+    if not value or value == "0":
+        return
+    profiler.enable(None if value in (True, "1") else value)
+
+
+def add_argument(parser):
+    """Флаг --profile [ФАЙЛ] для argparse"""
+    parser.add_argument("--profile", nargs="?", const=True, metavar="ФАЙЛ",
+                        help=f"профилирование фаз: JSON-отчёт (по умолчанию db/profile/<скрипт>.json) "
+                             f"и сводка; то же — переменная {ENV}")
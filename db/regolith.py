@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Потребность в реголите по планетам для плана производства «Гелиос»
+
+Потребность плана по материалам (bom_matrix.BomMatrix, Rᵀx) сводится
+к элементам реголита каждой планеты: материал без concentration_pct на планете
+относится к ближайшему предку по materials.parent_id, у которого она есть
+(сталь Fe-Mn → Fe). Чтобы получить все элементы, нужно переработать
+max по элементам (потребность / (концентрация × извлечение)) реголита —
+элемент, на котором достигается максимум, лимитирующий (Fe при 1.7%
+на Меркурии). Материалы, которые на планете не сводятся ни к одному
+элементу реголита (импорт, соединения без данных о стехиометрии), идут
+отдельной строкой «не из реголита».
+
+Расчёт — один тензор планеты × элементы × планы: все планеты и пачки
+планов обрабатываются одним проходом NumPy.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import duckdb
+import numpy as np
+from scipy import sparse
+
+from bom_matrix import BomMatrix, add_plan_arguments, load_plan
+
+DB_PATH = Path(__file__).parent / "helios.duckdb"
+
+
+class RegolithSolver:
+    """
+    Концентрации элементов по планетам и отображение позиций BOM на элементы:
+    mapping[планета, элемент, позиция] = 1, если позиция на планете
+    добывается как этот элемент
+    """
+
+    def __init__(self, planets, elements, concentration, mapping, keys):
+        self.planets = list(planets)
+        self.elements = list(elements)
+        self.concentration = concentration   # (планеты × элементы), доли 0..1
+        self.mapping = mapping               # (планеты × элементы × позиции)
+        self.keys = keys                     # индексы позиций BomMatrix.keys в mapping
+
+    @classmethod
+    def from_db(cls, con, keys, planets=None):
+        """
+        keys — позиции BomMatrix. Учитываются планеты с хотя бы одной
+        концентрацией (или перечисленные в planets).
+        """
+        rows = con.execute("""
+            SELECT planet_id, material_id, concentration_pct::DOUBLE / 100
+            FROM planet_materials
+            WHERE concentration_pct > 0
+            ORDER BY planet_id, material_id
+        """).fetchall()
+        available = sorted({planet for planet, _, _ in rows})
+        if planets:
+            missing = [planet for planet in planets if planet not in available]
+            if missing:
+                raise KeyError(f"Нет данных о реголите: {', '.join(missing)}")
+            available = list(planets)
+        elements = sorted({material for _, material, _ in rows})
+        planet_index = {planet: i for i, planet in enumerate(available)}
+        element_index = {element: i for i, element in enumerate(elements)}
+
+        concentration = np.zeros((len(available), len(elements)))
+        for planet, material, value in rows:
+            if planet in planet_index:
+                concentration[planet_index[planet], element_index[material]] = value
+
+        # Позиция → элемент реголита: сама или ближайший предок с концентрацией
+        parents = dict(con.execute("SELECT id, parent_id FROM materials").fetchall())
+        positions, columns = [], []
+        for k, key in enumerate(keys):
+            chain, node = [], key
+            while node is not None and node not in chain:
+                chain.append(node)
+                node = parents.get(node)
+            if any(node in element_index for node in chain):
+                positions.append(k)
+                columns.append(chain)
+
+        mapping = np.zeros((len(available), len(elements), len(positions)))
+        for j, chain in enumerate(columns):
+            for p in range(len(available)):
+                for node in chain:
+                    e = element_index.get(node)
+                    if e is not None and concentration[p, e] > 0:
+                        mapping[p, e, j] = 1.0
+                        break
+        return cls(available, elements, concentration, mapping, np.array(positions, dtype=np.int64))
+
+    def solve(self, demand, recovery=1.0) -> dict:
+        """
+        demand — потребность по позициям BomMatrix (позиции или позиции × планы).
+        Возвращает массивы (планеты × планы): regolith_kg, binding (индекс
+        элемента), from_regolith_kg, other_kg; element_kg — (планеты × элементы × планы).
+        """
+        single = not sparse.issparse(demand) and np.ndim(demand) == 1
+        if sparse.issparse(demand):
+            demand = demand.tocsr()
+            total = np.asarray(demand.sum(axis=0)).ravel()
+            mapped = demand[self.keys].toarray()
+        else:
+            demand = np.asarray(demand, dtype=float).reshape(len(demand), -1)
+            total = demand.sum(axis=0)
+            mapped = demand[self.keys]
+
+        # Потребность по элементам каждой планеты и нужный реголит на каждый элемент
+        element_kg = np.einsum("pek,kn->pen", self.mapping, mapped)
+        yield_share = self.concentration * recovery
+        with np.errstate(divide="ignore", invalid="ignore"):
+            regolith = np.where(yield_share[:, :, None] > 0,
+                                element_kg / yield_share[:, :, None], 0.0)
+
+        binding = regolith.argmax(axis=1)
+        regolith_kg = regolith.max(axis=1)
+        from_regolith = element_kg.sum(axis=1)
+        result = {
+            "regolith_kg": regolith_kg,
+            "binding": np.where(regolith_kg > 0, binding, -1),
+            "element_kg": element_kg,
+            "from_regolith_kg": from_regolith,
+            "other_kg": total[None, :] - from_regolith,
+        }
+        if single:
+            result = {name: values[..., 0] for name, values in result.items()}
+        return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Реголит для плана производства по планетам")
+    add_plan_arguments(parser)
+    parser.add_argument("--planets", nargs="+", help="планеты (по умолчанию все с данными о реголите)")
+    parser.add_argument("--recovery", type=float, default=1.0,
+                        help="доля извлечения элементов из реголита (0..1)")
+    parser.add_argument("--out", type=Path, help="записать результат (plan,planet,...) в CSV")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    if not args.items and not args.plan:
+        parser.error("нужны позиции плана или --plan")
+    if not 0 < args.recovery <= 1:
+        parser.error("--recovery должен быть в (0, 1]")
+    if not args.db.exists():
+        print("ОШИБКА: База данных не найдена. Запустите init_db.py")
+        return 1
+
+    con = duckdb.connect(str(args.db), read_only=True)
+    try:
+        matrix = BomMatrix.from_db(con)
+        solver = RegolithSolver.from_db(con, matrix.keys, args.planets)
+        labels, x = load_plan(con, matrix, args.items, args.plan)
+    except (KeyError, ValueError) as e:
+        print(f"ОШИБКА: {e.args[0]}")
+        return 1
+    finally:
+        con.close()
+
+    started = time.perf_counter()
+    result = solver.solve(matrix.demand(x), args.recovery)
+    elapsed = time.perf_counter() - started
+    print(f"Реголит: {len(labels):,} планов × {len(solver.planets)} планет — {elapsed * 1000:.1f} мс "
+          f"(извлечение {args.recovery:.0%})\n")
+
+    def binding_name(p, n):
+        e = result["binding"][p, n]
+        if e < 0:
+            return "—"
+        return f"{solver.elements[e]} ({100 * solver.concentration[p, e]:g}%)"
+
+    print(f"  {'план':<12} {'планета':<10} {'реголит, т':>16} {'лимитирует':<18} "
+          f"{'из реголита, т':>16} {'не из реголита, т':>18}")
+    for n, label in enumerate(labels[:10]):
+        for p, planet in enumerate(solver.planets):
+            print(f"  {label or '—':<12} {planet:<10} {result['regolith_kg'][p, n] / 1000:>16,.1f} "
+                  f"{binding_name(p, n):<18} {result['from_regolith_kg'][p, n] / 1000:>16,.1f} "
+                  f"{result['other_kg'][p, n] / 1000:>18,.1f}")
+    if len(labels) > 10:
+        print(f"  … ещё {len(labels) - 10:,} планов (--out — все в CSV)")
+
+    if args.out:
+        with args.out.open("w") as f:
+            f.write("plan,planet,regolith_kg,binding,from_regolith_kg,other_kg\n")
+            for n, label in enumerate(labels):
+                for p, planet in enumerate(solver.planets):
+                    e = result["binding"][p, n]
+                    f.write(f"{label},{planet},{result['regolith_kg'][p, n]:.3f},"
+                            f"{solver.elements[e] if e >= 0 else ''},"
+                            f"{result['from_regolith_kg'][p, n]:.3f},{result['other_kg'][p, n]:.3f}\n")
+        print(f"\nРезультат: {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
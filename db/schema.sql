@@ -73,7 +73,9 @@ CREATE TABLE IF NOT EXISTS units (
     parent_id VARCHAR,                         -- Родительская сборка (вложенность)
     is_assembly BOOLEAN,                       -- true = сборка, false = простая единица
     production_planet_id VARCHAR REFERENCES planets(id),  -- Где производится
-    sources TEXT                               -- JSON-массив ссылок на источники
+    sources TEXT,                              -- JSON-массив ссылок на источники
+    mass_kg_min DECIMAL,                       -- Диапазон оценки массы (NULL = точечная)
+    mass_kg_max DECIMAL
 );
 
 -- ============================================
@@ -86,6 +88,8 @@ CREATE TABLE IF NOT EXISTS unit_materials (
     unit_id VARCHAR REFERENCES units(id),
     material_id VARCHAR REFERENCES materials(id),
     fraction_pct DECIMAL,                      -- % от массы единицы (НЕ кг!)
+    fraction_pct_min DECIMAL,                  -- Диапазон оценки доли (NULL = точечная)
+    fraction_pct_max DECIMAL,
     PRIMARY KEY (unit_id, material_id)
 );
 
@@ -103,6 +107,98 @@ CREATE TABLE IF NOT EXISTS unit_components (
     PRIMARY KEY (assembly_id, component_id)
 );
 
+-- ============================================
+-- 8. СЛУЖЕБНАЯ: ОТПЕЧАТКИ СЕКЦИЙ СИДИНГА
+-- ============================================
+-- Используется init_db.py --incremental: SHA-256 данных каждой секции
+-- (section = имя таблицы) и схемы (section = '__schema__')
+-- ============================================
+CREATE TABLE IF NOT EXISTS seed_state (
+    section VARCHAR PRIMARY KEY,
+    fingerprint VARCHAR NOT NULL
+);
+
+-- ============================================
+-- 9. ЗАМЫКАНИЕ СОСТАВА СБОРОК (где применяется)
+-- ============================================
+-- Строится init_db.py из unit_components (closure.py): для каждой пары
+-- (компонент на любом уровне вложенности, сборка) — кратчайшая глубина
+-- и сколько штук компонента приходится на одну сборку с учётом всех путей.
+-- Ключ начинается с descendant_id: «где применяется CMP-004?» — поиск по индексу,
+-- «из чего состоит ROB-021?» — по индексу на ancestor_id
+-- ============================================
+CREATE TABLE IF NOT EXISTS unit_component_closure (
+    descendant_id VARCHAR,                     -- компонент (на любом уровне)
+    ancestor_id VARCHAR,                       -- сборка, в которую он входит
+    depth INTEGER,                             -- уровень вложенности (1 = прямой компонент)
+    quantity BIGINT,                           -- штук на одну сборку (сумма по путям)
+    PRIMARY KEY (descendant_id, ancestor_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_component_closure_ancestor
+    ON unit_component_closure (ancestor_id);
+
+-- ============================================
+-- 10. ЗАМЫКАНИЕ РАЗМЕЩЕНИЯ (units.parent_id)
+-- ============================================
+-- Все предки каждой единицы по цепочке parent_id (без строк «сам себе»).
+-- «Всё, что находится на FAC-001» — поиск по индексу на ancestor_id
+-- ============================================
+CREATE TABLE IF NOT EXISTS unit_location_closure (
+    descendant_id VARCHAR,                     -- единица
+    ancestor_id VARCHAR,                       -- объект, в котором она размещена
+    depth INTEGER,                             -- 1 = прямой parent_id
+    PRIMARY KEY (descendant_id, ancestor_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_location_closure_ancestor
+    ON unit_location_closure (ancestor_id);
+
+-- ============================================
+-- 11. СЛУЖЕБНАЯ: СОСТОЯНИЕ ПОСЛЕДНЕЙ УСПЕШНОЙ ВАЛИДАЦИИ
+-- ============================================
+-- Используется validate.py: отпечаток каждой единицы (строка units + её BOM
+-- и состав) и каждого материала (строка materials + планеты + где используется).
+-- Следующая проверка перепроверяет только изменившиеся записи и их предков.
+-- warning — предупреждение по записи на момент последней проверки
+-- ============================================
+CREATE TABLE IF NOT EXISTS validation_state (
+    kind VARCHAR,                              -- 'unit' | 'material'
+    id VARCHAR,
+    fingerprint VARCHAR NOT NULL,
+    warning VARCHAR,
+    PRIMARY KEY (kind, id)
+);
+
+-- ============================================
+-- 12. ИНДЕКС ДЕРЕВА РАЗМЕЩЕНИЯ (Euler tour / nested set)
+-- ============================================
+-- Строится init_db.py из units.parent_id (closure.py): обход в глубину
+-- (дети по id), lft — позиция единицы в обходе, rgt — позиция её последнего
+-- потомка, поддерево = непрерывный отрезок [lft, rgt]. Для мощности, массы и
+-- числа роботов хранятся префиксные суммы по обходу: *_before — до единицы,
+-- *_through — включая её. Итог по поддереву — одна разность без обхода:
+--   SELECT l.power_kw_through - n.power_kw_before
+--   FROM unit_location_tree n JOIN unit_location_tree l ON l.lft = n.rgt
+--   WHERE n.unit_id = 'FAC-001'
+-- ============================================
+CREATE TABLE IF NOT EXISTS unit_location_tree (
+    unit_id VARCHAR PRIMARY KEY,
+    root_id VARCHAR NOT NULL,                  -- корень дерева размещения
+    depth INTEGER NOT NULL,                    -- 0 = корень
+    lft INTEGER NOT NULL,                      -- позиция в обходе (с 0)
+    rgt INTEGER NOT NULL,                      -- позиция последнего потомка
+    power_kw_before DOUBLE NOT NULL,
+    power_kw_through DOUBLE NOT NULL,
+    mass_kg_before DOUBLE NOT NULL,
+    mass_kg_through DOUBLE NOT NULL,
+    robots_before INTEGER NOT NULL,
+    robots_through INTEGER NOT NULL
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_location_tree_lft
+    ON unit_location_tree (lft);
+
 -- ============================================
 -- ПОЛЕЗНЫЕ ЗАПРОСЫ
 -- ============================================
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Симулятор самовоспроизводства «Гелиос» (bootstrap → экспоненциальный рост)
+
+Модель по bootstrap.qmd и replication.qmd, параметры единиц — из БД:
+- BOM репликатора (по умолчанию FAC-001) и роботов экипажа — свёрнутые
+  векторы bom.BomGraph.rollup() (кг материала / неделимых импортных единиц)
+- материалы, у которых на планете производства есть concentration_pct,
+  добываются из реголита; материалы с NULL на этой планете производятся
+  на месте (соединения, сплавы); всё остальное — «витамины» с Земли
+- units.power_kw — потребление парка, units.mass_kg — через BOM
+
+Шаг — сутки. Каждый завод (с поправкой на укомплектованность экипажем)
+перерабатывает реголит и пополняет склады; сборочная мощность идёт сначала
+на роботов до нормы экипажа, остальное — на новые заводы; заказ ограничен
+складом каждого материала; готовые единицы вводятся через lead_days суток;
+роботы выбывают по сроку службы. Все состояния — массивы NumPy с осью
+сценариев, так что сравнение вариантов (--alloc 0.5 1.0) — один прогон.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import duckdb
+import numpy as np
+
+from bom import BomGraph
+
+DB_PATH = Path(__file__).parent / "helios.duckdb"
+
+# Параметры по умолчанию (источник — в комментарии)
+DEFAULTS = {
+    "planet": "mercury",
+    "replicator": "FAC-001",
+    # Масс-драйвер строится один раз до фазы репликации (replication.qmd, Phase 0)
+    "exclude": ("EQU-001",),
+    # 15 роботов на завод (replication.qmd: Robots 15 units)
+    "crew": {"ROB-021": 5, "ROB-022": 5, "ROB-023": 5},
+    # 600 т/сут реголита ≈ 42 т/сут Al при 7% Al (replication.qmd)
+    "regolith_kg_day": 600_000.0,
+    "recovery": 1.0,
+    # Производство соединений/сплавов на завод, кг/сут каждого
+    "compound_kg_day": 2_000.0,
+    # Сборка: ~3 недели на новый завод (replication.qmd)
+    "assembly_kg_day": 12_000.0,
+    "lead_days": 5,
+    # Gen-1: срок службы 2–3 года (bootstrap.qmd)
+    "robot_life_days": 2.5 * 365,
+    # Доставка «витаминов» с Земли, кг/сут
+    "import_kg_day": 400.0,
+    "factories": 1.0,
+}
+
+
+class Catalog:
+    """Векторы модели: строки — изделия (репликатор, роботы экипажа), колонки — позиции BOM"""
+
+    def __init__(self, products, keys, bom, mass_kg, power_kw, crew, extracted, produced):
+        self.products = products    # [replicator, *роботы]
+        self.keys = keys            # материалы и неделимые импортные единицы
+        self.bom = bom              # (изделия × позиции), кг на штуку
+        self.mass_kg = mass_kg      # (изделия,) = bom.sum(axis=1)
+        self.power_kw = power_kw    # (изделия,)
+        self.crew = crew            # (роботы,) штук на завод
+        self.extracted = extracted  # (позиции,) доля в реголите, 0 — не добывается
+        self.produced = produced    # (позиции,) производится на месте (соединения)
+
+    @property
+    def imported(self):
+        return (self.extracted == 0) & ~self.produced
+
+    @classmethod
+    def from_db(cls, con, planet=DEFAULTS["planet"], replicator=DEFAULTS["replicator"],
+                crew=None, exclude=DEFAULTS["exclude"]):
+        crew = DEFAULTS["crew"] if crew is None else crew
+        graph = BomGraph.from_db(con)
+        rollup = graph.rollup()
+        products = [replicator, *crew]
+        for unit_id in products + list(exclude):
+            if unit_id not in rollup:
+                raise KeyError(f"Единица {unit_id} не найдена")
+
+        vectors = []
+        for unit_id in products:
+            vector = dict(rollup[unit_id])
+            if unit_id == replicator:
+                contained = graph.closure().get(replicator, {})
+                for excluded in exclude:
+                    quantity = contained.get(excluded, (0, 0))[1]
+                    for key, mass in rollup[excluded].items():
+                        vector[key] = vector.get(key, 0.0) - quantity * mass
+            vectors.append(vector)
+        keys = sorted({key for vector in vectors for key, mass in vector.items() if mass > 1e-9})
+        bom = np.array([[max(vector.get(key, 0.0), 0.0) for key in keys] for vector in vectors])
+
+        rows = con.execute("""
+            SELECT material_id, concentration_pct::DOUBLE
+            FROM planet_materials WHERE planet_id = ?
+        """, [planet]).fetchall()
+        local = dict(rows)
+        extracted = np.array([(local.get(key) or 0.0) / 100 for key in keys])
+        produced = np.array([key in local and local[key] is None for key in keys])
+
+        power = dict(con.execute("SELECT id, COALESCE(power_kw, 0)::DOUBLE FROM units").fetchall())
+        return cls(products, keys, bom, bom.sum(axis=1),
+                   np.array([power.get(unit_id, 0.0) for unit_id in products]),
+                   np.array([float(n) for n in crew.values()]), extracted, produced)
+
+
+def simulate(catalog, days, alloc=(1.0,), **params) -> dict:
+    """
+    Прогон на days суток для каждого значения alloc (доля сборочной мощности
+    на рост). Возвращает суточные ряды: factories (сценарии × сутки),
+    robots (сценарии × сутки × типы), stock (сценарии × позиции) на конец,
+    imported_kg, power_mw.
+    ValueError, если days < 1 или в экипаже нет роботов / численность ≤ 0.
+    """
+    if days < 1:
+        raise ValueError(f"Горизонт должен быть ≥ 1 суток, получено {days}")
+    if not len(catalog.crew) or (catalog.crew <= 0).any():
+        raise ValueError("Экипаж завода: нужен хотя бы один тип роботов, численность каждого ≥ 1")
+    p = {**DEFAULTS, **params}
+    alloc = np.asarray(alloc, dtype=float)
+    scenarios, products, keys = len(alloc), len(catalog.products), len(catalog.keys)
+    bom, crew = catalog.bom, catalog.crew
+    lead = max(int(p["lead_days"]), 1)
+
+    # Суточная выработка одного полностью укомплектованного завода
+    output = (p["regolith_kg_day"] * p["recovery"] * catalog.extracted
+              + p["compound_kg_day"] * catalog.produced)
+    # Импорт по умолчанию делится по потребности комплекта «завод + экипаж»
+    kit = bom[0] + crew @ bom[1:]
+    imported = catalog.imported
+    kit_share = np.where(imported, kit, 0.0)
+    kit_share = kit_share / kit_share.sum() if kit_share.sum() else kit_share
+
+    # Парк: колонка 0 — заводы, остальные — роботы по типам
+    fleet = np.zeros((scenarios, products))
+    fleet[:, 0] = p["factories"]
+    fleet[:, 1:] = np.outer(fleet[:, 0], crew)
+    stock = np.zeros((scenarios, keys))
+    pipeline = np.zeros((lead, scenarios, products))
+    in_pipeline = np.zeros((scenarios, products))
+    survival = np.r_[1.0, np.full(len(crew), 1.0 - 1.0 / p["robot_life_days"])]
+    inv_crew = 1.0 / crew
+    robot_mass, kit_mass = catalog.mass_kg[1:], catalog.mass_kg[0]
+    assembly = p["assembly_kg_day"] * alloc
+    import_mask = imported.astype(float)
+    import_kg_day = p["import_kg_day"]
+    kit_bias = 1e-9 * kit_share if kit_share.any() else np.full(keys, 1e-9)
+
+    series = np.empty((days, scenarios, products))
+
+    for day in range(days):
+        # Ввод заказов, сделанных lead суток назад; выбытие роботов
+        slot = day % lead
+        arrived = pipeline[slot]
+        in_pipeline -= arrived
+        fleet += arrived
+        fleet *= survival
+        factories = fleet[:, 0]
+
+        # Выработка с поправкой на укомплектованность экипажем
+        staffed = (fleet[:, 1:] * inv_crew).min(axis=1)
+        working = np.minimum(factories, staffed)
+        stock += working[:, None] * output
+
+        # Заказы: роботы до нормы экипажа (с учётом будущих заводов), затем заводы
+        capacity = working * assembly
+        deficit = (factories + in_pipeline[:, 0])[:, None] * crew - fleet[:, 1:] - in_pipeline[:, 1:]
+        np.maximum(deficit, 0.0, out=deficit)
+        robot_kg = deficit @ robot_mass
+        robot_scale = np.minimum(1.0, capacity / (robot_kg + 1e-12))
+        orders = np.empty((scenarios, products))
+        orders[:, 1:] = deficit * robot_scale[:, None]
+        orders[:, 0] = (capacity - robot_kg * robot_scale) / kit_mass
+
+        # Импорт — в первую очередь на то, чего не хватает для сегодняшних заказов
+        need = orders @ bom
+        # (без дефицита — по доле комплекта: kit_bias ≪ любого реального дефицита)
+        shortfall = np.maximum(need - stock, 0.0) * import_mask + kit_bias
+        stock += shortfall * (import_kg_day / shortfall.sum(axis=1, keepdims=True))
+
+        # Ограничение складом: заказ масштабируется по самому дефицитному материалу
+        feasible = (stock / (need + 1e-12)).min(axis=1)
+        orders *= np.minimum(1.0, feasible)[:, None]
+        stock -= orders @ bom
+        np.maximum(stock, 0.0, out=stock)
+
+        pipeline[slot] = orders
+        in_pipeline += orders
+        series[day] = fleet
+
+    series_factories = series[:, :, 0].T
+    series_robots = series[:, :, 1:].transpose(1, 0, 2)
+    power_kw = (series_factories * catalog.power_kw[0]
+                + series_robots @ catalog.power_kw[1:])
+    return {
+        "alloc": alloc,
+        "factories": series_factories,
+        "robots": series_robots,
+        "stock": stock,
+        "imported_kg": np.arange(1, days + 1) * p["import_kg_day"],
+        "power_mw": power_kw / 1000,
+    }
+
+
+def first_day(series, threshold):
+    """Первые сутки, когда ряд достиг threshold (или None)"""
+    reached = np.flatnonzero(series >= threshold)
+    return int(reached[0]) if len(reached) else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Симуляция роста самовоспроизводящихся заводов")
+    parser.add_argument("--years", type=float, default=10, help="горизонт, лет")
+    parser.add_argument("--alloc", type=float, nargs="+", default=[1.0],
+                        help="доля сборочной мощности на рост (несколько значений — сравнение)")
+    parser.add_argument("--planet", default=DEFAULTS["planet"])
+    parser.add_argument("--replicator", default=DEFAULTS["replicator"])
+    parser.add_argument("--exclude", nargs="*", default=list(DEFAULTS["exclude"]),
+                        help="компоненты, не входящие в копию репликатора")
+    parser.add_argument("--crew", nargs="*", metavar="UNIT:N",
+                        help="экипаж завода, например ROB-021:5 ROB-022:5")
+    for name in ("regolith_kg_day", "recovery", "compound_kg_day", "assembly_kg_day",
+                 "lead_days", "robot_life_days", "import_kg_day", "factories"):
+        parser.add_argument(f"--{name.replace('_', '-')}", type=float, default=DEFAULTS[name])
+    parser.add_argument("--json", type=Path, help="записать ряды (шаг --every суток) в JSON")
+    parser.add_argument("--every", type=int, default=30, help="шаг рядов в JSON, суток")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    args = parser.parse_args(argv)
+
+    if int(args.years * 365) < 1:
+        parser.error("--years должен покрывать хотя бы одни сутки (≥ 1/365)")
+    if args.every < 1:
+        parser.error("--every должен быть ≥ 1")
+    crew = None
+    if args.crew is not None:
+        if not args.crew:
+            parser.error("--crew: нужен хотя бы один тип роботов UNIT:N")
+        crew = {}
+        for item in args.crew:
+            unit_id, _, n = item.partition(":")
+            if not unit_id or not n.isdigit() or int(n) < 1:
+                parser.error(f"--crew: ожидается UNIT:N с целым N ≥ 1, получено {item!r}")
+            crew[unit_id] = int(n)
+    if not args.db.exists():
+        print("ОШИБКА: База данных не найдена. Запустите init_db.py")
+        return 1
+
+    con = duckdb.connect(str(args.db), read_only=True)
+    try:
+        catalog = Catalog.from_db(con, args.planet, args.replicator, crew, args.exclude)
+    except KeyError as e:
+        print(f"ОШИБКА: {e.args[0]}")
+        return 1
+    finally:
+        con.close()
+
+    params = {name: getattr(args, name) for name in DEFAULTS if hasattr(args, name)
+              and name not in ("planet", "replicator", "exclude", "crew")}
+    days = int(args.years * 365)
+    started = time.perf_counter()
+    result = simulate(catalog, days, args.alloc, **params)
+    elapsed = time.perf_counter() - started
+
+    imported = catalog.imported
+    print(f"Репликатор {catalog.products[0]}: {catalog.mass_kg[0] / 1000:,.1f} т, "
+          f"импорт {catalog.bom[0][imported].sum():,.0f} кг; экипаж: "
+          + ", ".join(f"{u}×{n:g}" for u, n in zip(catalog.products[1:], catalog.crew)))
+    print(f"Симуляция: {days:,} сут × {len(args.alloc)} сценариев за {elapsed * 1000:.0f} мс\n")
+
+    print(f"  {'alloc':>6} {'×2':>7} {'×10':>7} {'×100':>7} {'×1000':>7} "
+          f"{'заводов':>12} {'роботов':>12} {'МВт':>12}")
+    f0 = result["factories"][:, 0]
+    for s, alloc in enumerate(result["alloc"]):
+        marks = [first_day(result["factories"][s], f0[s] * k) for k in (2, 10, 100, 1000)]
+        print(f"  {alloc:>6.2f} " + " ".join(f"{m if m is not None else '—':>7}" for m in marks)
+              + f" {result['factories'][s, -1]:>12,.1f} {result['robots'][s, -1].sum():>12,.0f}"
+              f" {result['power_mw'][s, -1]:>12,.0f}")
+    print("  (×N — сутки до N-кратного роста числа заводов)")
+
+    if args.json:
+        step = slice(None, None, args.every)
+        args.json.write_text(json.dumps({
+            "products": catalog.products,
+            "keys": catalog.keys,
+            "alloc": result["alloc"].tolist(),
+            "every_days": args.every,
+            "factories": result["factories"][:, step].round(3).tolist(),
+            "robots": result["robots"][:, step].round(3).tolist(),
+            "power_mw": result["power_mw"][:, step].round(3).tolist(),
+            "imported_kg": result["imported_kg"][step].round(1).tolist(),
+            "stock_kg": result["stock"].round(1).tolist(),
+        }, ensure_ascii=False) + "\n")
+        print(f"\nРяды: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
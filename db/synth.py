@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Генератор синтетических каталогов «Гелиос» для нагрузочных тестов
+
+Справочники (planets, categories, materials, planet_materials) копируются
+из db/seed как есть, а units, unit_materials и unit_components генерируются:
+
+- единицы разложены по уровням DAG сборок: уровень 0 — простые единицы,
+  уровни 1..depth — сборки; каждая сборка берёт один компонент с уровня ниже
+  (так глубина DAG равна depth) и остальные — с любых нижних уровней
+- среднее число компонентов сборки — fanout
+- BOM каждой местной простой единицы (и половины сборок) — 1–5 материалов,
+  доли в сумме ровно 100%
+- верхний уровень — объекты (facilities) с цепочками размещения по parent_id,
+  часть остальных единиц размещена на них
+
+Результат — каталог seed-файлов для init_db.py --seed-dir и synth.json
+с параметрами и числом строк. Генерация детерминирована по --seed.
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import duckdb
+import numpy as np
+
+from init_db import SEED_DIR, seed_file
+
+REFERENCE_TABLES = ("planets", "categories", "materials", "planet_materials")
+GENERATED_TABLES = ("units", "unit_materials", "unit_components")
+UNIT_ID = "printf('SYN-%08d', {})"
+
+
+def level_sizes(units, depth, leaf_share) -> np.ndarray:
+    """Число единиц на каждом уровне: листья + геометрически убывающие уровни сборок"""
+    if units < depth + 1:
+        raise ValueError(f"Нужно не меньше {depth + 1} единиц для глубины {depth}")
+    leaves = max(1, int(units * leaf_share))
+    weights = 0.5 ** np.arange(depth)
+    sizes = np.maximum(1, np.floor((units - leaves) * weights / weights.sum())).astype(np.int64)
+    sizes[0] += units - leaves - sizes.sum()
+    return np.concatenate([[leaves], sizes])
+
+
+def reader(path: Path) -> str:
+    """Табличная функция чтения seed-файла (без явной схемы — только для справок)"""
+    quoted_path = str(path).replace("'", "''")
+    if path.suffix == ".parquet":
+        return f"read_parquet('{quoted_path}')"
+    return f"read_csv('{quoted_path}', comment='#', header=true)"
+
+
+def write_table(con, sql, path, fmt):
+    """Выгрузка результата запроса в seed-файл"""
+    options = "FORMAT parquet" if fmt == "parquet" else "FORMAT csv, HEADER"
+    quoted_path = str(path).replace("'", "''")
+    con.execute(f"COPY ({sql}) TO '{quoted_path}' ({options})")
+
+
+def generate(out_dir: Path, units: int, depth: int = 6, fanout: int = 4,
+             seed: int = 0, fmt: str = "parquet", leaf_share: float = 0.6) -> dict:
+    """Генерация каталога в out_dir. Возвращает описание (как в synth.json)."""
+    rng = np.random.default_rng(seed)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Старые seed-файлы обоих форматов — иначе init_db может взять не тот
+    for table in REFERENCE_TABLES + GENERATED_TABLES:
+        for suffix in (".csv", ".parquet"):
+            (out_dir / f"{table}{suffix}").unlink(missing_ok=True)
+    for table in REFERENCE_TABLES:
+        source = seed_file(SEED_DIR, table)
+        shutil.copyfile(source, out_dir / source.name)
+
+    con = duckdb.connect()
+    materials = [
+        material_id for (material_id,) in con.execute(
+            f"SELECT id FROM {reader(seed_file(SEED_DIR, 'materials'))} "
+            "WHERE parent_id IS NOT NULL ORDER BY id"
+        ).fetchall()
+    ]
+
+    # --- Единицы ---
+    sizes = level_sizes(units, depth, leaf_share)
+    starts = np.concatenate([[0], np.cumsum(sizes)])
+    level = np.repeat(np.arange(depth + 1), sizes)
+    index = np.arange(units)
+    leaf = level == 0
+    top = level == depth
+
+    planet = np.where(leaf & (rng.random(units) < 0.15), "earth",
+                      np.where(rng.random(units) < 0.8, "mercury", "moon")).astype(object)
+    category = np.where(top, "facilities",
+                        np.where(leaf, rng.choice(["equipment", "products"], units),
+                                 rng.choice(["robots", "equipment", "transport"], units))).astype(object)
+    mass_kg = np.round(rng.lognormal(mean=2 + level, sigma=1.0), 3)
+    power_kw = np.round(rng.lognormal(mean=level - 1.0, sigma=1.0), 3)
+
+    # Размещение: объект — в объекте с меньшим номером (цепочки без циклов),
+    # пятая часть остальных единиц — на случайном объекте
+    facilities = index[top]
+    parent = np.full(units, -1)
+    nested = top & (index > facilities[0]) & (rng.random(units) < 0.5)
+    parent[nested] = facilities[0] + (rng.random(nested.sum()) * (index[nested] - facilities[0])).astype(np.int64)
+    placed = ~top & (rng.random(units) < 0.2)
+    parent[placed] = rng.choice(facilities, placed.sum())
+
+    # --- Рёбра состава ---
+    assemblies = index[~leaf]
+    counts = 1 + rng.poisson(max(fanout - 1, 0), len(assemblies))
+    edge_assembly = np.repeat(assemblies, counts)
+    edge_level = level[edge_assembly]
+    first = np.zeros(len(edge_assembly), dtype=bool)
+    first[np.concatenate([[0], np.cumsum(counts)[:-1]])] = True
+    low = np.where(first, starts[edge_level - 1], 0)
+    high = starts[edge_level]
+    edge_component = low + (rng.random(len(edge_assembly)) * (high - low)).astype(np.int64)
+    edge_quantity = rng.integers(1, 20, len(edge_assembly), endpoint=True)
+
+    # --- BOM ---
+    with_bom = index[(leaf & (planet != "earth")) | (~leaf & (rng.random(units) < 0.5))]
+    bom_counts = rng.integers(1, 5, len(with_bom), endpoint=True)
+    bom_unit = np.repeat(with_bom, bom_counts)
+    bom_material = rng.integers(0, len(materials), len(bom_unit))
+    bom_weight = rng.random(len(bom_unit)) + 0.05
+
+    con.register("syn_units", {
+        "i": index, "category_id": category, "mass_kg": mass_kg, "power_kw": power_kw,
+        "parent": parent, "is_assembly": ~leaf, "production_planet_id": planet,
+    })
+    con.register("syn_materials", {"m": np.arange(len(materials)), "material_id": np.array(materials, dtype=object)})
+    con.register("syn_edges", {"a": edge_assembly, "c": edge_component, "q": edge_quantity})
+    con.register("syn_bom", {"u": bom_unit, "m": bom_material, "w": bom_weight})
+
+    suffix = ".parquet" if fmt == "parquet" else ".csv"
+    write_table(con, f"""
+        SELECT {UNIT_ID.format('i')} AS id, category_id,
+               printf('Синтетическая единица %d', i) AS name_ru,
+               printf('Synthetic unit %d', i) AS name_en,
+               NULL::VARCHAR AS description_ru, NULL::VARCHAR AS description_en,
+               mass_kg::DECIMAL(18,3) AS mass_kg, power_kw::DECIMAL(18,3) AS power_kw,
+               CASE WHEN parent >= 0 THEN {UNIT_ID.format('parent')} END AS parent_id,
+               is_assembly, production_planet_id, NULL::VARCHAR AS sources,
+               NULL::DECIMAL(18,3) AS mass_kg_min, NULL::DECIMAL(18,3) AS mass_kg_max
+        FROM syn_units ORDER BY i
+    """, out_dir / f"units{suffix}", fmt)
+
+    # Доли округлены до 0.001 %, последняя строка добирает сумму ровно до 100
+    write_table(con, f"""
+        WITH rows AS (
+            SELECT u, m, SUM(w) AS w FROM syn_bom GROUP BY u, m
+        ), shares AS (
+            SELECT u, m,
+                   ROUND(100 * w / SUM(w) OVER (PARTITION BY u), 3)::DECIMAL(18,3) AS pct,
+                   row_number() OVER (PARTITION BY u ORDER BY m DESC) AS rn
+            FROM rows
+        )
+        SELECT {UNIT_ID.format('u')} AS unit_id, material_id,
+               CASE WHEN rn = 1 THEN 100 - (SUM(pct) OVER (PARTITION BY u) - pct) ELSE pct END
+                   AS fraction_pct,
+               NULL::DECIMAL(18,3) AS fraction_pct_min, NULL::DECIMAL(18,3) AS fraction_pct_max
+        FROM shares JOIN syn_materials USING (m)
+        ORDER BY u, m
+    """, out_dir / f"unit_materials{suffix}", fmt)
+
+    write_table(con, f"""
+        SELECT {UNIT_ID.format('a')} AS assembly_id, {UNIT_ID.format('c')} AS component_id,
+               SUM(q)::INTEGER AS quantity
+        FROM syn_edges GROUP BY a, c ORDER BY a, c
+    """, out_dir / f"unit_components{suffix}", fmt)
+
+    rows = {}
+    for table in REFERENCE_TABLES + GENERATED_TABLES:
+        rows[table] = con.execute(f"SELECT COUNT(*) FROM {reader(seed_file(out_dir, table))}").fetchone()[0]
+    con.close()
+
+    info = {
+        "units": units, "depth": depth, "fanout": fanout, "seed": seed,
+        "format": fmt, "leaf_share": leaf_share, "rows": rows,
+    }
+    (out_dir / "synth.json").write_text(json.dumps(info, ensure_ascii=False, indent=2) + "\n")
+    return info
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Генерация синтетического каталога «Гелиос»")
+    parser.add_argument("out_dir", type=Path, help="каталог для seed-файлов")
+    parser.add_argument("--units", type=int, default=10_000, help="число единиц (10³–10⁷)")
+    parser.add_argument("--depth", type=int, default=6, help="глубина DAG сборок")
+    parser.add_argument("--fanout", type=int, default=4, help="среднее число компонентов сборки")
+    parser.add_argument("--leaf-share", type=float, default=0.6, help="доля простых единиц")
+    parser.add_argument("--seed", type=int, default=0, help="зерно генератора")
+    parser.add_argument("--format", choices=("parquet", "csv"), default="parquet")
+    args = parser.parse_args(argv)
+
+    try:
+        info = generate(args.out_dir, args.units, args.depth, args.fanout,
+                        args.seed, args.format, args.leaf_share)
+    except ValueError as e:
+        print(f"ОШИБКА: {e}")
+        return 1
+
+    print(f"Синтетический каталог: {args.out_dir}")
+    for table, n in info["rows"].items():
+        print(f"  {table}: {n:,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
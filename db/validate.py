@@ -2,241 +2,543 @@
 """
 Валидация базы данных Гелиос.
 Проверяет целостность данных и предотвращает ошибки типа "BOM ≠ 100%".
+
+Проверки объявлены в реестре CHECKS. Проверки над одними и теми же
+таблицами слиты в один проход (scan_*), а сами проходы выполняются
+параллельно на отдельных курсорах одного соединения — полная валидация
+длится примерно столько, сколько самый медленный проход.
+
+Инкрементальный режим: после успешной проверки отпечатки единиц и материалов
+сохраняются в validation_state; следующая проверка перепроверяет только
+изменившиеся записи, а для единиц — ещё и их предков по unit_components.
 """
 
+import argparse
+import json
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import duckdb
 
+import profiling
+from profiling import profiler
+
 DB_PATH = Path(__file__).parent / "helios.duckdb"
 
+# Реестр: (заголовки проверок, функция прохода) в порядке вывода.
+# Функция получает курсор и область проверки (None — вся база, иначе
+# {"unit": [ID], "material": [ID]}) и возвращает {заголовок: [сообщения]};
+# для предупреждений — {заголовок: {ID записи: сообщение}}
+CHECKS = []
 
-def validate_bom_percentages(con) -> list[str]:
-    """Проверка: сумма BOM для каждого юнита = 100%"""
-    errors = []
+# Заголовки-предупреждения (не блокируют): заголовок → вид записей ('unit' | 'material')
+WARNINGS = {}
 
-    result = con.execute("""
-        SELECT
-            um.unit_id,
-            u.name_ru,
-            ROUND(SUM(um.fraction_pct), 2) as total_pct
-        FROM unit_materials um
-        JOIN units u ON u.id = um.unit_id
-        GROUP BY um.unit_id, u.name_ru
-        HAVING ABS(100 - SUM(um.fraction_pct)) > 0.1
-    """).fetchall()
 
-    for unit_id, name, total in result:
-        errors.append(f"  {unit_id} ({name}): {total}% вместо 100%")
+def in_scope(column, scope, kind):
+    """Условие WHERE, ограничивающее проход областью проверки, и его параметры"""
+    if scope is None:
+        return "TRUE", []
+    return f"{column} IN (SELECT unnest(?::VARCHAR[]))", [scope[kind]]
 
-    return errors
 
+def check(*titles, warnings=None, tables=()):
+    """
+    Регистрация прохода, выдающего результаты проверок titles и предупреждения warnings.
+    tables — все таблицы, которые читает проход (для числа строк в профиле).
+    Область проверки задаётся отпечатками записей (fingerprints): отпечаток
+    единицы включает её строки unit_materials и unit_components, так что
+    изменение только этих таблиц тоже перепроверяет единицу.
+    """
+    warnings = warnings or {}
 
-def validate_bom_references(con) -> list[str]:
-    """Проверка: все material_id и unit_id в BOM существуют"""
-    errors = []
+    def register(scan):
+        scan.tables = tables
+        CHECKS.append((titles + tuple(warnings), scan))
+        WARNINGS.update(warnings)
+        return scan
+    return register
 
-    # Несуществующие материалы
-    result = con.execute("""
-        SELECT DISTINCT um.material_id
-        FROM unit_materials um
-        LEFT JOIN materials m ON m.id = um.material_id
-        WHERE m.id IS NULL
-    """).fetchall()
-    for (mat_id,) in result:
-        errors.append(f"  material_id '{mat_id}' не существует")
 
-    # Несуществующие юниты
-    result = con.execute("""
-        SELECT DISTINCT um.unit_id
+@check("BOM: суммы = 100%", "BOM: ссылки на материалы/юниты",
+       tables=("unit_materials", "units", "materials"))
+def scan_unit_materials(con, scope=None) -> dict[str, list[str]]:
+    """Один проход по unit_materials: суммы BOM и ссылки на материалы/юниты"""
+    percentages, references = [], []
+    where, params = in_scope("um.unit_id", scope, "unit")
+
+    result = con.execute(f"""
+        SELECT
+            um.unit_id,
+            u.id IS NULL AS missing_unit,
+            any_value(u.name_ru) AS name_ru,
+            ROUND(SUM(um.fraction_pct), 2) AS total_pct,
+            list(DISTINCT um.material_id ORDER BY um.material_id)
+                FILTER (WHERE m.id IS NULL) AS missing_materials
         FROM unit_materials um
         LEFT JOIN units u ON u.id = um.unit_id
-        WHERE u.id IS NULL
-    """).fetchall()
-    for (unit_id,) in result:
-        errors.append(f"  unit_id '{unit_id}' не существует")
-
-    return errors
-
-
-def validate_assembly_references(con) -> list[str]:
-    """Проверка: ссылки в unit_components корректны"""
-    errors = []
-
-    # assembly_id должен быть сборкой
-    result = con.execute("""
-        SELECT DISTINCT uc.assembly_id, u.name_ru, u.is_assembly
-        FROM unit_components uc
-        JOIN units u ON u.id = uc.assembly_id
-        WHERE u.is_assembly = false
-    """).fetchall()
-    for assembly_id, name, _ in result:
-        errors.append(f"  {assembly_id} ({name}) — не сборка, но содержит компоненты")
+        LEFT JOIN materials m ON m.id = um.material_id
+        WHERE {where}
+        GROUP BY um.unit_id, u.id
+        HAVING u.id IS NULL
+            OR ABS(100 - SUM(um.fraction_pct)) > 0.1
+            OR bool_or(m.id IS NULL)
+        ORDER BY um.unit_id
+    """, params).fetchall()
+
+    missing_materials = set()
+    for unit_id, missing_unit, name, total, materials in result:
+        if missing_unit:
+            references.append(f"  unit_id '{unit_id}' не существует")
+        elif abs(100 - total) > 0.1:
+            percentages.append(f"  {unit_id} ({name}): {total}% вместо 100%")
+        missing_materials.update(materials or ())
+
+    references[:0] = [f"  material_id '{mat_id}' не существует"
+                      for mat_id in sorted(missing_materials)]
+
+    return {
+        "BOM: суммы = 100%": percentages,
+        "BOM: ссылки на материалы/юниты": references,
+    }
+
+
+@check("Сборки: ссылки на компоненты", "Сборки: циклические зависимости",
+       tables=("unit_components", "units"))
+def scan_unit_components(con, scope=None) -> dict[str, list[str]]:
+    """
+    Один проход по unit_components: ссылки сборок и циклы.
+    Новый цикл проходит через изменённую сборку, а все его узлы — её предки,
+    поэтому в инкрементальном режиме достаточно рёбер области проверки.
+    """
+    references = []
+    where, params = in_scope("uc.assembly_id", scope, "unit")
 
-    # component_id должен существовать
-    result = con.execute("""
-        SELECT DISTINCT uc.component_id
+    edges = con.execute(f"""
+        SELECT uc.assembly_id, uc.component_id,
+               a.is_assembly, a.name_ru, c.id IS NULL AS missing_component
         FROM unit_components uc
-        LEFT JOIN units u ON u.id = uc.component_id
-        WHERE u.id IS NULL
-    """).fetchall()
-    for (comp_id,) in result:
-        errors.append(f"  component_id '{comp_id}' не существует")
-
-    return errors
-
-
-def validate_circular_dependencies(con) -> list[str]:
-    """Проверка: нет циклических зависимостей в сборках"""
-    errors = []
-
-    # Получаем все связи
-    edges = con.execute("""
-        SELECT assembly_id, component_id FROM unit_components
-    """).fetchall()
-
-    # Строим граф
-    graph = {}
-    for assembly, component in edges:
-        if assembly not in graph:
-            graph[assembly] = []
-        graph[assembly].append(component)
-
-    # DFS для поиска циклов
-    def has_cycle(node, visited, rec_stack, path):
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                cycle = has_cycle(neighbor, visited, rec_stack, path)
-                if cycle:
-                    return cycle
-            elif neighbor in rec_stack:
-                # Нашли цикл
-                cycle_start = path.index(neighbor)
-                return path[cycle_start:] + [neighbor]
-
-        path.pop()
-        rec_stack.remove(node)
-        return None
-
-    visited = set()
-    for node in graph:
-        if node not in visited:
-            cycle = has_cycle(node, visited, set(), [])
-            if cycle:
-                errors.append(f"  Цикл: {' → '.join(cycle)}")
-                break
-
-    return errors
-
-
-def validate_planet_materials(con) -> list[str]:
-    """Проверка: все материалы (кроме категорий) привязаны к планетам"""
-    errors = []
+        LEFT JOIN units a ON a.id = uc.assembly_id
+        LEFT JOIN units c ON c.id = uc.component_id
+        WHERE {where}
+        ORDER BY uc.assembly_id, uc.component_id
+    """, params).fetchall()
+
+    # assembly_id должен быть сборкой, component_id должен существовать
+    not_assemblies = {}
+    missing = set()
+    for assembly_id, component_id, is_assembly, name, missing_component in edges:
+        if is_assembly is False:
+            not_assemblies[assembly_id] = name
+        if missing_component:
+            missing.add(component_id)
+    for assembly_id, name in not_assemblies.items():
+        references.append(f"  {assembly_id} ({name}) — не сборка, но содержит компоненты")
+    for comp_id in sorted(missing):
+        references.append(f"  component_id '{comp_id}' не существует")
+
+    return {
+        "Сборки: ссылки на компоненты": references,
+        "Сборки: циклические зависимости": [format_cycle(found) for found in find_cycles(edges)],
+    }
+
+
+def strongly_connected(edges) -> list[list[str]]:
+    """
+    Циклические компоненты сильной связности графа сборок — итеративный
+    алгоритм Тарьяна, O(V + E), без рекурсии. Компонента циклическая,
+    если в ней ≥ 2 единиц или есть петля (сборка содержит саму себя).
+    """
+    ids, number = [], {}
+    adjacency, loops = [], set()
+    for assembly, component, *_ in edges:
+        for unit_id in (assembly, component):
+            if unit_id not in number:
+                number[unit_id] = len(ids)
+                ids.append(unit_id)
+                adjacency.append([])
+        a, c = number[assembly], number[component]
+        adjacency[a].append(c)
+        if a == c:
+            loops.add(a)
+
+    index = [-1] * len(ids)
+    low = [0] * len(ids)
+    on_stack = [False] * len(ids)
+    stack, components, counter = [], [], 0
+
+    for root in range(len(ids)):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, 0)]  # (узел, следующее ребро)
+        while work:
+            v, i = work[-1]
+            if i < len(adjacency[v]):
+                work[-1] = (v, i + 1)
+                w = adjacency[v][i]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, 0))
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+            if low[v] == index[v]:
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component.append(w)
+                    if w == v:
+                        break
+                if len(component) > 1 or v in loops:
+                    components.append(sorted(ids[w] for w in component))
+
+    return sorted(components)
+
+
+def cycle_through(edges_from, members) -> list[str]:
+    """Один конкретный цикл внутри компоненты: BFS от первой единицы до неё же"""
+    start = members[0]
+    inside = set(members)
+    parent = {}
+    queue = deque([start])
+    while queue:
+        v = queue.popleft()
+        for w in edges_from.get(v, ()):
+            if w not in inside or w in parent:
+                continue
+            parent[w] = v
+            if w == start:
+                path = [start]
+                while path[-1] != start or len(path) == 1:
+                    path.append(parent[path[-1]])
+                return path[::-1]
+            queue.append(w)
+    return [start, start]
+
+
+def find_cycles(edges) -> list[dict]:
+    """
+    Все циклы графа сборок одним проходом:
+    [{"units": [единицы компоненты], "cycle": [A, B, ..., A]}]
+    """
+    components = strongly_connected(edges)
+    if not components:
+        return []
+    edges_from = {}
+    for assembly, component, *_ in edges:
+        edges_from.setdefault(assembly, []).append(component)
+    return [{"units": members, "cycle": cycle_through(edges_from, members)}
+            for members in components]
+
+
+def format_cycle(found) -> str:
+    """Сообщение о цикле: путь и, если компонента шире пути, её состав"""
+    message = f"  Цикл: {' → '.join(found['cycle'])}"
+    extra = len(found["units"]) - (len(found["cycle"]) - 1)
+    if extra > 0:
+        shown = ", ".join(found["units"][:10])
+        more = "…" if len(found["units"]) > 10 else ""
+        message += f" (компонента из {len(found['units'])} ед.: {shown}{more})"
+    return message
+
+
+def cycles(con) -> list[dict]:
+    """Циклы в unit_components, см. find_cycles"""
+    edges = con.execute("SELECT assembly_id, component_id FROM unit_components").fetchall()
+    return find_cycles(edges)
+
+
+@check("Материалы: привязка к планетам", warnings={"Неиспользуемые материалы": "material"},
+       tables=("materials", "planet_materials", "unit_materials"))
+def scan_materials(con, scope=None) -> dict:
+    """Один проход по materials: привязка к планетам и использование в BOM"""
+    unbound, unused = [], {}
+    where, params = in_scope("m.id", scope, "material")
 
     # Исключаем категории (parent_id IS NULL)
-    result = con.execute("""
-        SELECT m.id, m.name_ru
+    result = con.execute(f"""
+        SELECT m.id, m.name_ru,
+               EXISTS (SELECT 1 FROM planet_materials pm WHERE pm.material_id = m.id) AS bound,
+               EXISTS (SELECT 1 FROM unit_materials um WHERE um.material_id = m.id) AS used
         FROM materials m
-        LEFT JOIN planet_materials pm ON pm.material_id = m.id
-        WHERE pm.material_id IS NULL
-          AND m.parent_id IS NOT NULL
-    """).fetchall()
-
-    for mat_id, name in result:
-        errors.append(f"  {mat_id} ({name}) — не привязан ни к одной планете")
-
-    return errors
-
-
-def validate_units_have_bom(con) -> list[str]:
+        WHERE m.parent_id IS NOT NULL
+          AND (NOT bound OR NOT used)
+          AND {where}
+        ORDER BY m.id
+    """, params).fetchall()
+
+    for mat_id, name, bound, used in result:
+        if not bound:
+            unbound.append(f"  {mat_id} ({name}) — не привязан ни к одной планете")
+        if not used:
+            unused[mat_id] = f"  {mat_id} ({name}) — не используется"
+
+    return {
+        "Материалы: привязка к планетам": unbound,
+        "Неиспользуемые материалы": unused,
+    }
+
+
+@check("Юниты: наличие BOM", tables=("units", "unit_materials"))
+def scan_units(con, scope=None) -> dict[str, list[str]]:
     """Проверка: все местные простые юниты имеют BOM"""
     errors = []
+    where, params = in_scope("u.id", scope, "unit")
 
     # Исключаем импортные юниты (production_planet_id = 'earth')
     # и сборки (is_assembly = true)
-    result = con.execute("""
+    result = con.execute(f"""
         SELECT u.id, u.name_ru
         FROM units u
-        LEFT JOIN unit_materials um ON um.unit_id = u.id
-        WHERE um.unit_id IS NULL
+        WHERE NOT EXISTS (SELECT 1 FROM unit_materials um WHERE um.unit_id = u.id)
           AND u.is_assembly = false
           AND u.production_planet_id != 'earth'
-    """).fetchall()
+          AND {where}
+        ORDER BY u.id
+    """, params).fetchall()
 
     for unit_id, name in result:
         errors.append(f"  {unit_id} ({name}) — нет BOM")
 
-    return errors
+    return {"Юниты: наличие BOM": errors}
 
 
-def validate_unused_materials(con) -> list[str]:
-    """Предупреждение: неиспользуемые материалы (кроме категорий)"""
-    warnings = []
-
-    # Исключаем категории (parent_id IS NULL)
-    result = con.execute("""
-        SELECT m.id, m.name_ru
+@check("Диапазоны оценок: min ≤ значение ≤ max", tables=("units", "unit_materials"))
+def scan_ranges(con, scope=None) -> dict[str, list[str]]:
+    """Необязательные диапазоны mass_kg и fraction_pct: заданы парой и содержат точечную оценку"""
+    errors = []
+    where, params = in_scope("unit_id", scope, "unit")
+
+    result = con.execute(f"""
+        SELECT unit_id, parameter, low, value, high FROM (
+            SELECT id AS unit_id, 'mass_kg' AS parameter,
+                   mass_kg_min AS low, mass_kg AS value, mass_kg_max AS high
+            FROM units
+            UNION ALL
+            SELECT unit_id, 'fraction_pct ' || material_id,
+                   fraction_pct_min, fraction_pct, fraction_pct_max
+            FROM unit_materials
+        )
+        WHERE (low IS NOT NULL OR high IS NOT NULL)
+          AND (low IS NULL OR high IS NULL OR value IS NULL
+               OR NOT (low <= value AND value <= high) OR low < 0)
+          AND {where}
+        ORDER BY unit_id, parameter
+    """, params).fetchall()
+
+    for unit_id, parameter, low, value, high in result:
+        errors.append(f"  {unit_id} {parameter}: {value} вне диапазона [{low}, {high}]")
+
+    return {"Диапазоны оценок: min ≤ значение ≤ max": errors}
+
+
+def fingerprints(con):
+    """
+    Отпечатки записей во временную таблицу validation_current (kind, id, fingerprint).
+    Единица — строка units, её BOM и прямые компоненты;
+    материал — строка materials, его планеты и единицы, где он используется.
+    """
+    con.execute("""
+        CREATE OR REPLACE TEMP TABLE validation_current AS
+        SELECT 'unit' AS kind, u.id, md5(concat_ws('|', u::VARCHAR,
+            (SELECT string_agg(um::VARCHAR, ';' ORDER BY um.material_id)
+             FROM unit_materials um WHERE um.unit_id = u.id),
+            (SELECT string_agg(uc::VARCHAR, ';' ORDER BY uc.component_id)
+             FROM unit_components uc WHERE uc.assembly_id = u.id))) AS fingerprint
+        FROM units u
+        UNION ALL
+        SELECT 'material', m.id, md5(concat_ws('|', m::VARCHAR,
+            (SELECT string_agg(pm::VARCHAR, ';' ORDER BY pm.planet_id)
+             FROM planet_materials pm WHERE pm.material_id = m.id),
+            (SELECT string_agg(um.unit_id, ';' ORDER BY um.unit_id)
+             FROM unit_materials um WHERE um.material_id = m.id)))
         FROM materials m
-        LEFT JOIN unit_materials um ON um.material_id = m.id
-        WHERE um.material_id IS NULL
-          AND m.parent_id IS NOT NULL
-    """).fetchall()
+    """)
 
-    for mat_id, name in result:
-        warnings.append(f"  {mat_id} ({name}) — не используется")
 
-    return warnings
+def changed_records(con) -> list[tuple[str, str]]:
+    """Записи, отпечаток которых отличается от последней успешной проверки (включая новые и удалённые)"""
+    return con.execute("""
+        SELECT coalesce(c.kind, s.kind), coalesce(c.id, s.id)
+        FROM validation_current c
+        FULL JOIN validation_state s ON s.kind = c.kind AND s.id = c.id
+        WHERE c.fingerprint IS DISTINCT FROM s.fingerprint
+    """).fetchall()
 
 
-def validate(db_path: Path = DB_PATH, verbose: bool = True) -> bool:
+def changed_scope(con, changed) -> dict[str, list[str]]:
+    """Область проверки: изменённые материалы, изменённые единицы и их предки"""
+    units = sorted(record_id for kind, record_id in changed if kind == "unit")
+    ancestors = con.execute("""
+        WITH RECURSIVE affected(id) AS (
+            SELECT unnest(?::VARCHAR[])
+            UNION
+            SELECT uc.assembly_id
+            FROM unit_components uc
+            JOIN affected a ON uc.component_id = a.id
+        )
+        SELECT id FROM affected ORDER BY id
+    """, [units]).fetchall() if units else []
+    return {
+        "unit": [unit_id for (unit_id,) in ancestors],
+        "material": sorted(record_id for kind, record_id in changed if kind == "material"),
+    }
+
+
+def kept_warnings(con, kind, scope) -> dict[str, str]:
+    """Сохранённые предупреждения по записям вне области проверки"""
+    return dict(con.execute("""
+        SELECT s.id, s.warning
+        FROM validation_state s
+        JOIN validation_current c ON c.kind = s.kind AND c.id = s.id
+        WHERE s.kind = ? AND s.warning IS NOT NULL
+          AND s.id NOT IN (SELECT unnest(?::VARCHAR[]))
+    """, [kind, scope[kind]]).fetchall())
+
+
+def save_state(con, scope, warnings):
+    """
+    Запись отпечатков из validation_current в validation_state — для записей
+    области проверки (scope=None — все) — и их предупреждений
+    """
+    if scope is None:
+        con.execute("DELETE FROM validation_state")
+        con.execute("INSERT INTO validation_state (kind, id, fingerprint) "
+                    "SELECT kind, id, fingerprint FROM validation_current")
+    else:
+        keys = [(kind, record_id) for kind, ids in scope.items() for record_id in ids]
+        params = [[kind for kind, _ in keys], [record_id for _, record_id in keys]]
+        con.execute("""
+            DELETE FROM validation_state
+            WHERE (kind, id) IN (SELECT (unnest(?::VARCHAR[]), unnest(?::VARCHAR[])))
+        """, params)
+        con.execute("""
+            INSERT INTO validation_state (kind, id, fingerprint)
+            SELECT kind, id, fingerprint FROM validation_current
+            WHERE (kind, id) IN (SELECT (unnest(?::VARCHAR[]), unnest(?::VARCHAR[])))
+        """, params)
+
+    if warnings:
+        keys = sorted(warnings)
+        con.execute("""
+            UPDATE validation_state s SET warning = w.warning
+            FROM (SELECT unnest(?::VARCHAR[]) AS kind, unnest(?::VARCHAR[]) AS id,
+                         unnest(?::VARCHAR[]) AS warning) w
+            WHERE s.kind = w.kind AND s.id = w.id
+        """, [[kind for kind, _ in keys], [record_id for _, record_id in keys],
+              [warnings[key] for key in keys]])
+
+
+def run_checks(con, scope=None) -> dict:
+    """Все проходы реестра параллельно, каждый на своём курсоре"""
+    def run(scan):
+        cursor = con.cursor()
+        try:
+            rows = None
+            if profiler.enabled and scan.tables:
+                rows = sum(cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                           for table in scan.tables)
+            with profiler.phase(f"validate.{scan.__name__}", rows):
+                return scan(cursor, scope)
+        finally:
+            cursor.close()
+
+    with ThreadPoolExecutor(max_workers=len(CHECKS)) as pool:
+        results = list(pool.map(run, [scan for _, scan in CHECKS]))
+
+    return {title: found for result in results for title, found in result.items()}
+
+
+def validate(db_path: Path = DB_PATH, verbose: bool = True, con=None,
+             incremental: bool = False) -> bool:
     """
     Запуск всех проверок.
+    con — уже открытое соединение (например, из init_db.py); иначе
+    база открывается только для чтения (для incremental — на запись).
+    incremental — перепроверить только изменившееся с последней успешной
+    проверки; при успехе состояние сохраняется в validation_state.
     Возвращает True если база валидна, False если есть ошибки.
     """
-    if not db_path.exists():
-        print(f"❌ База данных не найдена: {db_path}")
-        return False
-
-    con = duckdb.connect(str(db_path), read_only=True)
-
-    if verbose:
-        print("Валидация базы данных...")
-
-    all_valid = True
-
-    # Критические проверки (блокируют)
-    checks = [
-        ("BOM: суммы = 100%", validate_bom_percentages),
-        ("BOM: ссылки на материалы/юниты", validate_bom_references),
-        ("Сборки: ссылки на компоненты", validate_assembly_references),
-        ("Сборки: циклические зависимости", validate_circular_dependencies),
-        ("Материалы: привязка к планетам", validate_planet_materials),
-        ("Юниты: наличие BOM", validate_units_have_bom),
-    ]
-
-    for name, check_fn in checks:
-        errors = check_fn(con)
-        if errors:
-            print(f"❌ {name}")
-            for err in errors:
-                print(err)
-            all_valid = False
-        elif verbose:
-            print(f"✓ {name}")
-
-    # Предупреждения (не блокируют)
-    warnings = validate_unused_materials(con)
-    if warnings and verbose:
-        print(f"⚠ Неиспользуемые материалы ({len(warnings)})")
-        for w in warnings:
-            print(w)
-
-    con.close()
+    own = con is None
+    if own:
+        if not db_path.exists():
+            print(f"❌ База данных не найдена: {db_path}")
+            return False
+        con = duckdb.connect(str(db_path), read_only=not incremental)
+
+    try:
+        scope = None
+        if incremental:
+            with profiler.phase("validate.fingerprints"):
+                fingerprints(con)
+            if con.execute("SELECT COUNT(*) FROM validation_state").fetchone()[0]:
+                # Удалённые записи тоже попадают в область — их состояние стирается
+                scope = changed_scope(con, changed_records(con))
+
+        if verbose:
+            if scope is None:
+                print("Валидация базы данных...")
+            else:
+                print(f"Валидация базы данных (инкрементально: единиц с предками — "
+                      f"{len(scope['unit'])}, материалов — {len(scope['material'])})...")
+
+        results = run_checks(con, scope)
+
+        # Предупреждения по записям вне области проверки не изменились
+        if scope is not None:
+            for title, kind in WARNINGS.items():
+                results[title] = {**kept_warnings(con, kind, scope), **results[title]}
+
+        all_valid = True
+        for titles, _ in CHECKS:
+            for name in titles:
+                if name in WARNINGS:
+                    continue
+                errors = results[name]
+                if errors:
+                    print(f"❌ {name}")
+                    for err in errors:
+                        print(err)
+                    all_valid = False
+                elif verbose:
+                    print(f"✓ {name}")
+
+        # Предупреждения (не блокируют)
+        for titles, _ in CHECKS:
+            for name in titles:
+                warnings = results[name]
+                if name in WARNINGS and warnings and verbose:
+                    print(f"⚠ {name} ({len(warnings)})")
+                    for _, w in sorted(warnings.items()):
+                        print(w)
+
+        if incremental and all_valid:
+            rewritten = scope and {kind: set(ids) for kind, ids in scope.items()}
+            with profiler.phase("validate.save_state"):
+                save_state(con, scope, {
+                    (kind, record_id): warning
+                    for name, kind in WARNINGS.items()
+                    for record_id, warning in results[name].items()
+                    if rewritten is None or record_id in rewritten[kind]
+                })
+    finally:
+        if own:
+            con.close()
 
     if verbose:
         if all_valid:
@@ -247,6 +549,32 @@ def validate(db_path: Path = DB_PATH, verbose: bool = True) -> bool:
     return all_valid
 
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Валидация базы данных «Гелиос»")
+    parser.add_argument("--incremental", action="store_true",
+                        help="перепроверить только изменившееся с последней успешной проверки")
+    parser.add_argument("--db", type=Path, default=DB_PATH,
+                        help="файл базы данных (по умолчанию db/helios.duckdb)")
+    parser.add_argument("--cycles", action="store_true",
+                        help="вывести все циклы unit_components в JSON и выйти")
+    profiling.add_argument(parser)
+    args = parser.parse_args(argv)
+    profiling.configure(args.profile)
+
+    if args.cycles:
+        if not args.db.exists():
+            print(f"❌ База данных не найдена: {args.db}", file=sys.stderr)
+            return 1
+        con = duckdb.connect(str(args.db), read_only=True)
+        found = cycles(con)
+        con.close()
+        print(json.dumps(found, ensure_ascii=False))
+        return 1 if found else 0
+
+    valid = validate(args.db, incremental=args.incremental)
+    profiler.finish("validate")
+    return 0 if valid else 1
+
+
 if __name__ == "__main__":
-    valid = validate()
-    sys.exit(0 if valid else 1)
+    sys.exit(main())
@@ -1,9 +1,9 @@
 const DATA = {
-  planets: [{"id": "earth", "name": "Земля", "gravity_m_s2": 9.81, "solar_constant_w_m2": 1361.0, "escape_velocity_km_s": 11.2, "has_atmosphere": true, "sources": ["https://nssdc.gsfc.nasa.gov/planetary/factsheet/earthfact.html"]}, {"id": "mercury", "name": "Меркурий", "gravity_m_s2": 3.7, "solar_constant_w_m2": 10343.0, "escape_velocity_km_s": 4.25, "has_atmosphere": false, "sources": ["https://messenger.jhuapl.edu/", "Nittler et al. 2011 - Surface composition", "Peplowski et al. 2015 - Elemental abundances"]}, {"id": "moon", "name": "Луна", "gravity_m_s2": 1.62, "solar_constant_w_m2": 1361.0, "escape_velocity_km_s": 2.38, "has_atmosphere": false, "sources": ["https://www.lpi.usra.edu/lunar/samples/", "Taylor 1982 - Planetary Science", "LROC - Lunar Reconnaissance Orbiter Camera"]}, {"id": "mars", "name": "Марс", "gravity_m_s2": 3.71, "solar_constant_w_m2": 589.0, "escape_velocity_km_s": 5.03, "has_atmosphere": true, "sources": ["https://mars.nasa.gov/", "Rieder et al. 2004 - Mars Pathfinder soil composition", "ESA Mars Express data"]}],
-  materials: [{"id": "MAT-METAL", "parent_id": null, "name": "Металлы", "symbol": null, "description": "Металлы и сплавы", "criticality": null, "sources": []}, {"id": "MAT-NONMETAL", "parent_id": null, "name": "Неметаллы", "symbol": null, "description": "Неметаллические элементы и соединения", "criticality": null, "sources": []}, {"id": "MAT-COMPOUND", "parent_id": null, "name": "Соединения", "symbol": null, "description": "Сплавы и химические соединения", "criticality": null, "sources": []}, {"id": "MAT-AL", "parent_id": "MAT-METAL", "name": "Алюминий", "symbol": "Al", "description": "Зеркала, корпуса, радиаторы, фольга для куполов", "criticality": "critical", "sources": ["CHALCO — фольга 4.5 мкм", "Novelis — промышленная фольга", "ALCOA — aerospace aluminium"]}, {"id": "MAT-FE", "parent_id": "MAT-METAL", "name": "Железо", "symbol": "Fe", "description": "Рамы, шасси, конструкции", "criticality": "critical", "sources": ["ArcelorMittal — конструкционная сталь", "POSCO — автоматизированное производство"]}, {"id": "MAT-FE-MN", "parent_id": "MAT-FE", "name": "Сталь Fe-6%Mn", "symbol": null, "description": "Прочная сталь без углерода, легированная марганцем", "criticality": "high", "sources": ["ASTM A128 — Hadfield steel standard", "Metso Outotec — износостойкие стали"]}, {"id": "MAT-MG", "parent_id": "MAT-METAL", "name": "Магний", "symbol": "Mg", "description": "Лёгкие сплавы, пиротехника", "criticality": "high", "sources": ["US Magnesium — электролизное производство", "Magontec — сплавы"]}, {"id": "MAT-TI", "parent_id": "MAT-METAL", "name": "Титан", "symbol": "Ti", "description": "Электрохромика зеркал, прочные узлы", "criticality": "medium", "sources": ["VSMPO-AVISMA — титановые сплавы", "ATI — aerospace titanium"]}, {"id": "MAT-NA", "parent_id": "MAT-METAL", "name": "Натрий", "symbol": "Na", "description": "Батареи NaS (анод)", "criticality": "high", "sources": ["Chemours — промышленный натрий", "NGK Insulators — NaS технология"]}, {"id": "MAT-MN", "parent_id": "MAT-METAL", "name": "Марганец", "symbol": "Mn", "description": "Легирование стали Fe-6%Mn", "criticality": "medium", "sources": ["South32 — добыча марганца", "ERAMET — ферросплавы"]}, {"id": "MAT-IR", "parent_id": "MAT-METAL", "name": "Иридий", "symbol": "Ir", "description": "Аноды MRE-ячеек (устойчивость к расплаву)", "criticality": "medium", "sources": ["Johnson Matthey — платиновые металлы", "Heraeus — иридиевые аноды"]}, {"id": "MAT-CU", "parent_id": "MAT-METAL", "name": "Медь", "symbol": "Cu", "description": "Обмотки моторов Gen-1 (земное производство)", "criticality": "high", "sources": ["Codelco — электролитическая медь", "Freeport-McMoRan"]}, {"id": "MAT-O2", "parent_id": "MAT-NONMETAL", "name": "Кислород", "symbol": "O₂", "description": "Главный продукт MRE, побочный продукт", "criticality": "critical", "sources": ["Linde — промышленный кислород", "Air Liquide — криогенное разделение"]}, {"id": "MAT-SI", "parent_id": "MAT-NONMETAL", "name": "Кремний", "symbol": "Si", "description": "Стекловолокно, электроника, солнечные панели", "criticality": "critical", "sources": ["Wacker Chemie — поликремний", "LONGi — солнечный Si", "Owens Corning — стекловолокно"]}, {"id": "MAT-S", "parent_id": "MAT-NONMETAL", "name": "Сера", "symbol": "S", "description": "Батареи NaS (катод)", "criticality": "high", "sources": ["BASF — промышленная сера", "Claus process — побочный продукт"]}, {"id": "MAT-C", "parent_id": "MAT-NONMETAL", "name": "Углерод/Графит", "symbol": "C", "description": "Композиты, восстановитель Ti, термозащита", "criticality": "high", "sources": ["SGL Carbon — графитовые материалы", "Toray — углеродное волокно"]}, {"id": "MAT-K", "parent_id": "MAT-NONMETAL", "name": "Калий", "symbol": "K", "description": "Удобрения, химические процессы", "criticality": "low", "sources": ["Nutrien — добыча калия", "K+S — хлорид калия"]}, {"id": "MAT-NAK", "parent_id": "MAT-COMPOUND", "name": "Натрий-калий", "symbol": "NaK", "description": "Теплоноситель (-12°C...+785°C)", "criticality": "high", "sources": ["DOE — Sodium Technology Handbook", "ESA Bepi-Colombo — NaK cooling"]}, {"id": "MAT-MOS2", "parent_id": "MAT-COMPOUND", "name": "Дисульфид молибдена", "symbol": "MoS₂", "description": "Смазка для вакуума", "criticality": "medium", "sources": ["Dow Corning — Molykote", "NASA — vacuum lubricants"]}, {"id": "MAT-GAAS", "parent_id": "MAT-COMPOUND", "name": "Арсенид галлия", "symbol": "GaAs", "description": "Высокоэффективные фотоячейки (импорт)", "criticality": "high", "sources": ["Spectrolab — космические GaAs ячейки", "SolAero — multi-junction cells"]}, {"id": "MAT-AL2O3", "parent_id": "MAT-COMPOUND", "name": "Оксид алюминия", "symbol": "Al₂O₃", "description": "Керамика, бета-глинозём для NaS", "criticality": "medium", "sources": ["NGK Insulators — beta-alumina для NaS", "CoorsTek — техническая керамика"]}, {"id": "MAT-MGO", "parent_id": "MAT-COMPOUND", "name": "Оксид магния", "symbol": "MgO", "description": "Тугоплавкая керамика для тиглей и футеровки (Tпл=2852°C). Местное производство: Mg из реголита (8%, вакуумная дистилляция шлака MRE), окисление → MgO", "criticality": "medium", "sources": ["Magnesium oxide refractory", "Mercury regolith processing"]}, {"id": "MAT-TIO2", "parent_id": "MAT-COMPOUND", "name": "Диоксид титана", "symbol": "TiO₂", "description": "Электрохромика зеркал", "criticality": "medium", "sources": ["IKAROS (JAXA 2010) — TiO₂ электрохромика в космосе", "Gentex — автомобильная электрохромика"]}, {"id": "MAT-LI", "parent_id": "MAT-METAL", "name": "Литий", "symbol": "Li", "description": "Li-ion батареи Gen-1 (импорт)", "criticality": "high", "sources": ["Albemarle — литиевые соединения", "CATL — Li-ion батареи", "Panasonic — Tesla cells"]}, {"id": "MAT-KEVLAR", "parent_id": "MAT-NONMETAL", "name": "Кевлар", "symbol": null, "description": "Армирование конструкций Gen-1 (импорт)", "criticality": "medium", "sources": ["DuPont — Kevlar aramid fiber", "Teijin — Twaron"]}, {"id": "MAT-CFRP", "parent_id": "MAT-COMPOUND", "name": "Углепластик", "symbol": "CFRP", "description": "Корпуса Gen-1 (импорт)", "criticality": "medium", "sources": ["Toray — T700/T800 carbon fiber", "Hexcel — aerospace CFRP", "SpaceX Dragon — CFRP capsule"]}, {"id": "MAT-SI3N4", "parent_id": "MAT-COMPOUND", "name": "Нитрид кремния", "symbol": "Si₃N₄", "description": "Керамические фрезы для CNC (местное производство из Si + N₂)", "criticality": "medium", "sources": ["Sandvik ceramic cutting tools", "3M Silicon Nitride", "PMC: Si₃N₄ machining tools"]}],
-  categories: [{"id": "robots", "name": "Роботы"}, {"id": "facilities", "name": "Объекты/Заводы"}, {"id": "equipment", "name": "Оборудование"}, {"id": "products", "name": "Продукция"}, {"id": "transport", "name": "Транспорт/Контейнеры"}],
-  units: [{"id": "ROB-011", "category_id": "robots", "name": "Паук-З (Spider-Z)", "description": "Разведчик, альпинист, 4 ноги, камеры", "mass_kg": 82.0, "power_kw": 3.0, "parent_id": null, "is_assembly": true, "production_planet_id": "earth", "sources": ["Boston Dynamics Spot — 4-leg robot", "NASA LEMUR — climbing robot"]}, {"id": "ROB-012", "category_id": "robots", "name": "Краб-З (Crab-Z)", "description": "Тяжёлый грузчик, 6 ног, 2 т груз", "mass_kg": 950.0, "power_kw": 25.0, "parent_id": null, "is_assembly": true, "production_planet_id": "earth", "sources": ["ANYbotics ANYmal — промышленный 4-leg", "Agility Robotics Digit — logistics robot"]}, {"id": "ROB-013", "category_id": "robots", "name": "Кентавр-З (Centaur-Z)", "description": "Техник-манипулятор, 4 ноги + 2 руки", "mass_kg": 150.0, "power_kw": 12.0, "parent_id": null, "is_assembly": true, "production_planet_id": "earth", "sources": ["NASA Robonaut — humanoid manipulator", "ABB YuMi — collaborative robot"]}, {"id": "ROB-014", "category_id": "robots", "name": "Крот-З (Mole-Z)", "description": "Экскаватор, гусеницы, ковш", "mass_kg": 800.0, "power_kw": 30.0, "parent_id": null, "is_assembly": true, "production_planet_id": "earth", "sources": ["Caterpillar 320F — compact excavator", "Komatsu PC200 — hydraulic excavator"]}, {"id": "ROB-015", "category_id": "robots", "name": "Манипулятор Ф-А1", "description": "Стационарный манипулятор первого завода", "mass_kg": 250.0, "power_kw": 8.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "earth", "sources": ["FANUC M-2000iA — heavy payload robot", "KUKA KR 1000 titan — industrial manipulator"]}, {"id": "ROB-021", "category_id": "robots", "name": "Краб-М (Crab-M)", "description": "Логист Gen-2, 6 колёс, 5 т груз, NaS батарея", "mass_kg": 1000.0, "power_kw": 30.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Caterpillar Command — autonomous mining", "Rio Tinto autonomous trucks"]}, {"id": "ROB-022", "category_id": "robots", "name": "Кентавр-М (Centaur-M)", "description": "Сборщик Gen-2, 4 колеса + 2 руки, лёгкий", "mass_kg": 380.0, "power_kw": 12.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["NASA Mars rovers — autonomous operation", "Boston Dynamics Stretch — warehouse robot"]}, {"id": "ROB-023", "category_id": "robots", "name": "Крот-М (Mole-M)", "description": "Добытчик Gen-2, 6 колёс, 600 т/день", "mass_kg": 1500.0, "power_kw": 40.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Komatsu autonomous haul trucks", "Sandvik AutoMine — underground mining"]}, {"id": "FAC-001", "category_id": "facilities", "name": "Точка Ноль", "description": "Основной завод на северном полюсе Меркурия, 1500 м²", "mass_kg": null, "power_kw": 55000.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["SpaceX Starbase — automated factory concept", "Tesla Gigafactory — robotic manufacturing"]}, {"id": "FAC-002", "category_id": "facilities", "name": "Комплекс Карбон-Север", "description": "Мини-завод по добыче графита (LRM, полярный кратер)", "mass_kg": null, "power_kw": 5000.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["MESSENGER — Mercury LRM deposits data", "Apollo 17 — lunar graphite studies"]}, {"id": "FAC-003", "category_id": "facilities", "name": "Комплекс Карбон-Юг", "description": "Мини-завод по добыче графита (LRM, полярный кратер)", "mass_kg": null, "power_kw": 5000.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["MESSENGER — Mercury LRM deposits data", "Apollo 17 — lunar graphite studies"]}, {"id": "FAC-004", "category_id": "facilities", "name": "Гелио-башня", "description": "Концентратор солнечной энергии на вершине кратера, 10 МВт", "mass_kg": 50000.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Odeillo Solar Furnace (France) — 1 MW", "DLR Solar Tower Jülich — concentrated solar"]}, {"id": "HUB-001", "category_id": "facilities", "name": "Хаб приёма энергии", "description": "LSP станции на Луне + ректенны на Земле, 6400 км² фотовольтаики (40 станций), 10000 км² ректенн", "mass_kg": 177600000.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "moon", "sources": ["hub.qmd — архитектура LSP", "Lunar Solar Power (Criswell, 1980s)", "Space-Based Solar Power (NASA studies)"]}, {"id": "EQU-021", "category_id": "equipment", "name": "Виброгрохот", "description": "Грохочение реголита, разделение фракций", "mass_kg": 500.0, "power_kw": 10.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Metso Outotec — vibrating screens", "Sandvik — mining equipment"]}, {"id": "EQU-004", "category_id": "equipment", "name": "Щековая дробилка", "description": "Дробление реголита <10мм", "mass_kg": 3000.0, "power_kw": 50.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Metso Lokotrack — mobile crusher", "Sandvik QJ341 — jaw crusher"]}, {"id": "EQU-005", "category_id": "equipment", "name": "Магнитный сепаратор", "description": "Разделение магнитной/немагнитной фракций", "mass_kg": 500.0, "power_kw": 20.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Eriez — magnetic separation", "STEINERT — sensor-based sorting"]}, {"id": "EQU-003", "category_id": "equipment", "name": "Солнечная печь", "description": "Концентратор для плавки реголита 1500°C", "mass_kg": 2000.0, "power_kw": null, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Odeillo (France) — 1 MW solar furnace", "DLR Cologne — high-flux solar furnace"]}, {"id": "EQU-002", "category_id": "equipment", "name": "MRE-ячейка", "description": "Электролиз расплава реголита (Al, Fe, Si, O₂)", "mass_kg": 5000.0, "power_kw": 500.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["FFC Cambridge Process — molten salt electrolysis", "Metalysis — solid-state electrolysis"]}, {"id": "EQU-022", "category_id": "equipment", "name": "МГД-насос", "description": "Перекачка расплава через магнитное поле", "mass_kg": 200.0, "power_kw": 50.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["ABB — electromagnetic pumps for metals", "Precimeter — MHD pumps"]}, {"id": "EQU-023", "category_id": "equipment", "name": "Промковш (тандиш)", "description": "Разделение Al/Fe расплавов, 2 стопора", "mass_kg": 1000.0, "power_kw": null, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["SMS Group — tundish technology", "Vesuvius — refractory systems"]}, {"id": "EQU-031", "category_id": "equipment", "name": "Конденсатор калия", "description": "Фракционная конденсация K при 759°C", "mass_kg": 500.0, "power_kw": 10.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Fractional distillation of metals", "Vacuum metallurgy"]}, {"id": "EQU-032", "category_id": "equipment", "name": "Конденсатор натрия", "description": "Фракционная конденсация Na при 883°C", "mass_kg": 800.0, "power_kw": 15.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Sodium production by Downs process", "Vacuum distillation"]}, {"id": "EQU-033", "category_id": "equipment", "name": "Конденсатор магния", "description": "Фракционная конденсация Mg при 1091°C", "mass_kg": 1500.0, "power_kw": 25.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Pidgeon process — magnesium distillation", "Vacuum metallurgy of Mg"]}, {"id": "EQU-006", "category_id": "equipment", "name": "МНЛЗ-Al", "description": "Машина непрерывного литья алюминия, 100×100 мм", "mass_kg": 8000.0, "power_kw": 100.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["SMS Group — aluminum casters", "Danieli — continuous casting"]}, {"id": "EQU-007", "category_id": "equipment", "name": "МНЛЗ-Fe", "description": "Машина непрерывного литья стали, 100×100 мм", "mass_kg": 10000.0, "power_kw": 150.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Danieli — steel continuous casters", "Primetals — billet casters"]}, {"id": "EQU-024", "category_id": "equipment", "name": "Индукционная печь", "description": "Нагрев Fe заготовок до 1100°C в N₂", "mass_kg": 3000.0, "power_kw": 100.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Inductotherm — induction heating", "ABP Induction — steel reheating"]}, {"id": "EQU-008", "category_id": "equipment", "name": "Прокатный стан", "description": "6-клетьевой, вход 100×100 → выход Ø20 мм", "mass_kg": 15000.0, "power_kw": 200.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["SMS Meer — rolling mills", "Siemens VAI — long products"]}, {"id": "EQU-025", "category_id": "equipment", "name": "Волочильный стан", "description": "Фильеры W, выход Ø1.6-2.0 мм проволока", "mass_kg": 2000.0, "power_kw": 30.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Niehoff — wire drawing machines", "Samp — drawing equipment"]}, {"id": "EQU-026", "category_id": "equipment", "name": "Фольгопрокат", "description": "Прокат Al фольги 4-50 мкм для зеркал", "mass_kg": 5000.0, "power_kw": 50.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Achenbach — foil rolling mills", "Fata Hunter — aluminum rolling"]}, {"id": "EQU-009", "category_id": "equipment", "name": "WAAM-ячейка", "description": "3D-печать дуговой наплавкой проволоки", "mass_kg": 2000.0, "power_kw": 50.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Lincoln Electric — WAAM systems", "WAAM3D — wire arc additive manufacturing", "Cranfield University — WAAM research"]}, {"id": "EQU-010", "category_id": "equipment", "name": "CNC 5-осевой", "description": "Фрезерный станок, твердосплавные фрезы W-Co", "mass_kg": 3000.0, "power_kw": 30.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["DMG MORI — 5-axis machining centers", "Mazak — multi-axis CNC", "Haas — vertical mills"]}, {"id": "EQU-027", "category_id": "equipment", "name": "Сборочный стапель", "description": "1 позиция сборки робота/оборудования", "mass_kg": 500.0, "power_kw": 5.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Comau — assembly systems", "KUKA — robotic assembly cells"]}, {"id": "EQU-028", "category_id": "equipment", "name": "Мостовой кран", "description": "Г/п 1 т, пролёт 10 м", "mass_kg": 2000.0, "power_kw": 20.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Konecranes — overhead cranes", "Demag — industrial cranes"]}, {"id": "EQU-029", "category_id": "equipment", "name": "AGV-тележка", "description": "Автоматическая логистическая тележка", "mass_kg": 200.0, "power_kw": 5.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["KUKA — mobile platforms", "MiR — autonomous mobile robots"]}, {"id": "EQU-001", "category_id": "equipment", "name": "Масс-драйвер", "description": "Электромагнитная катапульта, 3 км, 5 км/с", "mass_kg": 1300000.0, "power_kw": 33000.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["NASA Mass Driver Study 1992", "O'Neill 1974: The Colonization of Space", "NUDT maglev 700 km/h (China, 2025)"]}, {"id": "EQU-011", "category_id": "equipment", "name": "Мини масс-драйвер", "description": "МД для комплексов Карбон, 500м-1км", "mass_kg": 330000.0, "power_kw": 500.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["NASA Lunar Mass Driver concept", "EMF coilgun technology"]}, {"id": "EQU-030", "category_id": "equipment", "name": "ЛЭП криогенная", "description": "Сверхпроводящая линия, 1 км участок", "mass_kg": 1000.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["AMSC — superconducting cables", "Nexans — HTS power cables"]}, {"id": "CMP-001", "category_id": "equipment", "name": "Чипсет", "description": "CPU, микроконтроллеры, FPGA, радиомодуль (корпус — местный Al)", "mass_kg": 0.2, "power_kw": null, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["ARM Cortex processors", "Intel Xeon — space-grade", "Xilinx — rad-hard FPGAs"]}, {"id": "CMP-002", "category_id": "equipment", "name": "Камера стерео", "description": "Stereo vision, 2 камеры", "mass_kg": 0.5, "power_kw": null, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Intel RealSense", "ZED — stereo cameras", "Teledyne FLIR — industrial vision"]}, {"id": "CMP-003", "category_id": "equipment", "name": "Лидар", "description": "3D сканер, дальность 50м", "mass_kg": 2.0, "power_kw": null, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Velodyne — lidar sensors", "Ouster — digital lidar", "Livox — compact lidar"]}, {"id": "CMP-004", "category_id": "equipment", "name": "BLDC мотор Cu", "description": "Бесщёточный мотор, медные обмотки", "mass_kg": 5.0, "power_kw": null, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Maxon — precision motors", "FAULHABER — micro drives", "Kollmorgen — servomotors"]}, {"id": "CMP-005", "category_id": "equipment", "name": "Li-ion батарея", "description": "Литий-ионная батарея 1 кВт·ч", "mass_kg": 10.0, "power_kw": null, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["CATL — battery cells", "Panasonic — 2170 cells", "Samsung SDI — prismatic cells"]}, {"id": "EQU-014", "category_id": "equipment", "name": "Анод иридиевый", "description": "Анод для MRE-ячеек, Ir", "mass_kg": 2.0, "power_kw": null, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Heraeus — precious metal anodes", "Johnson Matthey — Ir electrodes"]}, {"id": "EQU-013", "category_id": "equipment", "name": "Фильера Pt", "description": "Фильера для стекловолокна, платина", "mass_kg": 0.5, "power_kw": null, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Heraeus — Pt bushings", "Johnson Matthey — glass fiber dies"]}, {"id": "CMP-006", "category_id": "equipment", "name": "Фильера Si₃N₄ (проволока)", "description": "Фильера для волочения проволоки, керамика (местное производство)", "mass_kg": 0.5, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["ATCERA — Si₃N₄ wire drawing dies", "KYOCERA — silicon nitride dies"]}, {"id": "CMP-017", "category_id": "equipment", "name": "Фильера Al₂O₃ (стекло)", "description": "Фильера для стекловолокна, керамика (местное производство)", "mass_kg": 2.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["ScienceDirect 1981 — ceramic bushings", "Stanford Advanced Materials — Al2O3 bushings"]}, {"id": "CMP-007", "category_id": "equipment", "name": "Фреза Si₃N₄", "description": "Керамическая фреза для CNC (местное производство)", "mass_kg": 0.2, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Sandvik ceramic cutting tools", "3M Silicon Nitride", "Kennametal ceramic inserts"]}, {"id": "CMP-008", "category_id": "equipment", "name": "Кристаллизатор Cu", "description": "Медный кристаллизатор для МНЛЗ", "mass_kg": 50.0, "power_kw": null, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["SMS Group — copper molds", "KME — crystallizers"]}, {"id": "CMP-009", "category_id": "equipment", "name": "GaAs панель", "description": "Фотоячейка арсенид галлия, 1 м²", "mass_kg": 5.0, "power_kw": null, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Spectrolab — space solar cells", "SolAero — triple-junction GaAs"]}, {"id": "CMP-010", "category_id": "equipment", "name": "Чип управления", "description": "Чип для зеркала Роя, 50 г", "mass_kg": 0.05, "power_kw": null, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Texas Instruments — rad-hard chips", "Microchip — space-grade MCUs"]}, {"id": "CMP-011", "category_id": "equipment", "name": "BLDC мотор Al", "description": "Бесщёточный мотор, алюминиевые обмотки", "mass_kg": 5.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["ABB — aluminum wound motors", "WEG — Al conductors in motors"]}, {"id": "CMP-012", "category_id": "equipment", "name": "NaS батарея 1кВт·ч", "description": "Натрий-серная батарея, 1 кВт·ч", "mass_kg": 8.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["NGK Insulators — NaS batteries", "GE Durathon — Na-based storage"]}, {"id": "CMP-013", "category_id": "equipment", "name": "Подшипник Al₂O₃", "description": "Корундовый подшипник, 100% местное производство", "mass_kg": 0.5, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["CoorsTek — alumina bearings", "Morgan Advanced Materials — Al₂O₃ ceramics"]}, {"id": "CMP-014", "category_id": "equipment", "name": "Редуктор", "description": "Планетарный редуктор, Fe+Al", "mass_kg": 3.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Harmonic Drive — precision gearboxes", "Nabtesco — planetary gears"]}, {"id": "EQU-012", "category_id": "equipment", "name": "Электроника сенсоров", "description": "Микроконтроллеры, датчики, камеры (пакет)", "mass_kg": 20.0, "power_kw": null, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["NXP — automotive MCUs", "STMicroelectronics — sensor hubs"]}, {"id": "PRD-001", "category_id": "products", "name": "Зеркало 100×100м", "description": "Алюминиевое зеркало с электрохромикой TiO₂", "mass_kg": 116.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["IKAROS (JAXA 2010) — solar sail", "LightSail 2 (Planetary Society)", "NEA Scout — NASA solar sail"]}, {"id": "PRD-002", "category_id": "products", "name": "Робот Gen-2", "description": "Робот второго поколения (усреднённый)", "mass_kg": 960.0, "power_kw": 15.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Caterpillar autonomous mining", "Rio Tinto autonomous trucks"]}, {"id": "PRD-003", "category_id": "products", "name": "Купол завода", "description": "Силикатный купол 50×30м, 1500 м²", "mass_kg": 8000.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Bigelow Aerospace — inflatable modules", "NASA TransHab — expandable habitats"]}, {"id": "PRD-004", "category_id": "products", "name": "NaS батарея 20кВт·ч", "description": "Натрий-серная батарея для роботов", "mass_kg": 150.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["NGK Insulators — NaS grid storage", "GE Durathon — Na-based batteries"]}, {"id": "PRD-005", "category_id": "products", "name": "Si панель", "description": "Кремниевая солнечная панель, 1 м²", "mass_kg": 10.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["LONGi — monocrystalline Si", "First Solar — thin film", "SunPower — high efficiency"]}, {"id": "PRD-006", "category_id": "products", "name": "Силикатная ткань", "description": "Ткань SiO₂ для куполов, 1 м²", "mass_kg": 0.3, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["3M Nextel — ceramic fabric", "Saint-Gobain — silica cloth"]}, {"id": "TRN-001", "category_id": "transport", "name": "Контейнер графита", "description": "Баллистический контейнер 100 кг", "mass_kg": 20.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["SpaceX Dragon cargo — reentry containers"]}, {"id": "TRN-002", "category_id": "transport", "name": "Капсула зеркала", "description": "Защитная капсула для запуска зеркала", "mass_kg": 10.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["NASA — deployable structures", "JAXA IKAROS — sail deployment"]}],
-  planetMaterials: [{"planet_id": "mercury", "material_id": "MAT-O2", "concentration_pct": 42.0, "notes": "главный продукт MRE"}, {"planet_id": "mercury", "material_id": "MAT-MG", "concentration_pct": 8.0, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-AL", "concentration_pct": 7.0, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-SI", "concentration_pct": 4.2, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-NA", "concentration_pct": 3.3, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-S", "concentration_pct": 3.0, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-FE", "concentration_pct": 1.7, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-FE-MN", "concentration_pct": null, "notes": "производится (сплав Fe + Mn)"}, {"planet_id": "mercury", "material_id": "MAT-K", "concentration_pct": 0.5, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-TI", "concentration_pct": 0.5, "notes": "из ильменита TiO₂"}, {"planet_id": "mercury", "material_id": "MAT-MN", "concentration_pct": 0.1, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-C", "concentration_pct": 2.0, "notes": "только LRM-зоны (полярные кратеры)"}, {"planet_id": "mercury", "material_id": "MAT-SI3N4", "concentration_pct": null, "notes": "производится из Si + N₂ (фрезы CNC)"}, {"planet_id": "moon", "material_id": "MAT-O2", "concentration_pct": 45.0, "notes": null}, {"planet_id": "moon", "material_id": "MAT-SI", "concentration_pct": 21.0, "notes": null}, {"planet_id": "moon", "material_id": "MAT-AL", "concentration_pct": 10.0, "notes": "в анортозите"}, {"planet_id": "moon", "material_id": "MAT-FE", "concentration_pct": 8.0, "notes": "в базальтах"}, {"planet_id": "moon", "material_id": "MAT-TI", "concentration_pct": 1.5, "notes": "в ильмените"}, {"planet_id": "moon", "material_id": "MAT-MG", "concentration_pct": 5.0, "notes": null}, {"planet_id": "mars", "material_id": "MAT-O2", "concentration_pct": 45.0, "notes": null}, {"planet_id": "mars", "material_id": "MAT-SI", "concentration_pct": 21.0, "notes": null}, {"planet_id": "mars", "material_id": "MAT-FE", "concentration_pct": 14.0, "notes": "в оксидах (красный цвет)"}, {"planet_id": "mars", "material_id": "MAT-MG", "concentration_pct": 3.0, "notes": null}, {"planet_id": "earth", "material_id": "MAT-IR", "concentration_pct": null, "notes": "импорт, аноды MRE"}, {"planet_id": "earth", "material_id": "MAT-GAAS", "concentration_pct": null, "notes": "импорт, фотоячейки"}, {"planet_id": "earth", "material_id": "MAT-LI", "concentration_pct": null, "notes": "импорт, Li-ion батареи Gen-1"}, {"planet_id": "earth", "material_id": "MAT-CU", "concentration_pct": null, "notes": "моторы Gen-1 (земное производство)"}, {"planet_id": "earth", "material_id": "MAT-KEVLAR", "concentration_pct": null, "notes": "импорт, армирование"}, {"planet_id": "earth", "material_id": "MAT-CFRP", "concentration_pct": null, "notes": "импорт, углепластик"}, {"planet_id": "earth", "material_id": "MAT-MOS2", "concentration_pct": null, "notes": "импорт, смазка для вакуума"}, {"planet_id": "mercury", "material_id": "MAT-NAK", "concentration_pct": null, "notes": "производится из Na+K"}, {"planet_id": "mercury", "material_id": "MAT-AL2O3", "concentration_pct": null, "notes": "производится из Al+O₂ (керамика, подшипники)"}, {"planet_id": "mercury", "material_id": "MAT-MGO", "concentration_pct": null, "notes": "производится из Mg+O₂"}, {"planet_id": "mercury", "material_id": "MAT-TIO2", "concentration_pct": null, "notes": "производится из Ti+O₂"}],
-  unitMaterials: [{"unit_id": "ROB-011", "material_id": "MAT-TI", "fraction_pct": 49.0}, {"unit_id": "ROB-011", "material_id": "MAT-AL2O3", "fraction_pct": 24.0}, {"unit_id": "ROB-011", "material_id": "MAT-CU", "fraction_pct": 18.0}, {"unit_id": "ROB-011", "material_id": "MAT-LI", "fraction_pct": 6.0}, {"unit_id": "ROB-011", "material_id": "MAT-SI", "fraction_pct": 3.0}, {"unit_id": "ROB-012", "material_id": "MAT-AL", "fraction_pct": 63.0}, {"unit_id": "ROB-012", "material_id": "MAT-FE-MN", "fraction_pct": 21.0}, {"unit_id": "ROB-012", "material_id": "MAT-CU", "fraction_pct": 8.0}, {"unit_id": "ROB-012", "material_id": "MAT-LI", "fraction_pct": 4.0}, {"unit_id": "ROB-012", "material_id": "MAT-SI", "fraction_pct": 4.0}, {"unit_id": "ROB-013", "material_id": "MAT-CFRP", "fraction_pct": 40.0}, {"unit_id": "ROB-013", "material_id": "MAT-CU", "fraction_pct": 33.0}, {"unit_id": "ROB-013", "material_id": "MAT-LI", "fraction_pct": 20.0}, {"unit_id": "ROB-013", "material_id": "MAT-SI", "fraction_pct": 7.0}, {"unit_id": "ROB-014", "material_id": "MAT-TI", "fraction_pct": 40.0}, {"unit_id": "ROB-014", "material_id": "MAT-FE-MN", "fraction_pct": 30.0}, {"unit_id": "ROB-014", "material_id": "MAT-CU", "fraction_pct": 12.0}, {"unit_id": "ROB-014", "material_id": "MAT-LI", "fraction_pct": 13.0}, {"unit_id": "ROB-014", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "ROB-015", "material_id": "MAT-AL", "fraction_pct": 40.0}, {"unit_id": "ROB-015", "material_id": "MAT-CU", "fraction_pct": 40.0}, {"unit_id": "ROB-015", "material_id": "MAT-SI", "fraction_pct": 20.0}, {"unit_id": "ROB-021", "material_id": "MAT-AL", "fraction_pct": 60.0}, {"unit_id": "ROB-021", "material_id": "MAT-FE", "fraction_pct": 35.0}, {"unit_id": "ROB-021", "material_id": "MAT-NA", "fraction_pct": 1.0}, {"unit_id": "ROB-021", "material_id": "MAT-S", "fraction_pct": 1.0}, {"unit_id": "ROB-021", "material_id": "MAT-SI", "fraction_pct": 3.0}, {"unit_id": "ROB-022", "material_id": "MAT-AL", "fraction_pct": 68.0}, {"unit_id": "ROB-022", "material_id": "MAT-FE", "fraction_pct": 26.0}, {"unit_id": "ROB-022", "material_id": "MAT-NA", "fraction_pct": 1.0}, {"unit_id": "ROB-022", "material_id": "MAT-S", "fraction_pct": 1.0}, {"unit_id": "ROB-022", "material_id": "MAT-SI", "fraction_pct": 4.0}, {"unit_id": "ROB-023", "material_id": "MAT-FE", "fraction_pct": 84.0}, {"unit_id": "ROB-023", "material_id": "MAT-AL", "fraction_pct": 14.0}, {"unit_id": "ROB-023", "material_id": "MAT-SI", "fraction_pct": 2.0}, {"unit_id": "EQU-021", "material_id": "MAT-FE", "fraction_pct": 85.0}, {"unit_id": "EQU-021", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-021", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-004", "material_id": "MAT-FE-MN", "fraction_pct": 90.0}, {"unit_id": "EQU-004", "material_id": "MAT-AL", "fraction_pct": 5.0}, {"unit_id": "EQU-004", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-005", "material_id": "MAT-FE", "fraction_pct": 60.0}, {"unit_id": "EQU-005", "material_id": "MAT-AL", "fraction_pct": 30.0}, {"unit_id": "EQU-005", "material_id": "MAT-AL2O3", "fraction_pct": 5.0}, {"unit_id": "EQU-005", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-003", "material_id": "MAT-AL", "fraction_pct": 70.0}, {"unit_id": "EQU-003", "material_id": "MAT-FE-MN", "fraction_pct": 15.0}, {"unit_id": "EQU-003", "material_id": "MAT-MGO", "fraction_pct": 10.0}, {"unit_id": "EQU-003", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-002", "material_id": "MAT-FE", "fraction_pct": 60.0}, {"unit_id": "EQU-002", "material_id": "MAT-AL", "fraction_pct": 25.0}, {"unit_id": "EQU-002", "material_id": "MAT-AL2O3", "fraction_pct": 10.0}, {"unit_id": "EQU-002", "material_id": "MAT-IR", "fraction_pct": 0.1}, {"unit_id": "EQU-002", "material_id": "MAT-SI", "fraction_pct": 4.9}, {"unit_id": "EQU-022", "material_id": "MAT-FE", "fraction_pct": 50.0}, {"unit_id": "EQU-022", "material_id": "MAT-AL", "fraction_pct": 40.0}, {"unit_id": "EQU-022", "material_id": "MAT-SI", "fraction_pct": 10.0}, {"unit_id": "EQU-023", "material_id": "MAT-FE-MN", "fraction_pct": 70.0}, {"unit_id": "EQU-023", "material_id": "MAT-MGO", "fraction_pct": 15.0}, {"unit_id": "EQU-023", "material_id": "MAT-AL2O3", "fraction_pct": 10.0}, {"unit_id": "EQU-023", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-006", "material_id": "MAT-FE-MN", "fraction_pct": 80.0}, {"unit_id": "EQU-006", "material_id": "MAT-MGO", "fraction_pct": 10.0}, {"unit_id": "EQU-006", "material_id": "MAT-AL", "fraction_pct": 5.0}, {"unit_id": "EQU-006", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-007", "material_id": "MAT-FE", "fraction_pct": 80.0}, {"unit_id": "EQU-007", "material_id": "MAT-MGO", "fraction_pct": 12.0}, {"unit_id": "EQU-007", "material_id": "MAT-AL", "fraction_pct": 3.0}, {"unit_id": "EQU-007", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-024", "material_id": "MAT-FE", "fraction_pct": 60.0}, {"unit_id": "EQU-024", "material_id": "MAT-AL", "fraction_pct": 30.0}, {"unit_id": "EQU-024", "material_id": "MAT-AL2O3", "fraction_pct": 5.0}, {"unit_id": "EQU-024", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-008", "material_id": "MAT-FE-MN", "fraction_pct": 85.0}, {"unit_id": "EQU-008", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-008", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-025", "material_id": "MAT-FE", "fraction_pct": 80.0}, {"unit_id": "EQU-025", "material_id": "MAT-AL", "fraction_pct": 15.0}, {"unit_id": "EQU-025", "material_id": "MAT-SI3N4", "fraction_pct": 0.25}, {"unit_id": "EQU-025", "material_id": "MAT-SI", "fraction_pct": 4.75}, {"unit_id": "EQU-026", "material_id": "MAT-FE", "fraction_pct": 85.0}, {"unit_id": "EQU-026", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-026", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-009", "material_id": "MAT-FE", "fraction_pct": 70.0}, {"unit_id": "EQU-009", "material_id": "MAT-AL", "fraction_pct": 25.0}, {"unit_id": "EQU-009", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-010", "material_id": "MAT-FE", "fraction_pct": 80.0}, {"unit_id": "EQU-010", "material_id": "MAT-AL", "fraction_pct": 15.0}, {"unit_id": "EQU-010", "material_id": "MAT-SI3N4", "fraction_pct": 0.15}, {"unit_id": "EQU-010", "material_id": "MAT-SI", "fraction_pct": 4.85}, {"unit_id": "EQU-027", "material_id": "MAT-FE", "fraction_pct": 70.0}, {"unit_id": "EQU-027", "material_id": "MAT-AL", "fraction_pct": 25.0}, {"unit_id": "EQU-027", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-028", "material_id": "MAT-FE", "fraction_pct": 85.0}, {"unit_id": "EQU-028", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-028", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-029", "material_id": "MAT-FE", "fraction_pct": 50.0}, {"unit_id": "EQU-029", "material_id": "MAT-AL", "fraction_pct": 30.0}, {"unit_id": "EQU-029", "material_id": "MAT-NA", "fraction_pct": 5.0}, {"unit_id": "EQU-029", "material_id": "MAT-S", "fraction_pct": 5.0}, {"unit_id": "EQU-029", "material_id": "MAT-SI", "fraction_pct": 10.0}, {"unit_id": "EQU-001", "material_id": "MAT-FE", "fraction_pct": 62.0}, {"unit_id": "EQU-001", "material_id": "MAT-AL", "fraction_pct": 38.0}, {"unit_id": "EQU-011", "material_id": "MAT-FE", "fraction_pct": 65.0}, {"unit_id": "EQU-011", "material_id": "MAT-AL", "fraction_pct": 30.0}, {"unit_id": "EQU-011", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-030", "material_id": "MAT-AL", "fraction_pct": 70.0}, {"unit_id": "EQU-030", "material_id": "MAT-FE", "fraction_pct": 20.0}, {"unit_id": "EQU-030", "material_id": "MAT-SI", "fraction_pct": 10.0}, {"unit_id": "EQU-031", "material_id": "MAT-FE-MN", "fraction_pct": 60.0}, {"unit_id": "EQU-031", "material_id": "MAT-MGO", "fraction_pct": 25.0}, {"unit_id": "EQU-031", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-031", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-032", "material_id": "MAT-FE-MN", "fraction_pct": 60.0}, {"unit_id": "EQU-032", "material_id": "MAT-MGO", "fraction_pct": 25.0}, {"unit_id": "EQU-032", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-032", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-033", "material_id": "MAT-FE-MN", "fraction_pct": 55.0}, {"unit_id": "EQU-033", "material_id": "MAT-MGO", "fraction_pct": 30.0}, {"unit_id": "EQU-033", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-033", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "CMP-004", "material_id": "MAT-CU", "fraction_pct": 60.0}, {"unit_id": "CMP-004", "material_id": "MAT-FE", "fraction_pct": 35.0}, {"unit_id": "CMP-004", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "CMP-005", "material_id": "MAT-LI", "fraction_pct": 25.0}, {"unit_id": "CMP-005", "material_id": "MAT-AL", "fraction_pct": 40.0}, {"unit_id": "CMP-005", "material_id": "MAT-C", "fraction_pct": 20.0}, {"unit_id": "CMP-005", "material_id": "MAT-CU", "fraction_pct": 10.0}, {"unit_id": "CMP-005", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "CMP-009", "material_id": "MAT-GAAS", "fraction_pct": 30.0}, {"unit_id": "CMP-009", "material_id": "MAT-AL", "fraction_pct": 60.0}, {"unit_id": "CMP-009", "material_id": "MAT-SI", "fraction_pct": 10.0}, {"unit_id": "CMP-011", "material_id": "MAT-AL", "fraction_pct": 55.0}, {"unit_id": "CMP-011", "material_id": "MAT-FE", "fraction_pct": 40.0}, {"unit_id": "CMP-011", "material_id": "MAT-SI", "fraction_pct": 3.0}, {"unit_id": "CMP-011", "material_id": "MAT-MOS2", "fraction_pct": 2.0}, {"unit_id": "CMP-012", "material_id": "MAT-NA", "fraction_pct": 30.0}, {"unit_id": "CMP-012", "material_id": "MAT-S", "fraction_pct": 25.0}, {"unit_id": "CMP-012", "material_id": "MAT-AL2O3", "fraction_pct": 35.0}, {"unit_id": "CMP-012", "material_id": "MAT-AL", "fraction_pct": 5.0}, {"unit_id": "CMP-012", "material_id": "MAT-FE", "fraction_pct": 5.0}, {"unit_id": "CMP-013", "material_id": "MAT-AL2O3", "fraction_pct": 95.0}, {"unit_id": "CMP-013", "material_id": "MAT-FE", "fraction_pct": 5.0}, {"unit_id": "CMP-014", "material_id": "MAT-FE", "fraction_pct": 80.0}, {"unit_id": "CMP-014", "material_id": "MAT-AL", "fraction_pct": 15.0}, {"unit_id": "CMP-014", "material_id": "MAT-MOS2", "fraction_pct": 5.0}, {"unit_id": "PRD-001", "material_id": "MAT-AL", "fraction_pct": 94.8}, {"unit_id": "PRD-001", "material_id": "MAT-FE", "fraction_pct": 4.3}, {"unit_id": "PRD-001", "material_id": "MAT-TIO2", "fraction_pct": 0.86}, {"unit_id": "PRD-002", "material_id": "MAT-FE", "fraction_pct": 46.9}, {"unit_id": "PRD-002", "material_id": "MAT-AL", "fraction_pct": 17.2}, {"unit_id": "PRD-002", "material_id": "MAT-NA", "fraction_pct": 15.6}, {"unit_id": "PRD-002", "material_id": "MAT-S", "fraction_pct": 15.6}, {"unit_id": "PRD-002", "material_id": "MAT-SI", "fraction_pct": 3.2}, {"unit_id": "PRD-002", "material_id": "MAT-MOS2", "fraction_pct": 1.5}, {"unit_id": "PRD-003", "material_id": "MAT-SI", "fraction_pct": 93.75}, {"unit_id": "PRD-003", "material_id": "MAT-AL", "fraction_pct": 6.25}, {"unit_id": "PRD-004", "material_id": "MAT-NA", "fraction_pct": 30.0}, {"unit_id": "PRD-004", "material_id": "MAT-S", "fraction_pct": 25.0}, {"unit_id": "PRD-004", "material_id": "MAT-AL2O3", "fraction_pct": 35.0}, {"unit_id": "PRD-004", "material_id": "MAT-AL", "fraction_pct": 5.0}, {"unit_id": "PRD-004", "material_id": "MAT-FE", "fraction_pct": 5.0}, {"unit_id": "PRD-005", "material_id": "MAT-SI", "fraction_pct": 50.0}, {"unit_id": "PRD-005", "material_id": "MAT-AL", "fraction_pct": 50.0}, {"unit_id": "PRD-006", "material_id": "MAT-SI", "fraction_pct": 95.0}, {"unit_id": "PRD-006", "material_id": "MAT-AL", "fraction_pct": 5.0}, {"unit_id": "TRN-001", "material_id": "MAT-AL", "fraction_pct": 90.0}, {"unit_id": "TRN-001", "material_id": "MAT-FE", "fraction_pct": 10.0}, {"unit_id": "TRN-002", "material_id": "MAT-AL", "fraction_pct": 95.0}, {"unit_id": "TRN-002", "material_id": "MAT-FE", "fraction_pct": 5.0}, {"unit_id": "HUB-001", "material_id": "MAT-AL", "fraction_pct": 88.0}, {"unit_id": "HUB-001", "material_id": "MAT-SI", "fraction_pct": 9.0}, {"unit_id": "HUB-001", "material_id": "MAT-FE-MN", "fraction_pct": 3.0}],
-  unitComponents: [{"assembly_id": "ROB-011", "component_id": "CMP-001", "quantity": 1}, {"assembly_id": "ROB-011", "component_id": "CMP-002", "quantity": 2}, {"assembly_id": "ROB-011", "component_id": "CMP-004", "quantity": 3}, {"assembly_id": "ROB-011", "component_id": "CMP-005", "quantity": 1}, {"assembly_id": "ROB-012", "component_id": "CMP-001", "quantity": 6}, {"assembly_id": "ROB-012", "component_id": "CMP-002", "quantity": 4}, {"assembly_id": "ROB-012", "component_id": "CMP-003", "quantity": 2}, {"assembly_id": "ROB-012", "component_id": "CMP-004", "quantity": 16}, {"assembly_id": "ROB-012", "component_id": "CMP-005", "quantity": 4}, {"assembly_id": "ROB-013", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "ROB-013", "component_id": "CMP-002", "quantity": 4}, {"assembly_id": "ROB-013", "component_id": "CMP-004", "quantity": 10}, {"assembly_id": "ROB-013", "component_id": "CMP-005", "quantity": 3}, {"assembly_id": "ROB-014", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "ROB-014", "component_id": "CMP-002", "quantity": 2}, {"assembly_id": "ROB-014", "component_id": "CMP-003", "quantity": 1}, {"assembly_id": "ROB-014", "component_id": "CMP-004", "quantity": 19}, {"assembly_id": "ROB-014", "component_id": "CMP-005", "quantity": 10}, {"assembly_id": "ROB-021", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "ROB-021", "component_id": "CMP-002", "quantity": 4}, {"assembly_id": "ROB-021", "component_id": "CMP-011", "quantity": 18}, {"assembly_id": "ROB-021", "component_id": "CMP-012", "quantity": 20}, {"assembly_id": "ROB-021", "component_id": "CMP-013", "quantity": 36}, {"assembly_id": "ROB-021", "component_id": "CMP-014", "quantity": 6}, {"assembly_id": "ROB-022", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "ROB-022", "component_id": "CMP-002", "quantity": 4}, {"assembly_id": "ROB-022", "component_id": "CMP-011", "quantity": 14}, {"assembly_id": "ROB-022", "component_id": "CMP-012", "quantity": 5}, {"assembly_id": "ROB-022", "component_id": "CMP-013", "quantity": 28}, {"assembly_id": "ROB-022", "component_id": "CMP-014", "quantity": 6}, {"assembly_id": "ROB-023", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "ROB-023", "component_id": "CMP-002", "quantity": 2}, {"assembly_id": "ROB-023", "component_id": "CMP-011", "quantity": 8}, {"assembly_id": "ROB-023", "component_id": "CMP-012", "quantity": 0}, {"assembly_id": "ROB-023", "component_id": "CMP-013", "quantity": 24}, {"assembly_id": "ROB-023", "component_id": "CMP-014", "quantity": 4}, {"assembly_id": "EQU-002", "component_id": "EQU-014", "quantity": 4}, {"assembly_id": "EQU-006", "component_id": "CMP-008", "quantity": 1}, {"assembly_id": "EQU-007", "component_id": "CMP-008", "quantity": 1}, {"assembly_id": "EQU-025", "component_id": "CMP-006", "quantity": 10}, {"assembly_id": "EQU-010", "component_id": "CMP-007", "quantity": 20}, {"assembly_id": "EQU-005", "component_id": "CMP-011", "quantity": 2}, {"assembly_id": "EQU-005", "component_id": "CMP-013", "quantity": 4}, {"assembly_id": "EQU-005", "component_id": "CMP-014", "quantity": 1}, {"assembly_id": "FAC-001", "component_id": "EQU-004", "quantity": 3}, {"assembly_id": "FAC-001", "component_id": "EQU-005", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-021", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-002", "quantity": 20}, {"assembly_id": "FAC-001", "component_id": "EQU-003", "quantity": 5}, {"assembly_id": "FAC-001", "component_id": "EQU-022", "quantity": 5}, {"assembly_id": "FAC-001", "component_id": "EQU-023", "quantity": 3}, {"assembly_id": "FAC-001", "component_id": "EQU-006", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-007", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-024", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-008", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-025", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-026", "quantity": 1}, {"assembly_id": "FAC-001", "component_id": "EQU-009", "quantity": 5}, {"assembly_id": "FAC-001", "component_id": "EQU-010", "quantity": 3}, {"assembly_id": "FAC-001", "component_id": "EQU-027", "quantity": 10}, {"assembly_id": "FAC-001", "component_id": "EQU-028", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-029", "quantity": 10}, {"assembly_id": "FAC-001", "component_id": "EQU-001", "quantity": 1}, {"assembly_id": "FAC-002", "component_id": "EQU-011", "quantity": 1}, {"assembly_id": "FAC-002", "component_id": "EQU-004", "quantity": 1}, {"assembly_id": "FAC-002", "component_id": "EQU-021", "quantity": 1}, {"assembly_id": "FAC-003", "component_id": "EQU-011", "quantity": 1}, {"assembly_id": "FAC-003", "component_id": "EQU-004", "quantity": 1}, {"assembly_id": "FAC-003", "component_id": "EQU-021", "quantity": 1}, {"assembly_id": "FAC-004", "component_id": "PRD-005", "quantity": 3500}, {"assembly_id": "PRD-001", "component_id": "CMP-010", "quantity": 1}, {"assembly_id": "PRD-002", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "PRD-002", "component_id": "CMP-011", "quantity": 12}, {"assembly_id": "PRD-002", "component_id": "CMP-012", "quantity": 8}, {"assembly_id": "EQU-001", "component_id": "CMP-001", "quantity": 50}]
+  planets: [{"id": "earth", "name": "Земля", "gravity_m_s2": 9.81, "solar_constant_w_m2": 1361.0, "escape_velocity_km_s": 11.2, "has_atmosphere": true, "sources": ["https://nssdc.gsfc.nasa.gov/planetary/factsheet/earthfact.html"]}, {"id": "mars", "name": "Марс", "gravity_m_s2": 3.71, "solar_constant_w_m2": 589.0, "escape_velocity_km_s": 5.03, "has_atmosphere": true, "sources": ["https://mars.nasa.gov/", "Rieder et al. 2004 - Mars Pathfinder soil composition", "ESA Mars Express data"]}, {"id": "mercury", "name": "Меркурий", "gravity_m_s2": 3.7, "solar_constant_w_m2": 10343.0, "escape_velocity_km_s": 4.25, "has_atmosphere": false, "sources": ["https://messenger.jhuapl.edu/", "Nittler et al. 2011 - Surface composition", "Peplowski et al. 2015 - Elemental abundances"]}, {"id": "moon", "name": "Луна", "gravity_m_s2": 1.62, "solar_constant_w_m2": 1361.0, "escape_velocity_km_s": 2.38, "has_atmosphere": false, "sources": ["https://www.lpi.usra.edu/lunar/samples/", "Taylor 1982 - Planetary Science", "LROC - Lunar Reconnaissance Orbiter Camera"]}],
+  materials: [{"id": "MAT-AL", "parent_id": "MAT-METAL", "name": "Алюминий", "symbol": "Al", "description": "Зеркала, корпуса, радиаторы, фольга для куполов", "criticality": "critical", "sources": ["CHALCO — фольга 4.5 мкм", "Novelis — промышленная фольга", "ALCOA — aerospace aluminium"]}, {"id": "MAT-AL2O3", "parent_id": "MAT-COMPOUND", "name": "Оксид алюминия", "symbol": "Al₂O₃", "description": "Керамика, бета-глинозём для NaS", "criticality": "medium", "sources": ["NGK Insulators — beta-alumina для NaS", "CoorsTek — техническая керамика"]}, {"id": "MAT-C", "parent_id": "MAT-NONMETAL", "name": "Углерод/Графит", "symbol": "C", "description": "Композиты, восстановитель Ti, термозащита", "criticality": "high", "sources": ["SGL Carbon — графитовые материалы", "Toray — углеродное волокно"]}, {"id": "MAT-CFRP", "parent_id": "MAT-COMPOUND", "name": "Углепластик", "symbol": "CFRP", "description": "Корпуса Gen-1 (импорт)", "criticality": "medium", "sources": ["Toray — T700/T800 carbon fiber", "Hexcel — aerospace CFRP", "SpaceX Dragon — CFRP capsule"]}, {"id": "MAT-COMPOUND", "parent_id": null, "name": "Соединения", "symbol": null, "description": "Сплавы и химические соединения", "criticality": null, "sources": []}, {"id": "MAT-CU", "parent_id": "MAT-METAL", "name": "Медь", "symbol": "Cu", "description": "Обмотки моторов Gen-1 (земное производство)", "criticality": "high", "sources": ["Codelco — электролитическая медь", "Freeport-McMoRan"]}, {"id": "MAT-FE", "parent_id": "MAT-METAL", "name": "Железо", "symbol": "Fe", "description": "Рамы, шасси, конструкции", "criticality": "critical", "sources": ["ArcelorMittal — конструкционная сталь", "POSCO — автоматизированное производство"]}, {"id": "MAT-FE-MN", "parent_id": "MAT-FE", "name": "Сталь Fe-6%Mn", "symbol": null, "description": "Прочная сталь без углерода, легированная марганцем", "criticality": "high", "sources": ["ASTM A128 — Hadfield steel standard", "Metso Outotec — износостойкие стали"]}, {"id": "MAT-GAAS", "parent_id": "MAT-COMPOUND", "name": "Арсенид галлия", "symbol": "GaAs", "description": "Высокоэффективные фотоячейки (импорт)", "criticality": "high", "sources": ["Spectrolab — космические GaAs ячейки", "SolAero — multi-junction cells"]}, {"id": "MAT-IR", "parent_id": "MAT-METAL", "name": "Иридий", "symbol": "Ir", "description": "Аноды MRE-ячеек (устойчивость к расплаву)", "criticality": "medium", "sources": ["Johnson Matthey — платиновые металлы", "Heraeus — иридиевые аноды"]}, {"id": "MAT-K", "parent_id": "MAT-NONMETAL", "name": "Калий", "symbol": "K", "description": "Удобрения, химические процессы", "criticality": "low", "sources": ["Nutrien — добыча калия", "K+S — хлорид калия"]}, {"id": "MAT-KEVLAR", "parent_id": "MAT-NONMETAL", "name": "Кевлар", "symbol": null, "description": "Армирование конструкций Gen-1 (импорт)", "criticality": "medium", "sources": ["DuPont — Kevlar aramid fiber", "Teijin — Twaron"]}, {"id": "MAT-LI", "parent_id": "MAT-METAL", "name": "Литий", "symbol": "Li", "description": "Li-ion батареи Gen-1 (импорт)", "criticality": "high", "sources": ["Albemarle — литиевые соединения", "CATL — Li-ion батареи", "Panasonic — Tesla cells"]}, {"id": "MAT-METAL", "parent_id": null, "name": "Металлы", "symbol": null, "description": "Металлы и сплавы", "criticality": null, "sources": []}, {"id": "MAT-MG", "parent_id": "MAT-METAL", "name": "Магний", "symbol": "Mg", "description": "Лёгкие сплавы, пиротехника", "criticality": "high", "sources": ["US Magnesium — электролизное производство", "Magontec — сплавы"]}, {"id": "MAT-MGO", "parent_id": "MAT-COMPOUND", "name": "Оксид магния", "symbol": "MgO", "description": "Тугоплавкая керамика для тиглей и футеровки (Tпл=2852°C). Местное производство: Mg из реголита (8%, вакуумная дистилляция шлака MRE), окисление → MgO", "criticality": "medium", "sources": ["Magnesium oxide refractory", "Mercury regolith processing"]}, {"id": "MAT-MN", "parent_id": "MAT-METAL", "name": "Марганец", "symbol": "Mn", "description": "Легирование стали Fe-6%Mn", "criticality": "medium", "sources": ["South32 — добыча марганца", "ERAMET — ферросплавы"]}, {"id": "MAT-MOS2", "parent_id": "MAT-COMPOUND", "name": "Дисульфид молибдена", "symbol": "MoS₂", "description": "Смазка для вакуума", "criticality": "medium", "sources": ["Dow Corning — Molykote", "NASA — vacuum lubricants"]}, {"id": "MAT-NA", "parent_id": "MAT-METAL", "name": "Натрий", "symbol": "Na", "description": "Батареи NaS (анод)", "criticality": "high", "sources": ["Chemours — промышленный натрий", "NGK Insulators — NaS технология"]}, {"id": "MAT-NAK", "parent_id": "MAT-COMPOUND", "name": "Натрий-калий", "symbol": "NaK", "description": "Теплоноситель (-12°C...+785°C)", "criticality": "high", "sources": ["DOE — Sodium Technology Handbook", "ESA Bepi-Colombo — NaK cooling"]}, {"id": "MAT-NONMETAL", "parent_id": null, "name": "Неметаллы", "symbol": null, "description": "Неметаллические элементы и соединения", "criticality": null, "sources": []}, {"id": "MAT-O2", "parent_id": "MAT-NONMETAL", "name": "Кислород", "symbol": "O₂", "description": "Главный продукт MRE, побочный продукт", "criticality": "critical", "sources": ["Linde — промышленный кислород", "Air Liquide — криогенное разделение"]}, {"id": "MAT-S", "parent_id": "MAT-NONMETAL", "name": "Сера", "symbol": "S", "description": "Батареи NaS (катод)", "criticality": "high", "sources": ["BASF — промышленная сера", "Claus process — побочный продукт"]}, {"id": "MAT-SI", "parent_id": "MAT-NONMETAL", "name": "Кремний", "symbol": "Si", "description": "Стекловолокно, электроника, солнечные панели", "criticality": "critical", "sources": ["Wacker Chemie — поликремний", "LONGi — солнечный Si", "Owens Corning — стекловолокно"]}, {"id": "MAT-SI3N4", "parent_id": "MAT-COMPOUND", "name": "Нитрид кремния", "symbol": "Si₃N₄", "description": "Керамические фрезы для CNC (местное производство из Si + N₂)", "criticality": "medium", "sources": ["Sandvik ceramic cutting tools", "3M Silicon Nitride", "PMC: Si₃N₄ machining tools"]}, {"id": "MAT-TI", "parent_id": "MAT-METAL", "name": "Титан", "symbol": "Ti", "description": "Электрохромика зеркал, прочные узлы", "criticality": "medium", "sources": ["VSMPO-AVISMA — титановые сплавы", "ATI — aerospace titanium"]}, {"id": "MAT-TIO2", "parent_id": "MAT-COMPOUND", "name": "Диоксид титана", "symbol": "TiO₂", "description": "Электрохромика зеркал", "criticality": "medium", "sources": ["IKAROS (JAXA 2010) — TiO₂ электрохромика в космосе", "Gentex — автомобильная электрохромика"]}],
+  categories: [{"id": "equipment", "name": "Оборудование"}, {"id": "facilities", "name": "Объекты/Заводы"}, {"id": "products", "name": "Продукция"}, {"id": "robots", "name": "Роботы"}, {"id": "transport", "name": "Транспорт/Контейнеры"}],
+  units: [{"id": "CMP-001", "category_id": "equipment", "name": "Чипсет", "description": "CPU, микроконтроллеры, FPGA, радиомодуль (корпус — местный Al)", "mass_kg": 0.2, "power_kw": 0.0, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["ARM Cortex processors", "Intel Xeon — space-grade", "Xilinx — rad-hard FPGAs"]}, {"id": "CMP-002", "category_id": "equipment", "name": "Камера стерео", "description": "Stereo vision, 2 камеры", "mass_kg": 0.5, "power_kw": 0.0, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Intel RealSense", "ZED — stereo cameras", "Teledyne FLIR — industrial vision"]}, {"id": "CMP-003", "category_id": "equipment", "name": "Лидар", "description": "3D сканер, дальность 50м", "mass_kg": 2.0, "power_kw": 0.0, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Velodyne — lidar sensors", "Ouster — digital lidar", "Livox — compact lidar"]}, {"id": "CMP-004", "category_id": "equipment", "name": "BLDC мотор Cu", "description": "Бесщёточный мотор, медные обмотки", "mass_kg": 5.0, "power_kw": 0.0, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Maxon — precision motors", "FAULHABER — micro drives", "Kollmorgen — servomotors"]}, {"id": "CMP-005", "category_id": "equipment", "name": "Li-ion батарея", "description": "Литий-ионная батарея 1 кВт·ч", "mass_kg": 10.0, "power_kw": 0.0, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["CATL — battery cells", "Panasonic — 2170 cells", "Samsung SDI — prismatic cells"]}, {"id": "CMP-006", "category_id": "equipment", "name": "Фильера Si₃N₄ (проволока)", "description": "Фильера для волочения проволоки, керамика (местное производство)", "mass_kg": 0.5, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["ATCERA — Si₃N₄ wire drawing dies", "KYOCERA — silicon nitride dies"]}, {"id": "CMP-007", "category_id": "equipment", "name": "Фреза Si₃N₄", "description": "Керамическая фреза для CNC (местное производство)", "mass_kg": 0.2, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Sandvik ceramic cutting tools", "3M Silicon Nitride", "Kennametal ceramic inserts"]}, {"id": "CMP-008", "category_id": "equipment", "name": "Кристаллизатор Cu", "description": "Медный кристаллизатор для МНЛЗ", "mass_kg": 50.0, "power_kw": 0.0, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["SMS Group — copper molds", "KME — crystallizers"]}, {"id": "CMP-009", "category_id": "equipment", "name": "GaAs панель", "description": "Фотоячейка арсенид галлия, 1 м²", "mass_kg": 5.0, "power_kw": 0.0, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Spectrolab — space solar cells", "SolAero — triple-junction GaAs"]}, {"id": "CMP-010", "category_id": "equipment", "name": "Чип управления", "description": "Чип для зеркала Роя, 50 г", "mass_kg": 0.05, "power_kw": 0.0, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Texas Instruments — rad-hard chips", "Microchip — space-grade MCUs"]}, {"id": "CMP-011", "category_id": "equipment", "name": "BLDC мотор Al", "description": "Бесщёточный мотор, алюминиевые обмотки", "mass_kg": 5.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["ABB — aluminum wound motors", "WEG — Al conductors in motors"]}, {"id": "CMP-012", "category_id": "equipment", "name": "NaS батарея 1кВт·ч", "description": "Натрий-серная батарея, 1 кВт·ч", "mass_kg": 8.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["NGK Insulators — NaS batteries", "GE Durathon — Na-based storage"]}, {"id": "CMP-013", "category_id": "equipment", "name": "Подшипник Al₂O₃", "description": "Корундовый подшипник, 100% местное производство", "mass_kg": 0.5, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["CoorsTek — alumina bearings", "Morgan Advanced Materials — Al₂O₃ ceramics"]}, {"id": "CMP-014", "category_id": "equipment", "name": "Редуктор", "description": "Планетарный редуктор, Fe+Al", "mass_kg": 3.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Harmonic Drive — precision gearboxes", "Nabtesco — planetary gears"]}, {"id": "CMP-017", "category_id": "equipment", "name": "Фильера Al₂O₃ (стекло)", "description": "Фильера для стекловолокна, керамика (местное производство)", "mass_kg": 2.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["ScienceDirect 1981 — ceramic bushings", "Stanford Advanced Materials — Al2O3 bushings"]}, {"id": "EQU-001", "category_id": "equipment", "name": "Масс-драйвер", "description": "Электромагнитная катапульта, 3 км, 5 км/с", "mass_kg": 1300000.0, "power_kw": 33000.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["NASA Mass Driver Study 1992", "O'Neill 1974: The Colonization of Space", "NUDT maglev 700 km/h (China, 2025)"]}, {"id": "EQU-002", "category_id": "equipment", "name": "MRE-ячейка", "description": "Электролиз расплава реголита (Al, Fe, Si, O₂)", "mass_kg": 5000.0, "power_kw": 500.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["FFC Cambridge Process — molten salt electrolysis", "Metalysis — solid-state electrolysis"]}, {"id": "EQU-003", "category_id": "equipment", "name": "Солнечная печь", "description": "Концентратор для плавки реголита 1500°C", "mass_kg": 2000.0, "power_kw": 0.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Odeillo (France) — 1 MW solar furnace", "DLR Cologne — high-flux solar furnace"]}, {"id": "EQU-004", "category_id": "equipment", "name": "Щековая дробилка", "description": "Дробление реголита <10мм", "mass_kg": 3000.0, "power_kw": 50.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Metso Lokotrack — mobile crusher", "Sandvik QJ341 — jaw crusher"]}, {"id": "EQU-005", "category_id": "equipment", "name": "Магнитный сепаратор", "description": "Разделение магнитной/немагнитной фракций", "mass_kg": 500.0, "power_kw": 20.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Eriez — magnetic separation", "STEINERT — sensor-based sorting"]}, {"id": "EQU-006", "category_id": "equipment", "name": "МНЛЗ-Al", "description": "Машина непрерывного литья алюминия, 100×100 мм", "mass_kg": 8000.0, "power_kw": 100.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["SMS Group — aluminum casters", "Danieli — continuous casting"]}, {"id": "EQU-007", "category_id": "equipment", "name": "МНЛЗ-Fe", "description": "Машина непрерывного литья стали, 100×100 мм", "mass_kg": 10000.0, "power_kw": 150.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Danieli — steel continuous casters", "Primetals — billet casters"]}, {"id": "EQU-008", "category_id": "equipment", "name": "Прокатный стан", "description": "6-клетьевой, вход 100×100 → выход Ø20 мм", "mass_kg": 15000.0, "power_kw": 200.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["SMS Meer — rolling mills", "Siemens VAI — long products"]}, {"id": "EQU-009", "category_id": "equipment", "name": "WAAM-ячейка", "description": "3D-печать дуговой наплавкой проволоки", "mass_kg": 2000.0, "power_kw": 50.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Lincoln Electric — WAAM systems", "WAAM3D — wire arc additive manufacturing", "Cranfield University — WAAM research"]}, {"id": "EQU-010", "category_id": "equipment", "name": "CNC 5-осевой", "description": "Фрезерный станок, твердосплавные фрезы W-Co", "mass_kg": 3000.0, "power_kw": 30.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["DMG MORI — 5-axis machining centers", "Mazak — multi-axis CNC", "Haas — vertical mills"]}, {"id": "EQU-011", "category_id": "equipment", "name": "Мини масс-драйвер", "description": "МД для комплексов Карбон, 500м-1км", "mass_kg": 330000.0, "power_kw": 500.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["NASA Lunar Mass Driver concept", "EMF coilgun technology"]}, {"id": "EQU-012", "category_id": "equipment", "name": "Электроника сенсоров", "description": "Микроконтроллеры, датчики, камеры (пакет)", "mass_kg": 20.0, "power_kw": 0.0, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["NXP — automotive MCUs", "STMicroelectronics — sensor hubs"]}, {"id": "EQU-013", "category_id": "equipment", "name": "Фильера Pt", "description": "Фильера для стекловолокна, платина", "mass_kg": 0.5, "power_kw": 0.0, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Heraeus — Pt bushings", "Johnson Matthey — glass fiber dies"]}, {"id": "EQU-014", "category_id": "equipment", "name": "Анод иридиевый", "description": "Анод для MRE-ячеек, Ir", "mass_kg": 2.0, "power_kw": 0.0, "parent_id": null, "is_assembly": false, "production_planet_id": "earth", "sources": ["Heraeus — precious metal anodes", "Johnson Matthey — Ir electrodes"]}, {"id": "EQU-021", "category_id": "equipment", "name": "Виброгрохот", "description": "Грохочение реголита, разделение фракций", "mass_kg": 500.0, "power_kw": 10.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Metso Outotec — vibrating screens", "Sandvik — mining equipment"]}, {"id": "EQU-022", "category_id": "equipment", "name": "МГД-насос", "description": "Перекачка расплава через магнитное поле", "mass_kg": 200.0, "power_kw": 50.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["ABB — electromagnetic pumps for metals", "Precimeter — MHD pumps"]}, {"id": "EQU-023", "category_id": "equipment", "name": "Промковш (тандиш)", "description": "Разделение Al/Fe расплавов, 2 стопора", "mass_kg": 1000.0, "power_kw": 0.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["SMS Group — tundish technology", "Vesuvius — refractory systems"]}, {"id": "EQU-024", "category_id": "equipment", "name": "Индукционная печь", "description": "Нагрев Fe заготовок до 1100°C в N₂", "mass_kg": 3000.0, "power_kw": 100.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Inductotherm — induction heating", "ABP Induction — steel reheating"]}, {"id": "EQU-025", "category_id": "equipment", "name": "Волочильный стан", "description": "Фильеры W, выход Ø1.6-2.0 мм проволока", "mass_kg": 2000.0, "power_kw": 30.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Niehoff — wire drawing machines", "Samp — drawing equipment"]}, {"id": "EQU-026", "category_id": "equipment", "name": "Фольгопрокат", "description": "Прокат Al фольги 4-50 мкм для зеркал", "mass_kg": 5000.0, "power_kw": 50.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Achenbach — foil rolling mills", "Fata Hunter — aluminum rolling"]}, {"id": "EQU-027", "category_id": "equipment", "name": "Сборочный стапель", "description": "1 позиция сборки робота/оборудования", "mass_kg": 500.0, "power_kw": 5.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Comau — assembly systems", "KUKA — robotic assembly cells"]}, {"id": "EQU-028", "category_id": "equipment", "name": "Мостовой кран", "description": "Г/п 1 т, пролёт 10 м", "mass_kg": 2000.0, "power_kw": 20.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Konecranes — overhead cranes", "Demag — industrial cranes"]}, {"id": "EQU-029", "category_id": "equipment", "name": "AGV-тележка", "description": "Автоматическая логистическая тележка", "mass_kg": 200.0, "power_kw": 5.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["KUKA — mobile platforms", "MiR — autonomous mobile robots"]}, {"id": "EQU-030", "category_id": "equipment", "name": "ЛЭП криогенная", "description": "Сверхпроводящая линия, 1 км участок", "mass_kg": 1000.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["AMSC — superconducting cables", "Nexans — HTS power cables"]}, {"id": "EQU-031", "category_id": "equipment", "name": "Конденсатор калия", "description": "Фракционная конденсация K при 759°C", "mass_kg": 500.0, "power_kw": 10.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Fractional distillation of metals", "Vacuum metallurgy"]}, {"id": "EQU-032", "category_id": "equipment", "name": "Конденсатор натрия", "description": "Фракционная конденсация Na при 883°C", "mass_kg": 800.0, "power_kw": 15.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Sodium production by Downs process", "Vacuum distillation"]}, {"id": "EQU-033", "category_id": "equipment", "name": "Конденсатор магния", "description": "Фракционная конденсация Mg при 1091°C", "mass_kg": 1500.0, "power_kw": 25.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "mercury", "sources": ["Pidgeon process — magnesium distillation", "Vacuum metallurgy of Mg"]}, {"id": "FAC-001", "category_id": "facilities", "name": "Точка Ноль", "description": "Основной завод на северном полюсе Меркурия, 1500 м²", "mass_kg": null, "power_kw": 55000.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["SpaceX Starbase — automated factory concept", "Tesla Gigafactory — robotic manufacturing"]}, {"id": "FAC-002", "category_id": "facilities", "name": "Комплекс Карбон-Север", "description": "Мини-завод по добыче графита (LRM, полярный кратер)", "mass_kg": null, "power_kw": 5000.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["MESSENGER — Mercury LRM deposits data", "Apollo 17 — lunar graphite studies"]}, {"id": "FAC-003", "category_id": "facilities", "name": "Комплекс Карбон-Юг", "description": "Мини-завод по добыче графита (LRM, полярный кратер)", "mass_kg": null, "power_kw": 5000.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["MESSENGER — Mercury LRM deposits data", "Apollo 17 — lunar graphite studies"]}, {"id": "FAC-004", "category_id": "facilities", "name": "Гелио-башня", "description": "Концентратор солнечной энергии на вершине кратера, 10 МВт", "mass_kg": 50000.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Odeillo Solar Furnace (France) — 1 MW", "DLR Solar Tower Jülich — concentrated solar"]}, {"id": "HUB-001", "category_id": "facilities", "name": "Хаб приёма энергии", "description": "LSP станции на Луне + ректенны на Земле, 6400 км² фотовольтаики (40 станций), 10000 км² ректенн", "mass_kg": 177600000.0, "power_kw": null, "parent_id": null, "is_assembly": true, "production_planet_id": "moon", "sources": ["hub.qmd — архитектура LSP", "Lunar Solar Power (Criswell, 1980s)", "Space-Based Solar Power (NASA studies)"]}, {"id": "PRD-001", "category_id": "products", "name": "Зеркало 100×100м", "description": "Алюминиевое зеркало с электрохромикой TiO₂", "mass_kg": 116.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["IKAROS (JAXA 2010) — solar sail", "LightSail 2 (Planetary Society)", "NEA Scout — NASA solar sail"]}, {"id": "PRD-002", "category_id": "products", "name": "Робот Gen-2", "description": "Робот второго поколения (усреднённый)", "mass_kg": 960.0, "power_kw": 15.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Caterpillar autonomous mining", "Rio Tinto autonomous trucks"]}, {"id": "PRD-003", "category_id": "products", "name": "Купол завода", "description": "Силикатный купол 50×30м, 1500 м²", "mass_kg": 8000.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Bigelow Aerospace — inflatable modules", "NASA TransHab — expandable habitats"]}, {"id": "PRD-004", "category_id": "products", "name": "NaS батарея 20кВт·ч", "description": "Натрий-серная батарея для роботов", "mass_kg": 150.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["NGK Insulators — NaS grid storage", "GE Durathon — Na-based batteries"]}, {"id": "PRD-005", "category_id": "products", "name": "Si панель", "description": "Кремниевая солнечная панель, 1 м²", "mass_kg": 10.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["LONGi — monocrystalline Si", "First Solar — thin film", "SunPower — high efficiency"]}, {"id": "PRD-006", "category_id": "products", "name": "Силикатная ткань", "description": "Ткань SiO₂ для куполов, 1 м²", "mass_kg": 0.3, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["3M Nextel — ceramic fabric", "Saint-Gobain — silica cloth"]}, {"id": "ROB-011", "category_id": "robots", "name": "Паук-З (Spider-Z)", "description": "Разведчик, альпинист, 4 ноги, камеры", "mass_kg": 82.0, "power_kw": 3.0, "parent_id": null, "is_assembly": true, "production_planet_id": "earth", "sources": ["Boston Dynamics Spot — 4-leg robot", "NASA LEMUR — climbing robot"]}, {"id": "ROB-012", "category_id": "robots", "name": "Краб-З (Crab-Z)", "description": "Тяжёлый грузчик, 6 ног, 2 т груз", "mass_kg": 950.0, "power_kw": 25.0, "parent_id": null, "is_assembly": true, "production_planet_id": "earth", "sources": ["ANYbotics ANYmal — промышленный 4-leg", "Agility Robotics Digit — logistics robot"]}, {"id": "ROB-013", "category_id": "robots", "name": "Кентавр-З (Centaur-Z)", "description": "Техник-манипулятор, 4 ноги + 2 руки", "mass_kg": 150.0, "power_kw": 12.0, "parent_id": null, "is_assembly": true, "production_planet_id": "earth", "sources": ["NASA Robonaut — humanoid manipulator", "ABB YuMi — collaborative robot"]}, {"id": "ROB-014", "category_id": "robots", "name": "Крот-З (Mole-Z)", "description": "Экскаватор, гусеницы, ковш", "mass_kg": 800.0, "power_kw": 30.0, "parent_id": null, "is_assembly": true, "production_planet_id": "earth", "sources": ["Caterpillar 320F — compact excavator", "Komatsu PC200 — hydraulic excavator"]}, {"id": "ROB-015", "category_id": "robots", "name": "Манипулятор Ф-А1", "description": "Стационарный манипулятор первого завода", "mass_kg": 250.0, "power_kw": 8.0, "parent_id": "FAC-001", "is_assembly": true, "production_planet_id": "earth", "sources": ["FANUC M-2000iA — heavy payload robot", "KUKA KR 1000 titan — industrial manipulator"]}, {"id": "ROB-021", "category_id": "robots", "name": "Краб-М (Crab-M)", "description": "Логист Gen-2, 6 колёс, 5 т груз, NaS батарея", "mass_kg": 1000.0, "power_kw": 30.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Caterpillar Command — autonomous mining", "Rio Tinto autonomous trucks"]}, {"id": "ROB-022", "category_id": "robots", "name": "Кентавр-М (Centaur-M)", "description": "Сборщик Gen-2, 4 колеса + 2 руки, лёгкий", "mass_kg": 380.0, "power_kw": 12.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["NASA Mars rovers — autonomous operation", "Boston Dynamics Stretch — warehouse robot"]}, {"id": "ROB-023", "category_id": "robots", "name": "Крот-М (Mole-M)", "description": "Добытчик Gen-2, 6 колёс, 600 т/день", "mass_kg": 1500.0, "power_kw": 40.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["Komatsu autonomous haul trucks", "Sandvik AutoMine — underground mining"]}, {"id": "TRN-001", "category_id": "transport", "name": "Контейнер графита", "description": "Баллистический контейнер 100 кг", "mass_kg": 20.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["SpaceX Dragon cargo — reentry containers"]}, {"id": "TRN-002", "category_id": "transport", "name": "Капсула зеркала", "description": "Защитная капсула для запуска зеркала", "mass_kg": 10.0, "power_kw": 0.0, "parent_id": null, "is_assembly": true, "production_planet_id": "mercury", "sources": ["NASA — deployable structures", "JAXA IKAROS — sail deployment"]}],
+  planetMaterials: [{"planet_id": "earth", "material_id": "MAT-CFRP", "concentration_pct": null, "notes": "импорт, углепластик"}, {"planet_id": "earth", "material_id": "MAT-CU", "concentration_pct": null, "notes": "моторы Gen-1 (земное производство)"}, {"planet_id": "earth", "material_id": "MAT-GAAS", "concentration_pct": null, "notes": "импорт, фотоячейки"}, {"planet_id": "earth", "material_id": "MAT-IR", "concentration_pct": null, "notes": "импорт, аноды MRE"}, {"planet_id": "earth", "material_id": "MAT-KEVLAR", "concentration_pct": null, "notes": "импорт, армирование"}, {"planet_id": "earth", "material_id": "MAT-LI", "concentration_pct": null, "notes": "импорт, Li-ion батареи Gen-1"}, {"planet_id": "earth", "material_id": "MAT-MOS2", "concentration_pct": null, "notes": "импорт, смазка для вакуума"}, {"planet_id": "mars", "material_id": "MAT-FE", "concentration_pct": 14.0, "notes": "в оксидах (красный цвет)"}, {"planet_id": "mars", "material_id": "MAT-MG", "concentration_pct": 3.0, "notes": null}, {"planet_id": "mars", "material_id": "MAT-O2", "concentration_pct": 45.0, "notes": null}, {"planet_id": "mars", "material_id": "MAT-SI", "concentration_pct": 21.0, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-AL", "concentration_pct": 7.0, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-AL2O3", "concentration_pct": null, "notes": "производится из Al+O₂ (керамика, подшипники)"}, {"planet_id": "mercury", "material_id": "MAT-C", "concentration_pct": 2.0, "notes": "только LRM-зоны (полярные кратеры)"}, {"planet_id": "mercury", "material_id": "MAT-FE", "concentration_pct": 1.7, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-FE-MN", "concentration_pct": null, "notes": "производится (сплав Fe + Mn)"}, {"planet_id": "mercury", "material_id": "MAT-K", "concentration_pct": 0.5, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-MG", "concentration_pct": 8.0, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-MGO", "concentration_pct": null, "notes": "производится из Mg+O₂"}, {"planet_id": "mercury", "material_id": "MAT-MN", "concentration_pct": 0.1, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-NA", "concentration_pct": 3.3, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-NAK", "concentration_pct": null, "notes": "производится из Na+K"}, {"planet_id": "mercury", "material_id": "MAT-O2", "concentration_pct": 42.0, "notes": "главный продукт MRE"}, {"planet_id": "mercury", "material_id": "MAT-S", "concentration_pct": 3.0, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-SI", "concentration_pct": 4.2, "notes": null}, {"planet_id": "mercury", "material_id": "MAT-SI3N4", "concentration_pct": null, "notes": "производится из Si + N₂ (фрезы CNC)"}, {"planet_id": "mercury", "material_id": "MAT-TI", "concentration_pct": 0.5, "notes": "из ильменита TiO₂"}, {"planet_id": "mercury", "material_id": "MAT-TIO2", "concentration_pct": null, "notes": "производится из Ti+O₂"}, {"planet_id": "moon", "material_id": "MAT-AL", "concentration_pct": 10.0, "notes": "в анортозите"}, {"planet_id": "moon", "material_id": "MAT-FE", "concentration_pct": 8.0, "notes": "в базальтах"}, {"planet_id": "moon", "material_id": "MAT-MG", "concentration_pct": 5.0, "notes": null}, {"planet_id": "moon", "material_id": "MAT-O2", "concentration_pct": 45.0, "notes": null}, {"planet_id": "moon", "material_id": "MAT-SI", "concentration_pct": 21.0, "notes": null}, {"planet_id": "moon", "material_id": "MAT-TI", "concentration_pct": 1.5, "notes": "в ильмените"}],
+  unitMaterials: [{"unit_id": "CMP-004", "material_id": "MAT-CU", "fraction_pct": 60.0}, {"unit_id": "CMP-004", "material_id": "MAT-FE", "fraction_pct": 35.0}, {"unit_id": "CMP-004", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "CMP-005", "material_id": "MAT-AL", "fraction_pct": 40.0}, {"unit_id": "CMP-005", "material_id": "MAT-C", "fraction_pct": 20.0}, {"unit_id": "CMP-005", "material_id": "MAT-CU", "fraction_pct": 10.0}, {"unit_id": "CMP-005", "material_id": "MAT-LI", "fraction_pct": 25.0}, {"unit_id": "CMP-005", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "CMP-009", "material_id": "MAT-AL", "fraction_pct": 60.0}, {"unit_id": "CMP-009", "material_id": "MAT-GAAS", "fraction_pct": 30.0}, {"unit_id": "CMP-009", "material_id": "MAT-SI", "fraction_pct": 10.0}, {"unit_id": "CMP-011", "material_id": "MAT-AL", "fraction_pct": 55.0}, {"unit_id": "CMP-011", "material_id": "MAT-FE", "fraction_pct": 40.0}, {"unit_id": "CMP-011", "material_id": "MAT-MOS2", "fraction_pct": 2.0}, {"unit_id": "CMP-011", "material_id": "MAT-SI", "fraction_pct": 3.0}, {"unit_id": "CMP-012", "material_id": "MAT-AL", "fraction_pct": 5.0}, {"unit_id": "CMP-012", "material_id": "MAT-AL2O3", "fraction_pct": 35.0}, {"unit_id": "CMP-012", "material_id": "MAT-FE", "fraction_pct": 5.0}, {"unit_id": "CMP-012", "material_id": "MAT-NA", "fraction_pct": 30.0}, {"unit_id": "CMP-012", "material_id": "MAT-S", "fraction_pct": 25.0}, {"unit_id": "CMP-013", "material_id": "MAT-AL2O3", "fraction_pct": 95.0}, {"unit_id": "CMP-013", "material_id": "MAT-FE", "fraction_pct": 5.0}, {"unit_id": "CMP-014", "material_id": "MAT-AL", "fraction_pct": 15.0}, {"unit_id": "CMP-014", "material_id": "MAT-FE", "fraction_pct": 80.0}, {"unit_id": "CMP-014", "material_id": "MAT-MOS2", "fraction_pct": 5.0}, {"unit_id": "EQU-001", "material_id": "MAT-AL", "fraction_pct": 38.0}, {"unit_id": "EQU-001", "material_id": "MAT-FE", "fraction_pct": 62.0}, {"unit_id": "EQU-002", "material_id": "MAT-AL", "fraction_pct": 25.0}, {"unit_id": "EQU-002", "material_id": "MAT-AL2O3", "fraction_pct": 10.0}, {"unit_id": "EQU-002", "material_id": "MAT-FE", "fraction_pct": 60.0}, {"unit_id": "EQU-002", "material_id": "MAT-IR", "fraction_pct": 0.1}, {"unit_id": "EQU-002", "material_id": "MAT-SI", "fraction_pct": 4.9}, {"unit_id": "EQU-003", "material_id": "MAT-AL", "fraction_pct": 70.0}, {"unit_id": "EQU-003", "material_id": "MAT-FE-MN", "fraction_pct": 15.0}, {"unit_id": "EQU-003", "material_id": "MAT-MGO", "fraction_pct": 10.0}, {"unit_id": "EQU-003", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-004", "material_id": "MAT-AL", "fraction_pct": 5.0}, {"unit_id": "EQU-004", "material_id": "MAT-FE-MN", "fraction_pct": 90.0}, {"unit_id": "EQU-004", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-005", "material_id": "MAT-AL", "fraction_pct": 30.0}, {"unit_id": "EQU-005", "material_id": "MAT-AL2O3", "fraction_pct": 5.0}, {"unit_id": "EQU-005", "material_id": "MAT-FE", "fraction_pct": 60.0}, {"unit_id": "EQU-005", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-006", "material_id": "MAT-AL", "fraction_pct": 5.0}, {"unit_id": "EQU-006", "material_id": "MAT-FE-MN", "fraction_pct": 80.0}, {"unit_id": "EQU-006", "material_id": "MAT-MGO", "fraction_pct": 10.0}, {"unit_id": "EQU-006", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-007", "material_id": "MAT-AL", "fraction_pct": 3.0}, {"unit_id": "EQU-007", "material_id": "MAT-FE", "fraction_pct": 80.0}, {"unit_id": "EQU-007", "material_id": "MAT-MGO", "fraction_pct": 12.0}, {"unit_id": "EQU-007", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-008", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-008", "material_id": "MAT-FE-MN", "fraction_pct": 85.0}, {"unit_id": "EQU-008", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-009", "material_id": "MAT-AL", "fraction_pct": 25.0}, {"unit_id": "EQU-009", "material_id": "MAT-FE", "fraction_pct": 70.0}, {"unit_id": "EQU-009", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-010", "material_id": "MAT-AL", "fraction_pct": 15.0}, {"unit_id": "EQU-010", "material_id": "MAT-FE", "fraction_pct": 80.0}, {"unit_id": "EQU-010", "material_id": "MAT-SI", "fraction_pct": 4.85}, {"unit_id": "EQU-010", "material_id": "MAT-SI3N4", "fraction_pct": 0.15}, {"unit_id": "EQU-011", "material_id": "MAT-AL", "fraction_pct": 30.0}, {"unit_id": "EQU-011", "material_id": "MAT-FE", "fraction_pct": 65.0}, {"unit_id": "EQU-011", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-021", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-021", "material_id": "MAT-FE", "fraction_pct": 85.0}, {"unit_id": "EQU-021", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-022", "material_id": "MAT-AL", "fraction_pct": 40.0}, {"unit_id": "EQU-022", "material_id": "MAT-FE", "fraction_pct": 50.0}, {"unit_id": "EQU-022", "material_id": "MAT-SI", "fraction_pct": 10.0}, {"unit_id": "EQU-023", "material_id": "MAT-AL2O3", "fraction_pct": 10.0}, {"unit_id": "EQU-023", "material_id": "MAT-FE-MN", "fraction_pct": 70.0}, {"unit_id": "EQU-023", "material_id": "MAT-MGO", "fraction_pct": 15.0}, {"unit_id": "EQU-023", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-024", "material_id": "MAT-AL", "fraction_pct": 30.0}, {"unit_id": "EQU-024", "material_id": "MAT-AL2O3", "fraction_pct": 5.0}, {"unit_id": "EQU-024", "material_id": "MAT-FE", "fraction_pct": 60.0}, {"unit_id": "EQU-024", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-025", "material_id": "MAT-AL", "fraction_pct": 15.0}, {"unit_id": "EQU-025", "material_id": "MAT-FE", "fraction_pct": 80.0}, {"unit_id": "EQU-025", "material_id": "MAT-SI", "fraction_pct": 4.75}, {"unit_id": "EQU-025", "material_id": "MAT-SI3N4", "fraction_pct": 0.25}, {"unit_id": "EQU-026", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-026", "material_id": "MAT-FE", "fraction_pct": 85.0}, {"unit_id": "EQU-026", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-027", "material_id": "MAT-AL", "fraction_pct": 25.0}, {"unit_id": "EQU-027", "material_id": "MAT-FE", "fraction_pct": 70.0}, {"unit_id": "EQU-027", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-028", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-028", "material_id": "MAT-FE", "fraction_pct": 85.0}, {"unit_id": "EQU-028", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-029", "material_id": "MAT-AL", "fraction_pct": 30.0}, {"unit_id": "EQU-029", "material_id": "MAT-FE", "fraction_pct": 50.0}, {"unit_id": "EQU-029", "material_id": "MAT-NA", "fraction_pct": 5.0}, {"unit_id": "EQU-029", "material_id": "MAT-S", "fraction_pct": 5.0}, {"unit_id": "EQU-029", "material_id": "MAT-SI", "fraction_pct": 10.0}, {"unit_id": "EQU-030", "material_id": "MAT-AL", "fraction_pct": 70.0}, {"unit_id": "EQU-030", "material_id": "MAT-FE", "fraction_pct": 20.0}, {"unit_id": "EQU-030", "material_id": "MAT-SI", "fraction_pct": 10.0}, {"unit_id": "EQU-031", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-031", "material_id": "MAT-FE-MN", "fraction_pct": 60.0}, {"unit_id": "EQU-031", "material_id": "MAT-MGO", "fraction_pct": 25.0}, {"unit_id": "EQU-031", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-032", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-032", "material_id": "MAT-FE-MN", "fraction_pct": 60.0}, {"unit_id": "EQU-032", "material_id": "MAT-MGO", "fraction_pct": 25.0}, {"unit_id": "EQU-032", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "EQU-033", "material_id": "MAT-AL", "fraction_pct": 10.0}, {"unit_id": "EQU-033", "material_id": "MAT-FE-MN", "fraction_pct": 55.0}, {"unit_id": "EQU-033", "material_id": "MAT-MGO", "fraction_pct": 30.0}, {"unit_id": "EQU-033", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "HUB-001", "material_id": "MAT-AL", "fraction_pct": 88.0}, {"unit_id": "HUB-001", "material_id": "MAT-FE-MN", "fraction_pct": 3.0}, {"unit_id": "HUB-001", "material_id": "MAT-SI", "fraction_pct": 9.0}, {"unit_id": "PRD-001", "material_id": "MAT-AL", "fraction_pct": 94.8}, {"unit_id": "PRD-001", "material_id": "MAT-FE", "fraction_pct": 4.3}, {"unit_id": "PRD-001", "material_id": "MAT-TIO2", "fraction_pct": 0.86}, {"unit_id": "PRD-002", "material_id": "MAT-AL", "fraction_pct": 17.2}, {"unit_id": "PRD-002", "material_id": "MAT-FE", "fraction_pct": 46.9}, {"unit_id": "PRD-002", "material_id": "MAT-MOS2", "fraction_pct": 1.5}, {"unit_id": "PRD-002", "material_id": "MAT-NA", "fraction_pct": 15.6}, {"unit_id": "PRD-002", "material_id": "MAT-S", "fraction_pct": 15.6}, {"unit_id": "PRD-002", "material_id": "MAT-SI", "fraction_pct": 3.2}, {"unit_id": "PRD-003", "material_id": "MAT-AL", "fraction_pct": 6.25}, {"unit_id": "PRD-003", "material_id": "MAT-SI", "fraction_pct": 93.75}, {"unit_id": "PRD-004", "material_id": "MAT-AL", "fraction_pct": 5.0}, {"unit_id": "PRD-004", "material_id": "MAT-AL2O3", "fraction_pct": 35.0}, {"unit_id": "PRD-004", "material_id": "MAT-FE", "fraction_pct": 5.0}, {"unit_id": "PRD-004", "material_id": "MAT-NA", "fraction_pct": 30.0}, {"unit_id": "PRD-004", "material_id": "MAT-S", "fraction_pct": 25.0}, {"unit_id": "PRD-005", "material_id": "MAT-AL", "fraction_pct": 50.0}, {"unit_id": "PRD-005", "material_id": "MAT-SI", "fraction_pct": 50.0}, {"unit_id": "PRD-006", "material_id": "MAT-AL", "fraction_pct": 5.0}, {"unit_id": "PRD-006", "material_id": "MAT-SI", "fraction_pct": 95.0}, {"unit_id": "ROB-011", "material_id": "MAT-AL2O3", "fraction_pct": 24.0}, {"unit_id": "ROB-011", "material_id": "MAT-CU", "fraction_pct": 18.0}, {"unit_id": "ROB-011", "material_id": "MAT-LI", "fraction_pct": 6.0}, {"unit_id": "ROB-011", "material_id": "MAT-SI", "fraction_pct": 3.0}, {"unit_id": "ROB-011", "material_id": "MAT-TI", "fraction_pct": 49.0}, {"unit_id": "ROB-012", "material_id": "MAT-AL", "fraction_pct": 63.0}, {"unit_id": "ROB-012", "material_id": "MAT-CU", "fraction_pct": 8.0}, {"unit_id": "ROB-012", "material_id": "MAT-FE-MN", "fraction_pct": 21.0}, {"unit_id": "ROB-012", "material_id": "MAT-LI", "fraction_pct": 4.0}, {"unit_id": "ROB-012", "material_id": "MAT-SI", "fraction_pct": 4.0}, {"unit_id": "ROB-013", "material_id": "MAT-CFRP", "fraction_pct": 40.0}, {"unit_id": "ROB-013", "material_id": "MAT-CU", "fraction_pct": 33.0}, {"unit_id": "ROB-013", "material_id": "MAT-LI", "fraction_pct": 20.0}, {"unit_id": "ROB-013", "material_id": "MAT-SI", "fraction_pct": 7.0}, {"unit_id": "ROB-014", "material_id": "MAT-CU", "fraction_pct": 12.0}, {"unit_id": "ROB-014", "material_id": "MAT-FE-MN", "fraction_pct": 30.0}, {"unit_id": "ROB-014", "material_id": "MAT-LI", "fraction_pct": 13.0}, {"unit_id": "ROB-014", "material_id": "MAT-SI", "fraction_pct": 5.0}, {"unit_id": "ROB-014", "material_id": "MAT-TI", "fraction_pct": 40.0}, {"unit_id": "ROB-015", "material_id": "MAT-AL", "fraction_pct": 40.0}, {"unit_id": "ROB-015", "material_id": "MAT-CU", "fraction_pct": 40.0}, {"unit_id": "ROB-015", "material_id": "MAT-SI", "fraction_pct": 20.0}, {"unit_id": "ROB-021", "material_id": "MAT-AL", "fraction_pct": 60.0}, {"unit_id": "ROB-021", "material_id": "MAT-FE", "fraction_pct": 35.0}, {"unit_id": "ROB-021", "material_id": "MAT-NA", "fraction_pct": 1.0}, {"unit_id": "ROB-021", "material_id": "MAT-S", "fraction_pct": 1.0}, {"unit_id": "ROB-021", "material_id": "MAT-SI", "fraction_pct": 3.0}, {"unit_id": "ROB-022", "material_id": "MAT-AL", "fraction_pct": 68.0}, {"unit_id": "ROB-022", "material_id": "MAT-FE", "fraction_pct": 26.0}, {"unit_id": "ROB-022", "material_id": "MAT-NA", "fraction_pct": 1.0}, {"unit_id": "ROB-022", "material_id": "MAT-S", "fraction_pct": 1.0}, {"unit_id": "ROB-022", "material_id": "MAT-SI", "fraction_pct": 4.0}, {"unit_id": "ROB-023", "material_id": "MAT-AL", "fraction_pct": 14.0}, {"unit_id": "ROB-023", "material_id": "MAT-FE", "fraction_pct": 84.0}, {"unit_id": "ROB-023", "material_id": "MAT-SI", "fraction_pct": 2.0}, {"unit_id": "TRN-001", "material_id": "MAT-AL", "fraction_pct": 90.0}, {"unit_id": "TRN-001", "material_id": "MAT-FE", "fraction_pct": 10.0}, {"unit_id": "TRN-002", "material_id": "MAT-AL", "fraction_pct": 95.0}, {"unit_id": "TRN-002", "material_id": "MAT-FE", "fraction_pct": 5.0}],
+  unitComponents: [{"assembly_id": "EQU-001", "component_id": "CMP-001", "quantity": 50}, {"assembly_id": "EQU-002", "component_id": "EQU-014", "quantity": 4}, {"assembly_id": "EQU-005", "component_id": "CMP-011", "quantity": 2}, {"assembly_id": "EQU-005", "component_id": "CMP-013", "quantity": 4}, {"assembly_id": "EQU-005", "component_id": "CMP-014", "quantity": 1}, {"assembly_id": "EQU-006", "component_id": "CMP-008", "quantity": 1}, {"assembly_id": "EQU-007", "component_id": "CMP-008", "quantity": 1}, {"assembly_id": "EQU-010", "component_id": "CMP-007", "quantity": 20}, {"assembly_id": "EQU-025", "component_id": "CMP-006", "quantity": 10}, {"assembly_id": "FAC-001", "component_id": "EQU-001", "quantity": 1}, {"assembly_id": "FAC-001", "component_id": "EQU-002", "quantity": 20}, {"assembly_id": "FAC-001", "component_id": "EQU-003", "quantity": 5}, {"assembly_id": "FAC-001", "component_id": "EQU-004", "quantity": 3}, {"assembly_id": "FAC-001", "component_id": "EQU-005", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-006", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-007", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-008", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-009", "quantity": 5}, {"assembly_id": "FAC-001", "component_id": "EQU-010", "quantity": 3}, {"assembly_id": "FAC-001", "component_id": "EQU-021", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-022", "quantity": 5}, {"assembly_id": "FAC-001", "component_id": "EQU-023", "quantity": 3}, {"assembly_id": "FAC-001", "component_id": "EQU-024", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-025", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-026", "quantity": 1}, {"assembly_id": "FAC-001", "component_id": "EQU-027", "quantity": 10}, {"assembly_id": "FAC-001", "component_id": "EQU-028", "quantity": 2}, {"assembly_id": "FAC-001", "component_id": "EQU-029", "quantity": 10}, {"assembly_id": "FAC-002", "component_id": "EQU-004", "quantity": 1}, {"assembly_id": "FAC-002", "component_id": "EQU-011", "quantity": 1}, {"assembly_id": "FAC-002", "component_id": "EQU-021", "quantity": 1}, {"assembly_id": "FAC-003", "component_id": "EQU-004", "quantity": 1}, {"assembly_id": "FAC-003", "component_id": "EQU-011", "quantity": 1}, {"assembly_id": "FAC-003", "component_id": "EQU-021", "quantity": 1}, {"assembly_id": "FAC-004", "component_id": "PRD-005", "quantity": 3500}, {"assembly_id": "PRD-001", "component_id": "CMP-010", "quantity": 1}, {"assembly_id": "PRD-002", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "PRD-002", "component_id": "CMP-011", "quantity": 12}, {"assembly_id": "PRD-002", "component_id": "CMP-012", "quantity": 8}, {"assembly_id": "ROB-011", "component_id": "CMP-001", "quantity": 1}, {"assembly_id": "ROB-011", "component_id": "CMP-002", "quantity": 2}, {"assembly_id": "ROB-011", "component_id": "CMP-004", "quantity": 3}, {"assembly_id": "ROB-011", "component_id": "CMP-005", "quantity": 1}, {"assembly_id": "ROB-012", "component_id": "CMP-001", "quantity": 6}, {"assembly_id": "ROB-012", "component_id": "CMP-002", "quantity": 4}, {"assembly_id": "ROB-012", "component_id": "CMP-003", "quantity": 2}, {"assembly_id": "ROB-012", "component_id": "CMP-004", "quantity": 16}, {"assembly_id": "ROB-012", "component_id": "CMP-005", "quantity": 4}, {"assembly_id": "ROB-013", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "ROB-013", "component_id": "CMP-002", "quantity": 4}, {"assembly_id": "ROB-013", "component_id": "CMP-004", "quantity": 10}, {"assembly_id": "ROB-013", "component_id": "CMP-005", "quantity": 3}, {"assembly_id": "ROB-014", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "ROB-014", "component_id": "CMP-002", "quantity": 2}, {"assembly_id": "ROB-014", "component_id": "CMP-003", "quantity": 1}, {"assembly_id": "ROB-014", "component_id": "CMP-004", "quantity": 19}, {"assembly_id": "ROB-014", "component_id": "CMP-005", "quantity": 10}, {"assembly_id": "ROB-021", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "ROB-021", "component_id": "CMP-002", "quantity": 4}, {"assembly_id": "ROB-021", "component_id": "CMP-011", "quantity": 18}, {"assembly_id": "ROB-021", "component_id": "CMP-012", "quantity": 20}, {"assembly_id": "ROB-021", "component_id": "CMP-013", "quantity": 36}, {"assembly_id": "ROB-021", "component_id": "CMP-014", "quantity": 6}, {"assembly_id": "ROB-022", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "ROB-022", "component_id": "CMP-002", "quantity": 4}, {"assembly_id": "ROB-022", "component_id": "CMP-011", "quantity": 14}, {"assembly_id": "ROB-022", "component_id": "CMP-012", "quantity": 5}, {"assembly_id": "ROB-022", "component_id": "CMP-013", "quantity": 28}, {"assembly_id": "ROB-022", "component_id": "CMP-014", "quantity": 6}, {"assembly_id": "ROB-023", "component_id": "CMP-001", "quantity": 2}, {"assembly_id": "ROB-023", "component_id": "CMP-002", "quantity": 2}, {"assembly_id": "ROB-023", "component_id": "CMP-011", "quantity": 8}, {"assembly_id": "ROB-023", "component_id": "CMP-012", "quantity": 0}, {"assembly_id": "ROB-023", "component_id": "CMP-013", "quantity": 24}, {"assembly_id": "ROB-023", "component_id": "CMP-014", "quantity": 4}]
 };
@@ -1,5 +1,5 @@
 #!/bin/bash
-# Post-render script: copies data directories to subdirectories in _output
+# Post-render script: links (or copies) data directories to subdirectories in _output
 # Fixes OJS FileAttachment paths which are relative to the rendered document
 
 set -e
@@ -50,10 +50,17 @@ for target in "${TARGETS[@]}"; do
     # Remove existing data symlink/directory if it exists
     rm -rf "$target/data" 2>/dev/null || true
 
-    # Copy data directory
+    # Hard-link the data directory: every target shares one copy of the files
+    # (including the content-addressed widget shards in db/shards/) on disk.
+    # Fall back to a plain copy where hard links are unavailable (e.g. another filesystem)
     if [[ -d "$DATA_SRC" ]]; then
-      cp -r "$DATA_SRC" "$target/data"
-      echo "  Copied $DATA_SRC -> $target/data"
+      if cp -rl "$DATA_SRC" "$target/data" 2>/dev/null; then
+        echo "  Linked $DATA_SRC -> $target/data"
+      else
+        rm -rf "$target/data"
+        cp -r "$DATA_SRC" "$target/data"
+        echo "  Copied $DATA_SRC -> $target/data"
+      fi
     fi
   fi
 done
@@ -73,6 +73,10 @@ SUBDIR_DATA=(
   "_output/en/science/summaries/data/db/data.json"
   "_output/ru/science/detailed/data/db/data.json"
   "_output/en/science/detailed/data/db/data.json"
+  "_output/ru/science/summaries/data/db/shards/index.json"
+  "_output/en/science/summaries/data/db/shards/index.json"
+  "_output/ru/science/detailed/data/db/shards/index.json"
+  "_output/en/science/detailed/data/db/shards/index.json"
 )
 
 echo ""